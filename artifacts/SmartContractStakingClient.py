@@ -48,6 +48,11 @@ _APP_SPEC_JSON = r"""{
                 "no_op": "CALL"
             }
         },
+        "withdraw_max()uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
         "transfer(address)void": {
             "call_config": {
                 "no_op": "CALL"
@@ -57,16 +62,22 @@ _APP_SPEC_JSON = r"""{
             "call_config": {
                 "delete_application": "CALL"
             }
+        },
+        "status()(address,address,uint64,uint64,uint64,uint64,uint64,uint64)": {
+            "read_only": true,
+            "call_config": {
+                "no_op": "CALL"
+            }
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMwogICAgbWV0aG9kICJzZXR1cChhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgImNvbmZpZ3VyZSh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZmlsbCh1aW50NjQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgInBhcnRpY2lwYXRlKGJ5dGVbXSxieXRlW10sdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVtdKXZvaWQiCiAgICBtZXRob2QgIndpdGhkcmF3KHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgInRyYW5zZmVyKGFkZHJlc3Mpdm9pZCIKICAgIG1ldGhvZCAiY2xvc2UoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX3NldHVwX3JvdXRlQDQgbWFpbl9jb25maWd1cmVfcm91dGVANSBtYWluX2ZpbGxfcm91dGVANiBtYWluX3BhcnRpY2lwYXRlX3JvdXRlQDcgbWFpbl93aXRoZHJhd19yb3V0ZUA4IG1haW5fdHJhbnNmZXJfcm91dGVAOSBtYWluX2Nsb3NlX3JvdXRlQDEwCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX3NldHVwX3JvdXRlQDQ6CiAgICAvLyBjb250cmFjdC5weTozMi00MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY29uc3RydWN0b3IKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIG93bmVyLCB3aG8gaXMgdGhlIGJlbmVmaWNpYXJ5CiAgICAvLyAjIC0gZnVuZGVyLCB3aG8gaXMgdGhpcwogICAgLy8gIyAtIHRvdGFsLCB0b3RhbCBhbW91bnQgd2l0aG91dCBsb2NrdXAKICAgIC8vICMgcHVycG9zZTogY3JlYXRlIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogc2V0IG93bmVyIGFuZCBmdW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIFNtYXJ0Q29udHJhY3RTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBjb250cmFjdC5weTozMi00MgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY29uc3RydWN0b3IKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIG93bmVyLCB3aG8gaXMgdGhlIGJlbmVmaWNpYXJ5CiAgICAvLyAjIC0gZnVuZGVyLCB3aG8gaXMgdGhpcwogICAgLy8gIyAtIHRvdGFsLCB0b3RhbCBhbW91bnQgd2l0aG91dCBsb2NrdXAKICAgIC8vICMgcHVycG9zZTogY3JlYXRlIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogc2V0IG93bmVyIGFuZCBmdW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBzZXR1cAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jb25maWd1cmVfcm91dGVANToKICAgIC8vIGNvbnRyYWN0LnB5OjQ4LTU4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjb25maWd1cmUKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHBlcmlvZCwgbG9ja3VwIHBlcmlvZAogICAgLy8gIyBwdXJwb3NlOiBzZXQgbG9ja3VwIHBlcmlvZAogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIGZ1bmRlciBhbmQgb3duZXIgaW5pdGlhbGl6ZWQKICAgIC8vICMgLSBwZXJpb2QgMAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IHNldCBvd25lciBhbmQgZnVuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIGNvbnRyYWN0LnB5OjE4CiAgICAvLyBjbGFzcyBTbWFydENvbnRyYWN0U3Rha2luZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gY29udHJhY3QucHk6NDgtNTgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNvbmZpZ3VyZQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gcGVyaW9kLCBsb2NrdXAgcGVyaW9kCiAgICAvLyAjIHB1cnBvc2U6IHNldCBsb2NrdXAgcGVyaW9kCiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gZnVuZGVyIGFuZCBvd25lciBpbml0aWFsaXplZAogICAgLy8gIyAtIHBlcmlvZCAwCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogc2V0IG93bmVyIGFuZCBmdW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBjb25maWd1cmUKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZmlsbF9yb3V0ZUA2OgogICAgLy8gY29udHJhY3QucHk6NjUtNzkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGZpbGwKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHRvdGFsLCBob3cgbXVjaCB0byBmaWxsCiAgICAvLyAjIHB1cnBvc2U6IGZ1bmQgaXQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBwZXJpb2QgbXVzdCBiZSBzZXQKICAgIC8vICMgLSBmdW5kaW5nIGFuZCB0b3RhbCBtdXN0IGJlIHVuaW5pdGlhbGl6ZWQKICAgIC8vICMgLSBtdXN0IGJlIGNvbWJpbmVkIHdpdGggcHlhbWVudCB0cmFuc2FjdGlvbgogICAgLy8gIyAgIGZvciB0b3RhbCBhbW91bnQKICAgIC8vICMgLSBtdXN0IGJlIG9ubHkgY2FsbGFibGUgYnkgZnVuZGVyCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0b3RhbCBhbmQgZnVuZGluZyBhcmUgc2V0IHRvIGFyZ3VtZW50cwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIGNvbnRyYWN0LnB5OjY1LTc5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBmaWxsCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSB0b3RhbCwgaG93IG11Y2ggdG8gZmlsbAogICAgLy8gIyBwdXJwb3NlOiBmdW5kIGl0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gcGVyaW9kIG11c3QgYmUgc2V0CiAgICAvLyAjIC0gZnVuZGluZyBhbmQgdG90YWwgbXVzdCBiZSB1bmluaXRpYWxpemVkCiAgICAvLyAjIC0gbXVzdCBiZSBjb21iaW5lZCB3aXRoIHB5YW1lbnQgdHJhbnNhY3Rpb24KICAgIC8vICMgICBmb3IgdG90YWwgYW1vdW50CiAgICAvLyAjIC0gbXVzdCBiZSBvbmx5IGNhbGxhYmxlIGJ5IGZ1bmRlcgogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdG90YWwgYW5kIGZ1bmRpbmcgYXJlIHNldCB0byBhcmd1bWVudHMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBmaWxsCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3BhcnRpY2lwYXRlX3JvdXRlQDc6CiAgICAvLyBjb250cmFjdC5weTo4Ny0xMDYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHBhcnRpY2lwYXRlCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBrZXkgcmVnaXN0cmF0aW9uIHBhcmFtcwogICAgLy8gIyBwdXJwb3NlOiBhbGxvdyBjb250cmFjdCB0byBwYXJ0aWNwYXRlIGluCiAgICAvLyAjICAgICAgICAgIGNvbnNlbnN1cwogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG11c3QgYmUgY2FsbGFibGUgYnkgb3duZXIgb25seQogICAgLy8gIyAtIG11c3QgYmUgY29tYmluZWQgd2l0aCB0cmFuc2FjdGlvbiB0cmFuc2ZlcmluZwogICAgLy8gIyAgIG9uZSBmZWUgaW50byB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gY29udHJhY3QgZ2VuZXJhdGVzIGl0bnggZm9yIGtleXJlZwogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBmZWUgcGF5bWVudCBpcyB0byBwcmV2ZW50IHBvdGVudGlhbCBkcmFpbmluZwogICAgLy8gIyAgIGludG8gZmVlcywgZXZlbiB0aG91Z2ggaXQgaXMgbm90IGxpa2VseSB0aGF0CiAgICAvLyAjICAgYSB1c2VyIG1heSBhdHRlbXB0IHRvIGRyYWluIHRoZWlyIGZ1bmRzCiAgICAvLyAjIC0gTUFCIGlzIG5vdCByZWxldmFudCBkdWUgdG8gdGhlIGZlZSBwYXltZW50CiAgICAvLyAjICAgYWRkZWQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIFNtYXJ0Q29udHJhY3RTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBjb250cmFjdC5weTo4Ny0xMDYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHBhcnRpY2lwYXRlCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBrZXkgcmVnaXN0cmF0aW9uIHBhcmFtcwogICAgLy8gIyBwdXJwb3NlOiBhbGxvdyBjb250cmFjdCB0byBwYXJ0aWNwYXRlIGluCiAgICAvLyAjICAgICAgICAgIGNvbnNlbnN1cwogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG11c3QgYmUgY2FsbGFibGUgYnkgb3duZXIgb25seQogICAgLy8gIyAtIG11c3QgYmUgY29tYmluZWQgd2l0aCB0cmFuc2FjdGlvbiB0cmFuc2ZlcmluZwogICAgLy8gIyAgIG9uZSBmZWUgaW50byB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gY29udHJhY3QgZ2VuZXJhdGVzIGl0bnggZm9yIGtleXJlZwogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBmZWUgcGF5bWVudCBpcyB0byBwcmV2ZW50IHBvdGVudGlhbCBkcmFpbmluZwogICAgLy8gIyAgIGludG8gZmVlcywgZXZlbiB0aG91Z2ggaXQgaXMgbm90IGxpa2VseSB0aGF0CiAgICAvLyAjICAgYSB1c2VyIG1heSBhdHRlbXB0IHRvIGRyYWluIHRoZWlyIGZ1bmRzCiAgICAvLyAjIC0gTUFCIGlzIG5vdCByZWxldmFudCBkdWUgdG8gdGhlIGZlZSBwYXltZW50CiAgICAvLyAjICAgYWRkZWQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwYXJ0aWNpcGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl93aXRoZHJhd19yb3V0ZUA4OgogICAgLy8gY29udHJhY3QucHk6MTIwLTEzOQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXcKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGFtb3VudAogICAgLy8gIyByZXR1cm5zOgogICAgLy8gIyAtIG1hYgogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGZ1bmRzIGZyb20gY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IG93bmVyCiAgICAvLyAjIC0gbGV0IGJhbGFuY2UgYmUgdGhlIGN1cnJlbnQgYmFsYW5jZSBvZiB0aGUKICAgIC8vICMgICBjb250cmFjdAogICAgLy8gIyAtIGxldCBmZWUgYmUgb25lIGZlZSB2YWx1ZQogICAgLy8gIyAtIGJhbGFuY2UgLSBhbW91bnQgLSBmZWUgPj0gbWFnCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0cmFuc2ZlciBhbW91bnQgZnJvbSB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyAgIHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIDIgZmVlcwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIGNvbnRyYWN0LnB5OjEyMC0xMzkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHdpdGhkcmF3CiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBhbW91bnQKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBtYWIKICAgIC8vICMgcHVycG9zZTogZXh0cmFjdCBmdW5kcyBmcm9tIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSBvd25lcgogICAgLy8gIyAtIGxldCBiYWxhbmNlIGJlIHRoZSBjdXJyZW50IGJhbGFuY2Ugb2YgdGhlCiAgICAvLyAjICAgY29udHJhY3QKICAgIC8vICMgLSBsZXQgZmVlIGJlIG9uZSBmZWUgdmFsdWUKICAgIC8vICMgLSBiYWxhbmNlIC0gYW1vdW50IC0gZmVlID49IG1hZwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdHJhbnNmZXIgYW1vdW50IGZyb20gdGhlIGNvbnRyYWN0IGFjY291bnQKICAgIC8vICMgICB0byBvd25lcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSAyIGZlZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl90cmFuc2Zlcl9yb3V0ZUA5OgogICAgLy8gY29udHJhY3QucHk6MTUyLTE2NQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogdHJhbnNmZXIKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIG93bmVyLCBuZXcgb3duZXIKICAgIC8vICMgcHVycG9zZTogY2hhbmdlIG93bmVyCiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSB0aGUgb3duZXIKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIG5ldyBvd25lcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBmZWUgdGFrZW4gb3V0IG9mIGFtb3VudCB0cmFuc2ZlcmVkIHRvCiAgICAvLyAjICAgb3duZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIFNtYXJ0Q29udHJhY3RTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBjb250cmFjdC5weToxNTItMTY1CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiB0cmFuc2ZlcgogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gb3duZXIsIG5ldyBvd25lcgogICAgLy8gIyBwdXJwb3NlOiBjaGFuZ2Ugb3duZXIKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IHRoZSBvd25lcgogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gbmV3IG93bmVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIGZlZSB0YWtlbiBvdXQgb2YgYW1vdW50IHRyYW5zZmVyZWQgdG8KICAgIC8vICMgICBvd25lcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHRyYW5zZmVyCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2Nsb3NlX3JvdXRlQDEwOgogICAgLy8gY29udHJhY3QucHk6MTcxLTE4NwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY2xvc2UKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGRlbGV0ZXMgY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gbWFiIGlzIDAKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIGNvbnRyYWN0IGlzIGRlbGV0ZWQKICAgIC8vICMgLSBhY2NvdW50IGNsb3NlZCBvdXQgdG8gb3duZXIgaWYgaXQgaGFzIGEgYmFsYW5jZQogICAgLy8gIyAtIDIgZmVlcwogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBzaG91bGQgYmUgYWxsZWQgd2l0aCBvbkNvbXBsZXRpb24KICAgIC8vICMgICBkZWxldGVBcHBsaWNhdGlvbgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WwogICAgLy8gICAgIE9uQ29tcGxldGVBY3Rpb24uRGVsZXRlQXBwbGljYXRpb24KICAgIC8vIF0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBjbG9zZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTM6CiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyByZWplY3QgdHJhbnNhY3Rpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXR1cm4KCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5zZXR1cChvd25lcjogYnl0ZXMpIC0+IHZvaWQ6CnNldHVwOgogICAgLy8gY29udHJhY3QucHk6MzItNDMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNvbnN0cnVjdG9yCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBvd25lciwgd2hvIGlzIHRoZSBiZW5lZmljaWFyeQogICAgLy8gIyAtIGZ1bmRlciwgd2hvIGlzIHRoaXMKICAgIC8vICMgLSB0b3RhbCwgdG90YWwgYW1vdW50IHdpdGhvdXQgbG9ja3VwCiAgICAvLyAjIHB1cnBvc2U6IGNyZWF0ZSBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IHNldCBvd25lciBhbmQgZnVuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXR1cChzZWxmLCBvd25lcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBjb250cmFjdC5weTo0NAogICAgLy8gc2VsZi5lbmZvcmNlX3N0ZXAoVUludDY0KDApKSAjIE5vbi1leGlzdGFudAogICAgaW50IDAKICAgIGNhbGxzdWIgZW5mb3JjZV9zdGVwCiAgICAvLyBjb250cmFjdC5weTo0NQogICAgLy8gc2VsZi5yZXF1aXJlX2NyZWF0b3IoKQogICAgY2FsbHN1YiByZXF1aXJlX2NyZWF0b3IKICAgIC8vIGNvbnRyYWN0LnB5OjQ2CiAgICAvLyBzZWxmLmZ1bmRlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGUgImZ1bmRlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTo0NwogICAgLy8gc2VsZi5vd25lciA9IG93bmVyLm5hdGl2ZQogICAgYnl0ZSAib3duZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5lbmZvcmNlX3N0ZXAobjogdWludDY0KSAtPiB2b2lkOgplbmZvcmNlX3N0ZXA6CiAgICAvLyBjb250cmFjdC5weToyNTUtMjY1CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBlbmZvcmNlX3N0ZXAgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gc3RlcCwgd2hhdCBzdGVwIHRvIGVuZm9yY2UKICAgIC8vICMgcHVycG9zZToKICAgIC8vICMgLSBlbmZvcmNlIHRoYXQgbWV0aG9kIG1heSBiZSBhbGxvd2VkIGluIHN0ZXAKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGVuZm9yY2Vfc3RlcChzZWxmLCBuOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjI2Ni0yOTAKICAgIC8vIG1hdGNoIG46CiAgICAvLyAgICAgY2FzZSBVSW50NjQoMCk6ICMgTm9uLWV4aXN0ZW50CiAgICAvLyAgICAgICAgIGFzc2VydCBzZWxmLmZ1bmRlciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAiZnVuZGVyIG11c3Qgbm90IGJlIGluaXRpYWxpemVkIgogICAgLy8gICAgICAgICBhc3NlcnQgc2VsZi5vd25lciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAib3duZXIgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQiCiAgICAvLyAgICAgICAgIGFzc2VydCBzZWxmLnBlcmlvZCA9PSAwLCAicGVyaW9kIG11c3Qgbm90IGJlIGluaXRpYWxpemUiCiAgICAvLyAgICAgICAgIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gMCwgImZ1bmRpbmcgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZSIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYudG90YWwgPT0gMCwgInRvdGFsIG11c3Qgbm90IGJlIGluaXRpYWxpemVkIgogICAgLy8gICAgIGNhc2UgVUludDY0KDEpOiAjIEZyZXNoCiAgICAvLyAgICAgICAgIGFzc2VydCBzZWxmLmZ1bmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzLCAiZnVuZGVyIG11c3QgYmUgaW5pdGlhbGl6ZSIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYub3duZXIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgIm93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICAvLyAgICAgICAgIGFzc2VydCBzZWxmLnBlcmlvZCA9PSAwLCAicGVyaW9kIG11c3Qgbm90IGJlIGluaXRpYWxpemVkIgogICAgLy8gICAgICAgICBhc3NlcnQgc2VsZi5mdW5kaW5nID09IDAsICJmdW5kaW5nIG11c3Qgbm90IGJlIGluaXRpYWxpemVkIgogICAgLy8gICAgICAgICBhc3NlcnQgc2VsZi50b3RhbCA9PSAwLCAidG90YWwgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQiCiAgICAvLyAgICAgY2FzZSBVSW50NjQoMik6ICMgUmVhZHkKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJmdW5kZXIgbXVzdCBiZSBpbml0aWFsaXplIgogICAgLy8gICAgICAgICBhc3NlcnQgc2VsZi5vd25lciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCAib3duZXIgbXVzdCBiZSBpbml0aWFsaXplZCIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYucGVyaW9kIDw9IDUsICJwZXJpb2Qgd2l0aGluIGJvdW5kcyIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYuZnVuZGluZyA9PSAwLCAiZnVuZGluZyBtdXN0IG5vdCBiZSBpbml0aWFsaXplZCIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYudG90YWwgPT0gMCwgInRvdGFsIG11c3Qgbm90IGJlIGluaXRpYWxpemVkIgogICAgLy8gICAgIGNhc2UgVUludDY0KDMpOiAjIEZ1bGwKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJmdW5kZXIgbXVzdCBiZSBpbml0aWFsaXplIgogICAgLy8gICAgICAgICBhc3NlcnQgc2VsZi5vd25lciAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCAib3duZXIgbXVzdCBiZSBpbml0aWFsaXplZCIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYucGVyaW9kIDw9IDUsICJwZXJpb2Qgd2l0aGluIGJvdW5kcyIKICAgIC8vICAgICAgICAgYXNzZXJ0IHNlbGYuZnVuZGluZyA+IDAsICJmdW5kaW5nIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICAvLyAgICAgICAgIGFzc2VydCBzZWxmLnRvdGFsID4gMCwgInRvdGFsIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3aXRjaCBlbmZvcmNlX3N0ZXBfc3dpdGNoX2Nhc2VfMEAxIGVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV8xQDIgZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlXzJAMyBlbmZvcmNlX3N0ZXBfc3dpdGNoX2Nhc2VfM0A0CiAgICByZXRzdWIKCmVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV8wQDE6CiAgICAvLyBjb250cmFjdC5weToyNjgKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRlciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAiZnVuZGVyIG11c3Qgbm90IGJlIGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIGZ1bmRlciBtdXN0IG5vdCBiZSBpbml0aWFsaXplZAogICAgLy8gY29udHJhY3QucHk6MjY5CiAgICAvLyBhc3NlcnQgc2VsZi5vd25lciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLCAib3duZXIgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIG93bmVyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIG93bmVyIG11c3Qgbm90IGJlIGluaXRpYWxpemVkCiAgICAvLyBjb250cmFjdC5weToyNzAKICAgIC8vIGFzc2VydCBzZWxmLnBlcmlvZCA9PSAwLCAicGVyaW9kIG11c3Qgbm90IGJlIGluaXRpYWxpemUiCiAgICBpbnQgMAogICAgYnl0ZSAicGVyaW9kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBwZXJpb2QgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gcGVyaW9kIG11c3Qgbm90IGJlIGluaXRpYWxpemUKICAgIC8vIGNvbnRyYWN0LnB5OjI3MQogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGluZyA9PSAwLCAiZnVuZGluZyBtdXN0IG5vdCBiZSBpbml0aWFsaXplIgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRpbmciCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGZ1bmRpbmcgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gZnVuZGluZyBtdXN0IG5vdCBiZSBpbml0aWFsaXplCiAgICAvLyBjb250cmFjdC5weToyNzIKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsID09IDAsICJ0b3RhbCBtdXN0IG5vdCBiZSBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICBieXRlICJ0b3RhbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgdG90YWwgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gdG90YWwgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQKICAgIGIgZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlX25leHRANgoKZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlXzFAMjoKICAgIC8vIGNvbnRyYWN0LnB5OjI3NAogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJmdW5kZXIgbXVzdCBiZSBpbml0aWFsaXplIgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIGZ1bmRlciBtdXN0IGJlIGluaXRpYWxpemUKICAgIC8vIGNvbnRyYWN0LnB5OjI3NQogICAgLy8gYXNzZXJ0IHNlbGYub3duZXIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgIm93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIG93bmVyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIG93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQKICAgIC8vIGNvbnRyYWN0LnB5OjI3NgogICAgLy8gYXNzZXJ0IHNlbGYucGVyaW9kID09IDAsICJwZXJpb2QgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAicGVyaW9kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBwZXJpb2QgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gcGVyaW9kIG11c3Qgbm90IGJlIGluaXRpYWxpemVkCiAgICAvLyBjb250cmFjdC5weToyNzcKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gMCwgImZ1bmRpbmcgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGluZyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBmdW5kaW5nIG11c3Qgbm90IGJlIGluaXRpYWxpemVkCiAgICAvLyBjb250cmFjdC5weToyNzgKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsID09IDAsICJ0b3RhbCBtdXN0IG5vdCBiZSBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICBieXRlICJ0b3RhbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgdG90YWwgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gdG90YWwgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQKICAgIGIgZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlX25leHRANgoKZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlXzJAMzoKICAgIC8vIGNvbnRyYWN0LnB5OjI4MAogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJmdW5kZXIgbXVzdCBiZSBpbml0aWFsaXplIgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIGZ1bmRlciBtdXN0IGJlIGluaXRpYWxpemUKICAgIC8vIGNvbnRyYWN0LnB5OjI4MQogICAgLy8gYXNzZXJ0IHNlbGYub3duZXIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgIm93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIG93bmVyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIG93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQKICAgIC8vIGNvbnRyYWN0LnB5OjI4MgogICAgLy8gYXNzZXJ0IHNlbGYucGVyaW9kIDw9IDUsICJwZXJpb2Qgd2l0aGluIGJvdW5kcyIKICAgIGludCAwCiAgICBieXRlICJwZXJpb2QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHBlcmlvZCBleGlzdHMKICAgIGludCA1CiAgICA8PQogICAgYXNzZXJ0IC8vIHBlcmlvZCB3aXRoaW4gYm91bmRzCiAgICAvLyBjb250cmFjdC5weToyODMKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPT0gMCwgImZ1bmRpbmcgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGluZyBleGlzdHMKICAgICEKICAgIGFzc2VydCAvLyBmdW5kaW5nIG11c3Qgbm90IGJlIGluaXRpYWxpemVkCiAgICAvLyBjb250cmFjdC5weToyODQKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsID09IDAsICJ0b3RhbCBtdXN0IG5vdCBiZSBpbml0aWFsaXplZCIKICAgIGludCAwCiAgICBieXRlICJ0b3RhbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgdG90YWwgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQgLy8gdG90YWwgbXVzdCBub3QgYmUgaW5pdGlhbGl6ZWQKICAgIGIgZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlX25leHRANgoKZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlXzNANDoKICAgIC8vIGNvbnRyYWN0LnB5OjI4NgogICAgLy8gYXNzZXJ0IHNlbGYuZnVuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJmdW5kZXIgbXVzdCBiZSBpbml0aWFsaXplIgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIGZ1bmRlciBtdXN0IGJlIGluaXRpYWxpemUKICAgIC8vIGNvbnRyYWN0LnB5OjI4NwogICAgLy8gYXNzZXJ0IHNlbGYub3duZXIgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgIm93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIG93bmVyIGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIG93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQKICAgIC8vIGNvbnRyYWN0LnB5OjI4OAogICAgLy8gYXNzZXJ0IHNlbGYucGVyaW9kIDw9IDUsICJwZXJpb2Qgd2l0aGluIGJvdW5kcyIKICAgIGludCAwCiAgICBieXRlICJwZXJpb2QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHBlcmlvZCBleGlzdHMKICAgIGludCA1CiAgICA8PQogICAgYXNzZXJ0IC8vIHBlcmlvZCB3aXRoaW4gYm91bmRzCiAgICAvLyBjb250cmFjdC5weToyODkKICAgIC8vIGFzc2VydCBzZWxmLmZ1bmRpbmcgPiAwLCAiZnVuZGluZyBtdXN0IGJlIGluaXRpYWxpemVkIgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRpbmciCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGZ1bmRpbmcgZXhpc3RzCiAgICBhc3NlcnQgLy8gZnVuZGluZyBtdXN0IGJlIGluaXRpYWxpemVkCiAgICAvLyBjb250cmFjdC5weToyOTAKICAgIC8vIGFzc2VydCBzZWxmLnRvdGFsID4gMCwgInRvdGFsIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBpbnQgMAogICAgYnl0ZSAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHRvdGFsIGV4aXN0cwogICAgYXNzZXJ0IC8vIHRvdGFsIG11c3QgYmUgaW5pdGlhbGl6ZWQKCmVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV9uZXh0QDY6CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5yZXF1aXJlX2NyZWF0b3IoKSAtPiB2b2lkOgpyZXF1aXJlX2NyZWF0b3I6CiAgICAvLyBjb250cmFjdC5weToyMjUtMjMzCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiByZXF1aXJlX2NyZWF0b3IgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2hlY2sgdGhhdCBzZW5kZXIgaXMgY3JlYXRvcgogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9jcmVhdG9yKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIGNvbnRyYWN0LnB5OjIzNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcywgIm11c3QgYmUgY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGNyZWF0b3IKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmNvbmZpZ3VyZShwZXJpb2Q6IGJ5dGVzKSAtPiB2b2lkOgpjb25maWd1cmU6CiAgICAvLyBjb250cmFjdC5weTo0OC01OQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY29uZmlndXJlCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBwZXJpb2QsIGxvY2t1cCBwZXJpb2QKICAgIC8vICMgcHVycG9zZTogc2V0IGxvY2t1cCBwZXJpb2QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBmdW5kZXIgYW5kIG93bmVyIGluaXRpYWxpemVkCiAgICAvLyAjIC0gcGVyaW9kIDAKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBzZXQgb3duZXIgYW5kIGZ1bmRlcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY29uZmlndXJlKHNlbGYsIHBlcmlvZDogYXJjNC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjYwCiAgICAvLyBzZWxmLmVuZm9yY2Vfc3RlcChVSW50NjQoMSkpICMgRnJlc2gKICAgIGludCAxCiAgICBjYWxsc3ViIGVuZm9yY2Vfc3RlcAogICAgLy8gY29udHJhY3QucHk6NjEKICAgIC8vIHNlbGYucmVxdWlyZV9vd25lcigpCiAgICBjYWxsc3ViIHJlcXVpcmVfb3duZXIKICAgIC8vIGNvbnRyYWN0LnB5OjYyCiAgICAvLyBhc3NlcnQgcGVyaW9kID4gMCwgInBlcmlvZCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiAwIgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBwZXJpb2QgbXVzdCBiZSBncmVhdGVyIHRoYW4gMAogICAgLy8gY29udHJhY3QucHk6NjMKICAgIC8vIGFzc2VydCBwZXJpb2QgPD0gNSwgInBlcmlvZCBtdXN0IGJlIGxlc3MgdGhhbiBvciBlcXVhbCB0byA1IgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwNQogICAgYjw9CiAgICBhc3NlcnQgLy8gcGVyaW9kIG11c3QgYmUgbGVzcyB0aGFuIG9yIGVxdWFsIHRvIDUKICAgIC8vIGNvbnRyYWN0LnB5OjY0CiAgICAvLyBzZWxmLnBlcmlvZCA9IHBlcmlvZC5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgYnl0ZSAicGVyaW9kIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLnJlcXVpcmVfb3duZXIoKSAtPiB2b2lkOgpyZXF1aXJlX293bmVyOgogICAgLy8gY29udHJhY3QucHk6MjQ1LTI1MwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcmVxdWlyZV9vd25lciAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayB0aGF0IHNlbmRlciBpcyBvd25lcgogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9vd25lcihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBjb250cmFjdC5weToyNTQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIGJ5dGUgIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBvd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lcgogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcuZmlsbCh0b3RhbDogYnl0ZXMsIGZ1bmRpbmc6IGJ5dGVzKSAtPiB2b2lkOgpmaWxsOgogICAgLy8gY29udHJhY3QucHk6NjUtODAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGZpbGwKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHRvdGFsLCBob3cgbXVjaCB0byBmaWxsCiAgICAvLyAjIHB1cnBvc2U6IGZ1bmQgaXQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBwZXJpb2QgbXVzdCBiZSBzZXQKICAgIC8vICMgLSBmdW5kaW5nIGFuZCB0b3RhbCBtdXN0IGJlIHVuaW5pdGlhbGl6ZWQKICAgIC8vICMgLSBtdXN0IGJlIGNvbWJpbmVkIHdpdGggcHlhbWVudCB0cmFuc2FjdGlvbgogICAgLy8gIyAgIGZvciB0b3RhbCBhbW91bnQKICAgIC8vICMgLSBtdXN0IGJlIG9ubHkgY2FsbGFibGUgYnkgZnVuZGVyCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0b3RhbCBhbmQgZnVuZGluZyBhcmUgc2V0IHRvIGFyZ3VtZW50cwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZmlsbChzZWxmLCB0b3RhbDogYXJjNC5VSW50NjQsIGZ1bmRpbmc6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBjb250cmFjdC5weTo4MQogICAgLy8gc2VsZi5lbmZvcmNlX3N0ZXAoVUludDY0KDIpKSAjIFJlYWR5CiAgICBpbnQgMgogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjgyCiAgICAvLyBzZWxmLnJlcXVpcmVfZnVuZGVyKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9mdW5kZXIKICAgIC8vIGNvbnRyYWN0LnB5OjgzCiAgICAvLyBzZWxmLnJlcXVpcmVfcGF5bWVudChzZWxmLmZ1bmRlciwgdG90YWwubmF0aXZlKQogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgcmVxdWlyZV9wYXltZW50CiAgICAvLyBjb250cmFjdC5weTo4NAogICAgLy8gYXNzZXJ0IHRvdGFsID4gMCwgInBheW1lbnQgaXMgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYXNzZXJ0IC8vIHBheW1lbnQgaXMgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIGNvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwubmF0aXZlCiAgICBieXRlICJ0b3RhbCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTo4NgogICAgLy8gc2VsZi5mdW5kaW5nID0gZnVuZGluZy5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgYnl0ZSAiZnVuZGluZyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5yZXF1aXJlX2Z1bmRlcigpIC0+IHZvaWQ6CnJlcXVpcmVfZnVuZGVyOgogICAgLy8gY29udHJhY3QucHk6MjM1LTI0MwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcmVxdWlyZV9mdW5kZXIgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogY2hlY2sgdGhhdCBzZW5kZXIgaXMgZnVuZGVyCiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZXF1aXJlX2Z1bmRlcihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBjb250cmFjdC5weToyNDQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZnVuZGVyLCAibXVzdCBiZSBmdW5kZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnQgMAogICAgYnl0ZSAiZnVuZGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBmdW5kZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIG11c3QgYmUgZnVuZGVyCiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5yZXF1aXJlX3BheW1lbnQod2hvOiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CnJlcXVpcmVfcGF5bWVudDoKICAgIC8vIGNvbnRyYWN0LnB5OjIxMy0yMjEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHJlcXVpcmVfcGF5bWVudCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayBwYXltZW50CiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiByZXF1aXJlX3BheW1lbnQoc2VsZiwgd2hvOiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gY29udHJhY3QucHk6MjIyCiAgICAvLyBhc3NlcnQgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oMCkuc2VuZGVyID09IHdobywgInBheW1lbnQgc2VuZGVyIGFjY3VyYXRlIgogICAgaW50IDAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICBpbnQgMAogICAgZ3R4bnMgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICBhc3NlcnQgLy8gcGF5bWVudCBzZW5kZXIgYWNjdXJhdGUKICAgIC8vIGNvbnRyYWN0LnB5OjIyMwogICAgLy8gYXNzZXJ0IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKDApLmFtb3VudCA9PSBhbW91bnQsICJwYXltZW50IGFtb3VudCBhY2N1cmF0ZSIKICAgIGludCAwCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3VudCBhY2N1cmF0ZQogICAgLy8gY29udHJhY3QucHk6MjI0CiAgICAvLyBhc3NlcnQgZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24oMCkucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUiCiAgICBpbnQgMAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIHBheW1lbnQgcmVjZWl2ZXIgYWNjdXJhdGUKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLnBhcnRpY2lwYXRlKHZvdGVfazogYnl0ZXMsIHNlbF9rOiBieXRlcywgdm90ZV9mc3Q6IGJ5dGVzLCB2b3RlX2xzdDogYnl0ZXMsIHZvdGVfa2Q6IGJ5dGVzLCBzcF9rZXk6IGJ5dGVzKSAtPiB2b2lkOgpwYXJ0aWNpcGF0ZToKICAgIC8vIGNvbnRyYWN0LnB5Ojg3LTEwNwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcGFydGljaXBhdGUKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGtleSByZWdpc3RyYXRpb24gcGFyYW1zCiAgICAvLyAjIHB1cnBvc2U6IGFsbG93IGNvbnRyYWN0IHRvIHBhcnRpY3BhdGUgaW4KICAgIC8vICMgICAgICAgICAgY29uc2Vuc3VzCiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gbXVzdCBiZSBjYWxsYWJsZSBieSBvd25lciBvbmx5CiAgICAvLyAjIC0gbXVzdCBiZSBjb21iaW5lZCB3aXRoIHRyYW5zYWN0aW9uIHRyYW5zZmVyaW5nCiAgICAvLyAjICAgb25lIGZlZSBpbnRvIHRoZSBjb250cmFjdCBhY2NvdW50CiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSBjb250cmFjdCBnZW5lcmF0ZXMgaXRueCBmb3Iga2V5cmVnCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIGZlZSBwYXltZW50IGlzIHRvIHByZXZlbnQgcG90ZW50aWFsIGRyYWluaW5nCiAgICAvLyAjICAgaW50byBmZWVzLCBldmVuIHRob3VnaCBpdCBpcyBub3QgbGlrZWx5IHRoYXQKICAgIC8vICMgICBhIHVzZXIgbWF5IGF0dGVtcHQgdG8gZHJhaW4gdGhlaXIgZnVuZHMKICAgIC8vICMgLSBNQUIgaXMgbm90IHJlbGV2YW50IGR1ZSB0byB0aGUgZmVlIHBheW1lbnQKICAgIC8vICMgICBhZGRlZAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgcGFydGljaXBhdGUoc2VsZiwgdm90ZV9rOiBCeXRlcywgc2VsX2s6IEJ5dGVzLCB2b3RlX2ZzdDogYXJjNC5VSW50NjQsIHZvdGVfbHN0OiBhcmM0LlVJbnQ2NCwgdm90ZV9rZDogYXJjNC5VSW50NjQsIHNwX2tleTogQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byA2IDAKICAgIC8vIGNvbnRyYWN0LnB5OjEwOAogICAgLy8gc2VsZi5lbmZvcmNlX3N0ZXAoVUludDY0KDMpKSAjIEZ1bGwKICAgIGludCAzCiAgICBjYWxsc3ViIGVuZm9yY2Vfc3RlcAogICAgLy8gY29udHJhY3QucHk6MTA5CiAgICAvLyBzZWxmLnJlcXVpcmVfb3duZXIoKQogICAgY2FsbHN1YiByZXF1aXJlX293bmVyCiAgICAvLyBjb250cmFjdC5weToxMTAKICAgIC8vIHNlbGYucmVxdWlyZV9wYXltZW50KHNlbGYub3duZXIsIFVJbnQ2NCgxMDAwKSkKICAgIGludCAwCiAgICBieXRlICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgb3duZXIgZXhpc3RzCiAgICBpbnQgMTAwMAogICAgY2FsbHN1YiByZXF1aXJlX3BheW1lbnQKICAgIC8vIGNvbnRyYWN0LnB5OjExMS0xMTkKICAgIC8vIGl0eG4uS2V5UmVnaXN0cmF0aW9uKAogICAgLy8gICAgIHZvdGVfa2V5PXZvdGVfaywKICAgIC8vICAgICBzZWxlY3Rpb25fa2V5PXNlbF9rLAogICAgLy8gICAgIHZvdGVfZmlyc3Q9dm90ZV9mc3QubmF0aXZlLAogICAgLy8gICAgIHZvdGVfbGFzdD12b3RlX2xzdC5uYXRpdmUsCiAgICAvLyAgICAgdm90ZV9rZXlfZGlsdXRpb249dm90ZV9rZC5uYXRpdmUsCiAgICAvLyAgICAgc3RhdGVfcHJvb2Zfa2V5PXNwX2tleSwKICAgIC8vICAgICBmZWU9MTAwMAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6MTE0CiAgICAvLyB2b3RlX2ZpcnN0PXZvdGVfZnN0Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtNAogICAgYnRvaQogICAgLy8gY29udHJhY3QucHk6MTE1CiAgICAvLyB2b3RlX2xhc3Q9dm90ZV9sc3QubmF0aXZlLAogICAgZnJhbWVfZGlnIC0zCiAgICBidG9pCiAgICAvLyBjb250cmFjdC5weToxMTYKICAgIC8vIHZvdGVfa2V5X2RpbHV0aW9uPXZvdGVfa2QubmF0aXZlLAogICAgZnJhbWVfZGlnIC0yCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgU3RhdGVQcm9vZlBLCiAgICBpdHhuX2ZpZWxkIFZvdGVLZXlEaWx1dGlvbgogICAgaXR4bl9maWVsZCBWb3RlTGFzdAogICAgaXR4bl9maWVsZCBWb3RlRmlyc3QKICAgIGZyYW1lX2RpZyAtNQogICAgaXR4bl9maWVsZCBTZWxlY3Rpb25QSwogICAgZnJhbWVfZGlnIC02CiAgICBpdHhuX2ZpZWxkIFZvdGVQSwogICAgLy8gY29udHJhY3QucHk6MTExCiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIGludCBrZXlyZWcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIGNvbnRyYWN0LnB5OjExOAogICAgLy8gZmVlPTEwMDAKICAgIGludCAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gY29udHJhY3QucHk6MTExLTExOQogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9dm90ZV9rLAogICAgLy8gICAgIHNlbGVjdGlvbl9rZXk9c2VsX2ssCiAgICAvLyAgICAgdm90ZV9maXJzdD12b3RlX2ZzdC5uYXRpdmUsCiAgICAvLyAgICAgdm90ZV9sYXN0PXZvdGVfbHN0Lm5hdGl2ZSwKICAgIC8vICAgICB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLm5hdGl2ZSwKICAgIC8vICAgICBzdGF0ZV9wcm9vZl9rZXk9c3Bfa2V5LAogICAgLy8gICAgIGZlZT0xMDAwCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcud2l0aGRyYXcoYW1vdW50OiBieXRlcykgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIGNvbnRyYWN0LnB5OjEyMC0xNDAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHdpdGhkcmF3CiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBhbW91bnQKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBtYWIKICAgIC8vICMgcHVycG9zZTogZXh0cmFjdCBmdW5kcyBmcm9tIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSBvd25lcgogICAgLy8gIyAtIGxldCBiYWxhbmNlIGJlIHRoZSBjdXJyZW50IGJhbGFuY2Ugb2YgdGhlCiAgICAvLyAjICAgY29udHJhY3QKICAgIC8vICMgLSBsZXQgZmVlIGJlIG9uZSBmZWUgdmFsdWUKICAgIC8vICMgLSBiYWxhbmNlIC0gYW1vdW50IC0gZmVlID49IG1hZwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdHJhbnNmZXIgYW1vdW50IGZyb20gdGhlIGNvbnRyYWN0IGFjY291bnQKICAgIC8vICMgICB0byBvd25lcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSAyIGZlZXMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHdpdGhkcmF3KHNlbGYsIGFtb3VudDogYXJjNC5VSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gY29udHJhY3QucHk6MTQxCiAgICAvLyBzZWxmLmVuZm9yY2Vfc3RlcChVSW50NjQoMykpICMgRnVsbAogICAgaW50IDMKICAgIGNhbGxzdWIgZW5mb3JjZV9zdGVwCiAgICAvLyBjb250cmFjdC5weToxNDIKICAgIC8vIHNlbGYucmVxdWlyZV9vd25lcigpCiAgICBjYWxsc3ViIHJlcXVpcmVfb3duZXIKICAgIC8vIGNvbnRyYWN0LnB5OjE0MwogICAgLy8gbWFiID0gc2VsZi5jYWxjdWxhdGVfbWFiKCkKICAgIGNhbGxzdWIgY2FsY3VsYXRlX21hYgogICAgZHVwCiAgICAvLyBjb250cmFjdC5weToxNDQKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gc2VsZi5nZXRfYXZhaWxhYmxlX2JhbGFuY2UoKQogICAgY2FsbHN1YiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UKICAgIC8vIGNvbnRyYWN0LnB5OjE0NQogICAgLy8gYXNzZXJ0IGF2YWlsYWJsZV9iYWxhbmNlIC0gYW1vdW50Lm5hdGl2ZSA+PSBtYWIsICJtYWIgYXZhaWxhYmxlIgogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIC0KICAgIDw9CiAgICBhc3NlcnQgLy8gbWFiIGF2YWlsYWJsZQogICAgLy8gY29udHJhY3QucHk6MTQ2CiAgICAvLyBpZiBhbW91bnQgPiAwOgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGJ6IHdpdGhkcmF3X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gY29udHJhY3QucHk6MTQ3LTE1MAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIGFtb3VudD1hbW91bnQubmF0aXZlLAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBjb250cmFjdC5weToxNDkKICAgIC8vIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgMQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIGNvbnRyYWN0LnB5OjE0NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weToxNDctMTUwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgYW1vdW50PWFtb3VudC5uYXRpdmUsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0Cgp3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBjb250cmFjdC5weToxNTEKICAgIC8vIHJldHVybiBtYWIKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmNhbGN1bGF0ZV9tYWIoKSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV9tYWI6CiAgICAvLyBjb250cmFjdC5weToyOTEtMzA2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjYWxjdWxhdGVfbWFiIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGNhbGN1YWx0ZSBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlCiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBsZXQgcGVyaW9kID0gbnVtYmVyIG9mIG1vbnRocyB0byB0byBsb2NrdXAKICAgIC8vICMgICAgICAgdG90YWwgPSB0b3RhbCBhbW91bnQgaW50aWFsbHkgZnVuZGVkIChhaXJkcm9wICsgbG9ja3VwIGJvbnVzKQogICAgLy8gIyAgICAgICB5ID0gdmVzdGluZyBkZWxheSBpbiBtb250aHMKICAgIC8vICMgICAgICAgcCA9IDEgLyAoc2VsZi5wZXJpb2QgeCAxMikgb3IgMSAvIChwZXJpb2QpCiAgICAvLyAjIC0gbWltdW11bSBhbGxvd2FibGUgYmFsYW5jZSA9CiAgICAvLyAjICAgICB0b3RhbCB4IG1pbigxLCBwIHggbWF4KDAsIChwZXJpb2QgLSAobm93KCkgLSBmdW5kaW5nICsgeSB4IHNlY29uZHMtaW4tbW9udGgpKSAvIHNlY29uZHMtaW4tbW9udGgpKQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjdWxhdGVfbWFiKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gY29udHJhY3QucHk6MzA3CiAgICAvLyBub3cgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gY29udHJhY3QucHk6MzA4CiAgICAvLyB5ID0gVGVtcGxhdGVWYXJbVUludDY0XSgiVkVTVElOR19ERUxBWSIpICMgdmVzdGluZyBkZWxheQogICAgaW50IFRNUExfVkVTVElOR19ERUxBWQogICAgLy8gY29udHJhY3QucHk6MzA5CiAgICAvLyBzZWNvbmRzX2luX3BlcmlvZCA9IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlBFUklPRF9TRUNPTkRTIikKICAgIGludCBUTVBMX1BFUklPRF9TRUNPTkRTCiAgICAvLyBjb250cmFjdC5weTozMDgKICAgIC8vIHkgPSBUZW1wbGF0ZVZhcltVSW50NjRdKCJWRVNUSU5HX0RFTEFZIikgIyB2ZXN0aW5nIGRlbGF5CiAgICBpbnQgVE1QTF9WRVNUSU5HX0RFTEFZCiAgICAvLyBjb250cmFjdC5weTozMDcKICAgIC8vIG5vdyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICAvLyBjb250cmFjdC5weTozMDkKICAgIC8vIHNlY29uZHNfaW5fcGVyaW9kID0gVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKQogICAgaW50IFRNUExfUEVSSU9EX1NFQ09ORFMKICAgIC8vIGNvbnRyYWN0LnB5OjMxMAogICAgLy8gcCA9IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIkxPQ0tVUF9ERUxBWSIpICogc2VsZi5wZXJpb2QgIyBsb2NrdXAgcGVyaW9kCiAgICBpbnQgMAogICAgYnl0ZSAicGVyaW9kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBwZXJpb2QgZXhpc3RzCiAgICBpbnQgVE1QTF9MT0NLVVBfREVMQVkKICAgICoKICAgIC8vIGNvbnRyYWN0LnB5OjMxMQogICAgLy8gbG9ja2VkX3VwID0gbm93IDwgc2VsZi5mdW5kaW5nICsgcCAqIHNlY29uZHNfaW5fcGVyaW9kCiAgICBpbnQgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGluZyBleGlzdHMKICAgIGRpZyAxCiAgICBkaWcgMwogICAgKgogICAgZHVwCiAgICBjb3ZlciA2CiAgICArCiAgICBkaWcgMwogICAgPgogICAgY292ZXIgMwogICAgLy8gY29udHJhY3QucHk6MzEyCiAgICAvLyBmdWxseV92ZXN0ZWQgPSBub3cgPj0gc2VsZi5mdW5kaW5nICsgKHkgKyBwKSAqIHNlY29uZHNfaW5fcGVyaW9kCiAgICBpbnQgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGluZyBleGlzdHMKICAgIHVuY292ZXIgNQogICAgdW5jb3ZlciAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgICoKICAgICsKICAgID49CiAgICBzd2FwCiAgICAvLyBjb250cmFjdC5weTozMTQtMzE3CiAgICAvLyAjIGlmIGxvY2tlZCB1cCB0aGVuIHRvdGFsCiAgICAvLyAjIGVsaWYgZnVsbHkgdmVzdGVkIHRoZW4gemVybwogICAgLy8gIyBlbHNlIGNhbGN1bGF0ZSBtYWIgdXNpbmcgZWxhcHNlZCBwZXJpb2RzCiAgICAvLyBpZiBsb2NrZWRfdXA6ICMgIGlmIGxvY2tlZCB1cCB0aGVuIHRvdGFsCiAgICBieiBjYWxjdWxhdGVfbWFiX2Vsc2VfYm9keUAyCiAgICAvLyBjb250cmFjdC5weTozMTgKICAgIC8vIHJldHVybiBzZWxmLnRvdGFsCiAgICBpbnQgMAogICAgYnl0ZSAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHRvdGFsIGV4aXN0cwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNhbGN1bGF0ZV9tYWJfZWxzZV9ib2R5QDI6CiAgICAvLyBjb250cmFjdC5weTozMTkKICAgIC8vIGVsaWYgZnVsbHlfdmVzdGVkOiAjICBlbGlmIGZ1bGx5IHZlc3RlZCB0aGVuIHplcm8KICAgIGZyYW1lX2RpZyA0CiAgICBieiBjYWxjdWxhdGVfbWFiX2Vsc2VfYm9keUA0CiAgICAvLyBjb250cmFjdC5weTozMjAKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKY2FsY3VsYXRlX21hYl9lbHNlX2JvZHlANDoKICAgIC8vIGNvbnRyYWN0LnB5OjMyMgogICAgLy8gbSA9ICAobm93IC0gKHNlbGYuZnVuZGluZyArIGxvY2t1cF9zZWNvbmRzKSkgLy8gc2Vjb25kc19pbl9wZXJpb2QgIyBlbGFwc2VkIHBlcmlvZCBhZnRlciBsb2NrdXAKICAgIGludCAwCiAgICBieXRlICJmdW5kaW5nIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBmdW5kaW5nIGV4aXN0cwogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICAtCiAgICBmcmFtZV9kaWcgMgogICAgLwogICAgLy8gY29udHJhY3QucHk6MzIzCiAgICAvLyByZXR1cm4gKHNlbGYudG90YWwgKiAoeSAtIG0pKSAvLyB5CiAgICBpbnQgMAogICAgYnl0ZSAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHRvdGFsIGV4aXN0cwogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICAtCiAgICAqCiAgICBzd2FwCiAgICAvCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmdldF9hdmFpbGFibGVfYmFsYW5jZSgpIC0+IHVpbnQ2NDoKZ2V0X2F2YWlsYWJsZV9iYWxhbmNlOgogICAgLy8gY29udHJhY3QucHk6MjAwLTIwOAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X2F2YWlsYWJsZV9iYWxhbmNlIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGdldCBhdmFpbGFibGUgYmFsYW5jZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X2F2YWlsYWJsZV9iYWxhbmNlKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gY29udHJhY3QucHk6MjA5CiAgICAvLyBiYWxhbmNlID0gb3AuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGJhbGFuY2UKICAgIC8vIGNvbnRyYWN0LnB5OjIxMAogICAgLy8gbWluX2JhbGFuY2UgPSBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBjb250cmFjdC5weToyMTEKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICAtCiAgICAvLyBjb250cmFjdC5weToyMTIKICAgIC8vIHJldHVybiBhdmFpbGFibGVfYmFsYW5jZQogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcudHJhbnNmZXIob3duZXI6IGJ5dGVzKSAtPiB2b2lkOgp0cmFuc2ZlcjoKICAgIC8vIGNvbnRyYWN0LnB5OjE1Mi0xNjYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHRyYW5zZmVyCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBvd25lciwgbmV3IG93bmVyCiAgICAvLyAjIHB1cnBvc2U6IGNoYW5nZSBvd25lcgogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG9ubHkgY2FsbGFibGUgYnkgdGhlIG93bmVyCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSBuZXcgb3duZXIKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gZmVlIHRha2VuIG91dCBvZiBhbW91bnQgdHJhbnNmZXJlZCB0bwogICAgLy8gIyAgIG93bmVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiB0cmFuc2ZlcihzZWxmLCBvd25lcjogYXJjNC5BZGRyZXNzKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBjb250cmFjdC5weToxNjcKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgzKSkgIyBGdWxsCiAgICBpbnQgMwogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjE2OAogICAgLy8gc2VsZi5yZXF1aXJlX293bmVyKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9vd25lcgogICAgLy8gY29udHJhY3QucHk6MTY5CiAgICAvLyBhc3NlcnQgc2VsZi5vd25lciAhPSBvd25lci5uYXRpdmUsICJuZXcgb3duZXIgbXVzdCBub3QgYmUgb3duZXIiCiAgICBpbnQgMAogICAgYnl0ZSAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIG93bmVyIGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICAhPQogICAgYXNzZXJ0IC8vIG5ldyBvd25lciBtdXN0IG5vdCBiZSBvd25lcgogICAgLy8gY29udHJhY3QucHk6MTcwCiAgICAvLyBzZWxmLm93bmVyID0gb3duZXIubmF0aXZlCiAgICBieXRlICJvd25lciIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmNsb3NlKCkgLT4gdm9pZDoKY2xvc2U6CiAgICAvLyBjb250cmFjdC5weToxNzEtMTg4CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjbG9zZQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogZGVsZXRlcyBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBtYWIgaXMgMAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gY29udHJhY3QgaXMgZGVsZXRlZAogICAgLy8gIyAtIGFjY291bnQgY2xvc2VkIG91dCB0byBvd25lciBpZiBpdCBoYXMgYSBiYWxhbmNlCiAgICAvLyAjIC0gMiBmZWVzCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIHNob3VsZCBiZSBhbGxlZCB3aXRoIG9uQ29tcGxldGlvbgogICAgLy8gIyAgIGRlbGV0ZUFwcGxpY2F0aW9uCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bCiAgICAvLyAgICAgT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbgogICAgLy8gXSkKICAgIC8vIGRlZiBjbG9zZShzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBjb250cmFjdC5weToxODkKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgzKSkgIyBGdWxsCiAgICBpbnQgMwogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjE5MAogICAgLy8gc2VsZi5yZXF1aXJlX293bmVyKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9vd25lcgogICAgLy8gY29udHJhY3QucHk6MTkxCiAgICAvLyBhc3NlcnQgc2VsZi5jYWxjdWxhdGVfbWFiKCkgPT0gMCwgIm1hYiBpcyB6ZXJvIgogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWFiCiAgICAhCiAgICBhc3NlcnQgLy8gbWFiIGlzIHplcm8KICAgIC8vIGNvbnRyYWN0LnB5OjE5MgogICAgLy8gb2NhID0gVHhuLm9uX2NvbXBsZXRpb24KICAgIHR4biBPbkNvbXBsZXRpb24KICAgIC8vIGNvbnRyYWN0LnB5OjE5MwogICAgLy8gaWYgb2NhID09IE9uQ29tcGxldGVBY3Rpb24uRGVsZXRlQXBwbGljYXRpb246CiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBieiBjbG9zZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIGNvbnRyYWN0LnB5OjE5NAogICAgLy8gYXZhaWxhYmxlX2JhbGFuY2UgPSBzZWxmLmdldF9hdmFpbGFibGVfYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9hdmFpbGFibGVfYmFsYW5jZQogICAgLy8gY29udHJhY3QucHk6MTk1CiAgICAvLyBpZiBhdmFpbGFibGVfYmFsYW5jZSA+IDA6CiAgICBieiBjbG9zZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIGNvbnRyYWN0LnB5OjE5Ni0xOTkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1zZWxmLm93bmVyCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBjb250cmFjdC5weToxOTcKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIGNvbnRyYWN0LnB5OjE5OAogICAgLy8gY2xvc2VfcmVtYWluZGVyX3RvPXNlbGYub3duZXIKICAgIGludCAwCiAgICBieXRlICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgb3duZXIgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIGNvbnRyYWN0LnB5OjE5NgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weToxOTYtMTk5CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89c2VsZi5vd25lcgogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCmNsb3NlX2FmdGVyX2lmX2Vsc2VANToKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICAvLyBjb250cmFjdC5weToxOS0yNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogX19pbml0X18gKGJ1aWx0aW4pCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjb25zdHJ1Y3QgaW5pdGlhbCBzdGF0ZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IGluaXRpYWwgc3RhdGUgc2V0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkgICAgICAjIHplcm8gYWRkcmVzcwogICAgYnl0ZSAib3duZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weToyOAogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkgICAgICMgemVybyBhZGRyZXNzCiAgICBieXRlICJmdW5kZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weToyOQogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKSAgICAgICMgMAogICAgYnl0ZSAicGVyaW9kIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTozMAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkgICAgICMgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MzEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKSAgICAgICAjIDAKICAgIGJ5dGUgInRvdGFsIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxNQogICAgbWV0aG9kICJzZXR1cChhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgImNvbmZpZ3VyZSh1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZmlsbCh1aW50NjQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgInBhcnRpY2lwYXRlKGJ5dGVbXSxieXRlW10sdWludDY0LHVpbnQ2NCx1aW50NjQsYnl0ZVtdKXZvaWQiCiAgICBtZXRob2QgIndpdGhkcmF3KHVpbnQ2NCl1aW50NjQiCiAgICBtZXRob2QgIndpdGhkcmF3X21heCgpdWludDY0IgogICAgbWV0aG9kICJ0cmFuc2ZlcihhZGRyZXNzKXZvaWQiCiAgICBtZXRob2QgImNsb3NlKCl2b2lkIgogICAgbWV0aG9kICJzdGF0dXMoKShhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9zZXR1cF9yb3V0ZUA0IG1haW5fY29uZmlndXJlX3JvdXRlQDUgbWFpbl9maWxsX3JvdXRlQDYgbWFpbl9wYXJ0aWNpcGF0ZV9yb3V0ZUA3IG1haW5fd2l0aGRyYXdfcm91dGVAOCBtYWluX3dpdGhkcmF3X21heF9yb3V0ZUA5IG1haW5fdHJhbnNmZXJfcm91dGVAMTAgbWFpbl9jbG9zZV9yb3V0ZUAxMSBtYWluX3N0YXR1c19yb3V0ZUAxMgogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9zZXR1cF9yb3V0ZUA0OgogICAgLy8gY29udHJhY3QucHk6MzUtNDYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNvbnN0cnVjdG9yCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBvd25lciwgd2hvIGlzIHRoZSBiZW5lZmljaWFyeQogICAgLy8gIyAtIGZ1bmRlciwgd2hvIGlzIHRoaXMKICAgIC8vICMgLSB0b3RhbCwgdG90YWwgYW1vdW50IHdpdGhvdXQgbG9ja3VwCiAgICAvLyAjIHB1cnBvc2U6IGNyZWF0ZSBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBvd25lciBpcyBub3QgdGhlIHplcm8gYWRkcmVzcwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IHNldCBvd25lciBhbmQgZnVuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIGNvbnRyYWN0LnB5OjE4CiAgICAvLyBjbGFzcyBTbWFydENvbnRyYWN0U3Rha2luZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gY29udHJhY3QucHk6MzUtNDYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNvbnN0cnVjdG9yCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBvd25lciwgd2hvIGlzIHRoZSBiZW5lZmljaWFyeQogICAgLy8gIyAtIGZ1bmRlciwgd2hvIGlzIHRoaXMKICAgIC8vICMgLSB0b3RhbCwgdG90YWwgYW1vdW50IHdpdGhvdXQgbG9ja3VwCiAgICAvLyAjIHB1cnBvc2U6IGNyZWF0ZSBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBvd25lciBpcyBub3QgdGhlIHplcm8gYWRkcmVzcwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IHNldCBvd25lciBhbmQgZnVuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0dXAKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY29uZmlndXJlX3JvdXRlQDU6CiAgICAvLyBjb250cmFjdC5weTo1NC02NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogY29uZmlndXJlCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBwZXJpb2QsIGxvY2t1cCBwZXJpb2QKICAgIC8vICMgcHVycG9zZTogc2V0IGxvY2t1cCBwZXJpb2QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBmdW5kZXIgYW5kIG93bmVyIGluaXRpYWxpemVkCiAgICAvLyAjIC0gcGVyaW9kIDAKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBzZXQgb3duZXIgYW5kIGZ1bmRlcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIGNvbnRyYWN0LnB5OjU0LTY0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjb25maWd1cmUKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHBlcmlvZCwgbG9ja3VwIHBlcmlvZAogICAgLy8gIyBwdXJwb3NlOiBzZXQgbG9ja3VwIHBlcmlvZAogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIGZ1bmRlciBhbmQgb3duZXIgaW5pdGlhbGl6ZWQKICAgIC8vICMgLSBwZXJpb2QgMAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IHNldCBvd25lciBhbmQgZnVuZGVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY29uZmlndXJlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2ZpbGxfcm91dGVANjoKICAgIC8vIGNvbnRyYWN0LnB5OjcyLTg5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBmaWxsCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSB0b3RhbCwgaG93IG11Y2ggdG8gZmlsbAogICAgLy8gIyBwdXJwb3NlOiBmdW5kIGl0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gcGVyaW9kIG11c3QgYmUgc2V0CiAgICAvLyAjIC0gZnVuZGluZyBhbmQgdG90YWwgbXVzdCBiZSB1bmluaXRpYWxpemVkCiAgICAvLyAjIC0gbXVzdCBiZSBwcmVjZWRlZCBieSBwYXltZW50IHRyYW5zYWN0aW9uCiAgICAvLyAjICAgZm9yIHRvdGFsIGFtb3VudAogICAgLy8gIyAtIG11c3QgYmUgb25seSBjYWxsYWJsZSBieSBmdW5kZXIKICAgIC8vICMgLSBmdW5kaW5nIG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIHRvdGFsIGFuZCBmdW5kaW5nIGFyZSBzZXQgdG8gYXJndW1lbnRzCiAgICAvLyAjIC0gbG9ja3VwX2VuZCBhbmQgdmVzdGluZ19lbmQgYXJlIHNldCBmcm9tCiAgICAvLyAjICAgZnVuZGluZyBhbmQgcGVyaW9kCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIGNvbnRyYWN0LnB5OjE4CiAgICAvLyBjbGFzcyBTbWFydENvbnRyYWN0U3Rha2luZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gY29udHJhY3QucHk6NzItODkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGZpbGwKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHRvdGFsLCBob3cgbXVjaCB0byBmaWxsCiAgICAvLyAjIHB1cnBvc2U6IGZ1bmQgaXQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBwZXJpb2QgbXVzdCBiZSBzZXQKICAgIC8vICMgLSBmdW5kaW5nIGFuZCB0b3RhbCBtdXN0IGJlIHVuaW5pdGlhbGl6ZWQKICAgIC8vICMgLSBtdXN0IGJlIHByZWNlZGVkIGJ5IHBheW1lbnQgdHJhbnNhY3Rpb24KICAgIC8vICMgICBmb3IgdG90YWwgYW1vdW50CiAgICAvLyAjIC0gbXVzdCBiZSBvbmx5IGNhbGxhYmxlIGJ5IGZ1bmRlcgogICAgLy8gIyAtIGZ1bmRpbmcgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdG90YWwgYW5kIGZ1bmRpbmcgYXJlIHNldCB0byBhcmd1bWVudHMKICAgIC8vICMgLSBsb2NrdXBfZW5kIGFuZCB2ZXN0aW5nX2VuZCBhcmUgc2V0IGZyb20KICAgIC8vICMgICBmdW5kaW5nIGFuZCBwZXJpb2QKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBmaWxsCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3BhcnRpY2lwYXRlX3JvdXRlQDc6CiAgICAvLyBjb250cmFjdC5weToxMDQtMTIxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBwYXJ0aWNpcGF0ZQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0ga2V5IHJlZ2lzdHJhdGlvbiBwYXJhbXMKICAgIC8vICMgcHVycG9zZTogYWxsb3cgY29udHJhY3QgdG8gcGFydGljcGF0ZSBpbgogICAgLy8gIyAgICAgICAgICBjb25zZW5zdXMKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBtdXN0IGJlIGNhbGxhYmxlIGJ5IG93bmVyIG9ubHkKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIGNvbnRyYWN0IGdlbmVyYXRlcyBpdG54IGZvciBrZXlyZWcKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gMiBmZWVzLCBwYWlkIGJ5IHRoZSBjYWxsZXIgdGhyb3VnaCBmZWUKICAgIC8vICMgICBwb29saW5nCiAgICAvLyAjIC0gaXR4biBmZWUgaXMgemVybyBzbyB0aGUgY29udHJhY3QgYWNjb3VudCBpcwogICAgLy8gIyAgIG5ldmVyIGRyYWluZWQgaW50byBmZWVzIGFuZCBNQUIgaXMgbm90CiAgICAvLyAjICAgcmVsZXZhbnQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIFNtYXJ0Q29udHJhY3RTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDYKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBjb250cmFjdC5weToxMDQtMTIxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBwYXJ0aWNpcGF0ZQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0ga2V5IHJlZ2lzdHJhdGlvbiBwYXJhbXMKICAgIC8vICMgcHVycG9zZTogYWxsb3cgY29udHJhY3QgdG8gcGFydGljcGF0ZSBpbgogICAgLy8gIyAgICAgICAgICBjb25zZW5zdXMKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBtdXN0IGJlIGNhbGxhYmxlIGJ5IG93bmVyIG9ubHkKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIGNvbnRyYWN0IGdlbmVyYXRlcyBpdG54IGZvciBrZXlyZWcKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gMiBmZWVzLCBwYWlkIGJ5IHRoZSBjYWxsZXIgdGhyb3VnaCBmZWUKICAgIC8vICMgICBwb29saW5nCiAgICAvLyAjIC0gaXR4biBmZWUgaXMgemVybyBzbyB0aGUgY29udHJhY3QgYWNjb3VudCBpcwogICAgLy8gIyAgIG5ldmVyIGRyYWluZWQgaW50byBmZWVzIGFuZCBNQUIgaXMgbm90CiAgICAvLyAjICAgcmVsZXZhbnQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwYXJ0aWNpcGF0ZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl93aXRoZHJhd19yb3V0ZUA4OgogICAgLy8gY29udHJhY3QucHk6MTM0LTE1MwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXcKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGFtb3VudAogICAgLy8gIyByZXR1cm5zOgogICAgLy8gIyAtIG1hYgogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGZ1bmRzIGZyb20gY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IG93bmVyCiAgICAvLyAjIC0gbGV0IGJhbGFuY2UgYmUgdGhlIGN1cnJlbnQgYmFsYW5jZSBvZiB0aGUKICAgIC8vICMgICBjb250cmFjdAogICAgLy8gIyAtIGJhbGFuY2UgLSBhbW91bnQgPj0gbWFiCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0cmFuc2ZlciBhbW91bnQgZnJvbSB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyAgIHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIDIgZmVlcywgcGFpZCBieSB0aGUgY2FsbGVyIHRocm91Z2ggZmVlCiAgICAvLyAjICAgcG9vbGluZwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIGNvbnRyYWN0LnB5OjEzNC0xNTMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHdpdGhkcmF3CiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBhbW91bnQKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBtYWIKICAgIC8vICMgcHVycG9zZTogZXh0cmFjdCBmdW5kcyBmcm9tIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSBvd25lcgogICAgLy8gIyAtIGxldCBiYWxhbmNlIGJlIHRoZSBjdXJyZW50IGJhbGFuY2Ugb2YgdGhlCiAgICAvLyAjICAgY29udHJhY3QKICAgIC8vICMgLSBiYWxhbmNlIC0gYW1vdW50ID49IG1hYgogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdHJhbnNmZXIgYW1vdW50IGZyb20gdGhlIGNvbnRyYWN0IGFjY291bnQKICAgIC8vICMgICB0byBvd25lcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSAyIGZlZXMsIHBhaWQgYnkgdGhlIGNhbGxlciB0aHJvdWdoIGZlZQogICAgLy8gIyAgIHBvb2xpbmcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl93aXRoZHJhd19tYXhfcm91dGVAOToKICAgIC8vIGNvbnRyYWN0LnB5OjE2Ny0xODgKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHdpdGhkcmF3X21heAogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBhbW91bnQgd2l0aGRyYXduCiAgICAvLyAjIHB1cnBvc2U6IGV4dHJhY3QgYWxsIGZ1bmRzIGFib3ZlIG1hYiBmcm9tCiAgICAvLyAjICAgICAgICAgIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSBvd25lcgogICAgLy8gIyAtIGxldCBiYWxhbmNlIGJlIHRoZSBjdXJyZW50IGJhbGFuY2Ugb2YgdGhlCiAgICAvLyAjICAgY29udHJhY3QKICAgIC8vICMgLSBiYWxhbmNlID49IG1hYgogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdHJhbnNmZXIgYmFsYW5jZSAtIG1hYiBmcm9tIHRoZSBjb250cmFjdAogICAgLy8gIyAgIGFjY291bnQgdG8gb3duZXIKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gc2FtZSBjaGVja3MgYXMgd2l0aGRyYXcgd2l0aCB0aGUgYW1vdW50CiAgICAvLyAjICAgY29tcHV0ZWQgb24tY2hhaW4KICAgIC8vICMgLSAyIGZlZXMsIHBhaWQgYnkgdGhlIGNhbGxlciB0aHJvdWdoIGZlZQogICAgLy8gIyAgIHBvb2xpbmcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB3aXRoZHJhd19tYXgKICAgIGl0b2IKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfcm91dGVAMTA6CiAgICAvLyBjb250cmFjdC5weToyMDMtMjE3CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiB0cmFuc2ZlcgogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gb3duZXIsIG5ldyBvd25lcgogICAgLy8gIyBwdXJwb3NlOiBjaGFuZ2Ugb3duZXIKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IHRoZSBvd25lcgogICAgLy8gIyAtIG5ldyBvd25lciBpcyBub3QgdGhlIHplcm8gYWRkcmVzcwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gbmV3IG93bmVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIGZlZSB0YWtlbiBvdXQgb2YgYW1vdW50IHRyYW5zZmVyZWQgdG8KICAgIC8vICMgICBvd25lcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgU21hcnRDb250cmFjdFN0YWtpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIGNvbnRyYWN0LnB5OjIwMy0yMTcKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHRyYW5zZmVyCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBvd25lciwgbmV3IG93bmVyCiAgICAvLyAjIHB1cnBvc2U6IGNoYW5nZSBvd25lcgogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG9ubHkgY2FsbGFibGUgYnkgdGhlIG93bmVyCiAgICAvLyAjIC0gbmV3IG93bmVyIGlzIG5vdCB0aGUgemVybyBhZGRyZXNzCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSBuZXcgb3duZXIKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gZmVlIHRha2VuIG91dCBvZiBhbW91bnQgdHJhbnNmZXJlZCB0bwogICAgLy8gIyAgIG93bmVyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgdHJhbnNmZXIKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY2xvc2Vfcm91dGVAMTE6CiAgICAvLyBjb250cmFjdC5weToyMjQtMjQxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjbG9zZQogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcHVycG9zZTogZGVsZXRlcyBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBtYWIgaXMgMAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gY29udHJhY3QgaXMgZGVsZXRlZAogICAgLy8gIyAtIGFjY291bnQgY2xvc2VkIG91dCB0byBvd25lciBpZiBpdCBoYXMgYSBiYWxhbmNlCiAgICAvLyAjIC0gMiBmZWVzLCBwYWlkIGJ5IHRoZSBjYWxsZXIgdGhyb3VnaCBmZWUKICAgIC8vICMgICBwb29saW5nCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIHNob3VsZCBiZSBhbGxlZCB3aXRoIG9uQ29tcGxldGlvbgogICAgLy8gIyAgIGRlbGV0ZUFwcGxpY2F0aW9uCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bCiAgICAvLyAgICAgT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbgogICAgLy8gXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludCBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNsb3NlCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3N0YXR1c19yb3V0ZUAxMjoKICAgIC8vIGNvbnRyYWN0LnB5OjI1NS0yNzEKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHN0YXR1cwogICAgLy8gIyBhcmd1bWVudHM6IE5vbmUKICAgIC8vICMgcmV0dXJuczoKICAgIC8vICMgLSBvd25lciwgZnVuZGVyLCBwZXJpb2QsIGZ1bmRpbmcsIHRvdGFsLAogICAgLy8gIyAgIG1hYiwgYXZhaWxhYmxlIGJhbGFuY2UsIHN0ZXAKICAgIC8vICMgcHVycG9zZTogcmVhZCBzdGF0ZSwgbWFiIGFuZCBhdmFpbGFibGUKICAgIC8vICMgICAgICAgICAgYmFsYW5jZSBpbiBvbmUgc2ltdWxhdGVkIGNhbGwKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIHJlYWRvbmx5LCBjYWxsYWJsZSBpbiBhbnkgc3RlcAogICAgLy8gIyAtIGF2YWlsYWJsZSBiYWxhbmNlIGlzIDAgd2hpbGUgdGhlIGJhbGFuY2UKICAgIC8vICMgICBpcyBiZWxvdyB0aGUgbWluaW11bSBiYWxhbmNlLCBlLmcuIHJpZ2h0CiAgICAvLyAjICAgYWZ0ZXIgY3JlYXRpb24KICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBzdGF0dXMKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDE1OgogICAgLy8gY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIFNtYXJ0Q29udHJhY3RTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGlzIGNyZWF0aW5nCiAgICBpbnQgMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcuc2V0dXAob3duZXI6IGJ5dGVzKSAtPiB2b2lkOgpzZXR1cDoKICAgIC8vIGNvbnRyYWN0LnB5OjM1LTQ3CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjb25zdHJ1Y3RvcgogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gb3duZXIsIHdobyBpcyB0aGUgYmVuZWZpY2lhcnkKICAgIC8vICMgLSBmdW5kZXIsIHdobyBpcyB0aGlzCiAgICAvLyAjIC0gdG90YWwsIHRvdGFsIGFtb3VudCB3aXRob3V0IGxvY2t1cAogICAgLy8gIyBwdXJwb3NlOiBjcmVhdGUgY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gb3duZXIgaXMgbm90IHRoZSB6ZXJvIGFkZHJlc3MKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBzZXQgb3duZXIgYW5kIGZ1bmRlcgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0dXAoc2VsZiwgb3duZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gY29udHJhY3QucHk6NDgKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgwKSkgIyBOb24tZXhpc3RhbnQKICAgIGludCAwCiAgICBjYWxsc3ViIGVuZm9yY2Vfc3RlcAogICAgLy8gY29udHJhY3QucHk6NDkKICAgIC8vIHNlbGYucmVxdWlyZV9jcmVhdG9yKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9jcmVhdG9yCiAgICAvLyBjb250cmFjdC5weTo1MAogICAgLy8gYXNzZXJ0IG93bmVyLm5hdGl2ZSAhPSBHbG9iYWwuemVyb19hZGRyZXNzLCAib3duZXIgbXVzdCBiZSBpbml0aWFsaXplZCIKICAgIGZyYW1lX2RpZyAtMQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIG93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQKICAgIC8vIGNvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLmZ1bmRlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGUgImZ1bmRlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTo1MgogICAgLy8gc2VsZi5vd25lciA9IG93bmVyLm5hdGl2ZQogICAgYnl0ZSAib3duZXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTo1MwogICAgLy8gc2VsZi5zdGVwID0gVUludDY0KDEpICMgRnJlc2gKICAgIGJ5dGUgInN0ZXAiCiAgICBpbnQgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmVuZm9yY2Vfc3RlcChuOiB1aW50NjQpIC0+IHZvaWQ6CmVuZm9yY2Vfc3RlcDoKICAgIC8vIGNvbnRyYWN0LnB5OjM3MS0zOTMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGVuZm9yY2Vfc3RlcCAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czoKICAgIC8vICMgLSBzdGVwLCB3aGF0IHN0ZXAgdG8gZW5mb3JjZQogICAgLy8gIyBwdXJwb3NlOgogICAgLy8gIyAtIGVuZm9yY2UgdGhhdCBtZXRob2QgbWF5IGJlIGFsbG93ZWQgaW4gc3RlcAogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gc3RlcHM6CiAgICAvLyAjICAgMCBOb24tZXhpc3RlbnQsIG5vdGhpbmcgaW5pdGlhbGl6ZWQKICAgIC8vICMgICAxIEZyZXNoLCBmdW5kZXIgYW5kIG93bmVyIGluaXRpYWxpemVkCiAgICAvLyAjICAgMiBSZWFkeSwgcGVyaW9kIGluaXRpYWxpemVkCiAgICAvLyAjICAgMyBGdWxsLCBmdW5kaW5nIGFuZCB0b3RhbCBpbml0aWFsaXplZAogICAgLy8gIyAtIEZyZXNoIGlzIGFsc28gUmVhZHkgc2luY2UgcGVyaW9kIDAgaXMKICAgIC8vICMgICB3aXRoaW4gYm91bmRzCiAgICAvLyAjIC0gc2V0dXAsIGNvbmZpZ3VyZSwgZmlsbCBhbmQgdHJhbnNmZXIKICAgIC8vICMgICBhc3NlcnQgd2hhdCB0aGUgc3RlcCBpbXBsaWVzOiBmdW5kZXIgaXMKICAgIC8vICMgICBjcmVhdG9yLCBvd25lciBpcyBzZXQsIHBlcmlvZCA8PSA1LAogICAgLy8gIyAgIGZ1bmRpbmcgYW5kIHRvdGFsID4gMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBlbmZvcmNlX3N0ZXAoc2VsZiwgbjogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBjb250cmFjdC5weTozOTQKICAgIC8vIHN0ZXAgPSBzZWxmLnN0ZXAKICAgIGludCAwCiAgICBieXRlICJzdGVwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzdGVwIGV4aXN0cwogICAgLy8gY29udHJhY3QucHk6Mzk1LTQwMwogICAgLy8gbWF0Y2ggbjoKICAgIC8vICAgICBjYXNlIFVJbnQ2NCgwKTogIyBOb24tZXhpc3RlbnQKICAgIC8vICAgICAgICAgYXNzZXJ0IHN0ZXAgPT0gMCwgInN0ZXAgbXVzdCBiZSBub24tZXhpc3RlbnQiCiAgICAvLyAgICAgY2FzZSBVSW50NjQoMSk6ICMgRnJlc2gKICAgIC8vICAgICAgICAgYXNzZXJ0IHN0ZXAgPT0gMSwgInN0ZXAgbXVzdCBiZSBmcmVzaCIKICAgIC8vICAgICBjYXNlIFVJbnQ2NCgyKTogIyBSZWFkeQogICAgLy8gICAgICAgICBhc3NlcnQgc3RlcCA9PSAxIG9yIHN0ZXAgPT0gMiwgInN0ZXAgbXVzdCBiZSByZWFkeSIKICAgIC8vICAgICBjYXNlIFVJbnQ2NCgzKTogIyBGdWxsCiAgICAvLyAgICAgICAgIGFzc2VydCBzdGVwID09IDMsICJzdGVwIG11c3QgYmUgZnVsbCIKICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV8wQDEgZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlXzFAMiBlbmZvcmNlX3N0ZXBfc3dpdGNoX2Nhc2VfMkAzIGVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV8zQDgKICAgIHJldHN1YgoKZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlXzBAMToKICAgIC8vIGNvbnRyYWN0LnB5OjM5NwogICAgLy8gYXNzZXJ0IHN0ZXAgPT0gMCwgInN0ZXAgbXVzdCBiZSBub24tZXhpc3RlbnQiCiAgICBmcmFtZV9kaWcgMAogICAgIQogICAgYXNzZXJ0IC8vIHN0ZXAgbXVzdCBiZSBub24tZXhpc3RlbnQKICAgIGIgZW5mb3JjZV9zdGVwX3N3aXRjaF9jYXNlX25leHRAMTAKCmVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV8xQDI6CiAgICAvLyBjb250cmFjdC5weTozOTkKICAgIC8vIGFzc2VydCBzdGVwID09IDEsICJzdGVwIG11c3QgYmUgZnJlc2giCiAgICBmcmFtZV9kaWcgMAogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gc3RlcCBtdXN0IGJlIGZyZXNoCiAgICBiIGVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV9uZXh0QDEwCgplbmZvcmNlX3N0ZXBfc3dpdGNoX2Nhc2VfMkAzOgogICAgLy8gY29udHJhY3QucHk6NDAxCiAgICAvLyBhc3NlcnQgc3RlcCA9PSAxIG9yIHN0ZXAgPT0gMiwgInN0ZXAgbXVzdCBiZSByZWFkeSIKICAgIGZyYW1lX2RpZyAwCiAgICBpbnQgMQogICAgPT0KICAgIGJueiBlbmZvcmNlX3N0ZXBfYm9vbF90cnVlQDUKICAgIGZyYW1lX2RpZyAwCiAgICBpbnQgMgogICAgPT0KICAgIGJ6IGVuZm9yY2Vfc3RlcF9ib29sX2ZhbHNlQDYKCmVuZm9yY2Vfc3RlcF9ib29sX3RydWVANToKICAgIGludCAxCiAgICBiIGVuZm9yY2Vfc3RlcF9ib29sX21lcmdlQDcKCmVuZm9yY2Vfc3RlcF9ib29sX2ZhbHNlQDY6CiAgICBpbnQgMAoKZW5mb3JjZV9zdGVwX2Jvb2xfbWVyZ2VANzoKICAgIC8vIGNvbnRyYWN0LnB5OjQwMQogICAgLy8gYXNzZXJ0IHN0ZXAgPT0gMSBvciBzdGVwID09IDIsICJzdGVwIG11c3QgYmUgcmVhZHkiCiAgICBhc3NlcnQgLy8gc3RlcCBtdXN0IGJlIHJlYWR5CiAgICBiIGVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV9uZXh0QDEwCgplbmZvcmNlX3N0ZXBfc3dpdGNoX2Nhc2VfM0A4OgogICAgLy8gY29udHJhY3QucHk6NDAzCiAgICAvLyBhc3NlcnQgc3RlcCA9PSAzLCAic3RlcCBtdXN0IGJlIGZ1bGwiCiAgICBmcmFtZV9kaWcgMAogICAgaW50IDMKICAgID09CiAgICBhc3NlcnQgLy8gc3RlcCBtdXN0IGJlIGZ1bGwKCmVuZm9yY2Vfc3RlcF9zd2l0Y2hfY2FzZV9uZXh0QDEwOgogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcucmVxdWlyZV9jcmVhdG9yKCkgLT4gdm9pZDoKcmVxdWlyZV9jcmVhdG9yOgogICAgLy8gY29udHJhY3QucHk6MzQxLTM0OQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcmVxdWlyZV9jcmVhdG9yIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGNoZWNrIHRoYXQgc2VuZGVyIGlzIGNyZWF0b3IKICAgIC8vICMgcHJlLWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlcXVpcmVfY3JlYXRvcihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBjb250cmFjdC5weTozNTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsICJtdXN0IGJlIGNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBjcmVhdG9yCiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5jb25maWd1cmUocGVyaW9kOiBieXRlcykgLT4gdm9pZDoKY29uZmlndXJlOgogICAgLy8gY29udHJhY3QucHk6NTQtNjUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNvbmZpZ3VyZQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gcGVyaW9kLCBsb2NrdXAgcGVyaW9kCiAgICAvLyAjIHB1cnBvc2U6IHNldCBsb2NrdXAgcGVyaW9kCiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gZnVuZGVyIGFuZCBvd25lciBpbml0aWFsaXplZAogICAgLy8gIyAtIHBlcmlvZCAwCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogc2V0IG93bmVyIGFuZCBmdW5kZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGNvbmZpZ3VyZShzZWxmLCBwZXJpb2Q6IGFyYzQuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBjb250cmFjdC5weTo2NgogICAgLy8gc2VsZi5lbmZvcmNlX3N0ZXAoVUludDY0KDEpKSAjIEZyZXNoCiAgICBpbnQgMQogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjY3CiAgICAvLyBzZWxmLnJlcXVpcmVfb3duZXIoKQogICAgY2FsbHN1YiByZXF1aXJlX293bmVyCiAgICAvLyBjb250cmFjdC5weTo2OAogICAgLy8gYXNzZXJ0IHBlcmlvZCA+IDAsICJwZXJpb2QgbXVzdCBiZSBncmVhdGVyIHRoYW4gMCIKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBhc3NlcnQgLy8gcGVyaW9kIG11c3QgYmUgZ3JlYXRlciB0aGFuIDAKICAgIC8vIGNvbnRyYWN0LnB5OjY5CiAgICAvLyBhc3NlcnQgcGVyaW9kIDw9IDUsICJwZXJpb2QgbXVzdCBiZSBsZXNzIHRoYW4gb3IgZXF1YWwgdG8gNSIKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDUKICAgIGI8PQogICAgYXNzZXJ0IC8vIHBlcmlvZCBtdXN0IGJlIGxlc3MgdGhhbiBvciBlcXVhbCB0byA1CiAgICAvLyBjb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5wZXJpb2QgPSBwZXJpb2QubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGJ5dGUgInBlcmlvZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTo3MQogICAgLy8gc2VsZi5zdGVwID0gVUludDY0KDIpICMgUmVhZHkKICAgIGJ5dGUgInN0ZXAiCiAgICBpbnQgMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLnJlcXVpcmVfb3duZXIoKSAtPiB2b2lkOgpyZXF1aXJlX293bmVyOgogICAgLy8gY29udHJhY3QucHk6MzYxLTM2OQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogcmVxdWlyZV9vd25lciAoaW50ZXJuYWwpCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjaGVjayB0aGF0IHNlbmRlciBpcyBvd25lcgogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9vd25lcihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBjb250cmFjdC5weTozNzAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYub3duZXIsICJtdXN0IGJlIG93bmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIGJ5dGUgIm93bmVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBvd25lciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gbXVzdCBiZSBvd25lcgogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcuZmlsbCh0b3RhbDogYnl0ZXMsIGZ1bmRpbmc6IGJ5dGVzKSAtPiB2b2lkOgpmaWxsOgogICAgLy8gY29udHJhY3QucHk6NzItOTAKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGZpbGwKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIHRvdGFsLCBob3cgbXVjaCB0byBmaWxsCiAgICAvLyAjIHB1cnBvc2U6IGZ1bmQgaXQKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBwZXJpb2QgbXVzdCBiZSBzZXQKICAgIC8vICMgLSBmdW5kaW5nIGFuZCB0b3RhbCBtdXN0IGJlIHVuaW5pdGlhbGl6ZWQKICAgIC8vICMgLSBtdXN0IGJlIHByZWNlZGVkIGJ5IHBheW1lbnQgdHJhbnNhY3Rpb24KICAgIC8vICMgICBmb3IgdG90YWwgYW1vdW50CiAgICAvLyAjIC0gbXVzdCBiZSBvbmx5IGNhbGxhYmxlIGJ5IGZ1bmRlcgogICAgLy8gIyAtIGZ1bmRpbmcgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6CiAgICAvLyAjIC0gdG90YWwgYW5kIGZ1bmRpbmcgYXJlIHNldCB0byBhcmd1bWVudHMKICAgIC8vICMgLSBsb2NrdXBfZW5kIGFuZCB2ZXN0aW5nX2VuZCBhcmUgc2V0IGZyb20KICAgIC8vICMgICBmdW5kaW5nIGFuZCBwZXJpb2QKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGZpbGwoc2VsZiwgdG90YWw6IGFyYzQuVUludDY0LCBmdW5kaW5nOiBhcmM0LlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gY29udHJhY3QucHk6OTEKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgyKSkgIyBSZWFkeQogICAgaW50IDIKICAgIGNhbGxzdWIgZW5mb3JjZV9zdGVwCiAgICAvLyBjb250cmFjdC5weTo5MgogICAgLy8gc2VsZi5yZXF1aXJlX2Z1bmRlcigpCiAgICBjYWxsc3ViIHJlcXVpcmVfZnVuZGVyCiAgICAvLyBjb250cmFjdC5weTo5MwogICAgLy8gc2VsZi5yZXF1aXJlX3BheW1lbnQoc2VsZi5mdW5kZXIsIHRvdGFsLm5hdGl2ZSkKICAgIGludCAwCiAgICBieXRlICJmdW5kZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGZ1bmRlciBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIHJlcXVpcmVfcGF5bWVudAogICAgLy8gY29udHJhY3QucHk6OTQKICAgIC8vIGFzc2VydCB0b3RhbCA+IDAsICJwYXltZW50IGlzIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0yCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBwYXltZW50IGlzIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBjb250cmFjdC5weTo5NQogICAgLy8gYXNzZXJ0IGZ1bmRpbmcgPiAwLCAiZnVuZGluZyBtdXN0IGJlIGluaXRpYWxpemVkIgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj4KICAgIGFzc2VydCAvLyBmdW5kaW5nIG11c3QgYmUgaW5pdGlhbGl6ZWQKICAgIC8vIGNvbnRyYWN0LnB5Ojk2CiAgICAvLyBzZWxmLnRvdGFsID0gdG90YWwubmF0aXZlCiAgICBieXRlICJ0b3RhbCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTo5NwogICAgLy8gc2VsZi5mdW5kaW5nID0gZnVuZGluZy5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgYnRvaQogICAgYnl0ZSAiZnVuZGluZyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6OTgKICAgIC8vIHNlY29uZHNfaW5fcGVyaW9kID0gVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKQogICAgaW50IFRNUExfUEVSSU9EX1NFQ09ORFMKICAgIC8vIGNvbnRyYWN0LnB5Ojk5CiAgICAvLyBwID0gVGVtcGxhdGVWYXJbVUludDY0XSgiTE9DS1VQX0RFTEFZIikgKiBzZWxmLnBlcmlvZCAjIGxvY2t1cCBwZXJpb2QKICAgIGludCAwCiAgICBieXRlICJwZXJpb2QiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHBlcmlvZCBleGlzdHMKICAgIGludCBUTVBMX0xPQ0tVUF9ERUxBWQogICAgKgogICAgLy8gY29udHJhY3QucHk6MTAwCiAgICAvLyBsb2NrdXBfZW5kID0gZnVuZGluZy5uYXRpdmUgKyBwICogc2Vjb25kc19pbl9wZXJpb2QKICAgIGRpZyAxCiAgICAqCiAgICB1bmNvdmVyIDIKICAgICsKICAgIC8vIGNvbnRyYWN0LnB5OjEwMQogICAgLy8gc2VsZi5sb2NrdXBfZW5kID0gbG9ja3VwX2VuZAogICAgYnl0ZSAibG9ja3VwX2VuZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MTAyCiAgICAvLyBzZWxmLnZlc3RpbmdfZW5kID0gbG9ja3VwX2VuZCArIFRlbXBsYXRlVmFyW1VJbnQ2NF0oIlZFU1RJTkdfREVMQVkiKSAqIHNlY29uZHNfaW5fcGVyaW9kCiAgICBpbnQgVE1QTF9WRVNUSU5HX0RFTEFZCiAgICB1bmNvdmVyIDIKICAgICoKICAgICsKICAgIGJ5dGUgInZlc3RpbmdfZW5kIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5OjEwMwogICAgLy8gc2VsZi5zdGVwID0gVUludDY0KDMpICMgRnVsbAogICAgYnl0ZSAic3RlcCIKICAgIGludCAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcucmVxdWlyZV9mdW5kZXIoKSAtPiB2b2lkOgpyZXF1aXJlX2Z1bmRlcjoKICAgIC8vIGNvbnRyYWN0LnB5OjM1MS0zNTkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IHJlcXVpcmVfZnVuZGVyIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGNoZWNrIHRoYXQgc2VuZGVyIGlzIGZ1bmRlcgogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVxdWlyZV9mdW5kZXIoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gY29udHJhY3QucHk6MzYwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmZ1bmRlciwgIm11c3QgYmUgZnVuZGVyIgogICAgdHhuIFNlbmRlcgogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBtdXN0IGJlIGZ1bmRlcgogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcucmVxdWlyZV9wYXltZW50KHdobzogYnl0ZXMsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpyZXF1aXJlX3BheW1lbnQ6CiAgICAvLyBjb250cmFjdC5weTozMjEtMzM2CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiByZXF1aXJlX3BheW1lbnQgKGludGVybmFsKQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0gd2hvLCBwYXltZW50IHNlbmRlcgogICAgLy8gIyAtIGFtb3VudCwgcGF5bWVudCBhbW91bnQKICAgIC8vICMgcHVycG9zZTogY2hlY2sgcGF5bWVudAogICAgLy8gIyBwcmUtY29uZGl0aW9uczoKICAgIC8vICMgLSBwYXltZW50IGlzIHRoZSB0cmFuc2FjdGlvbiByaWdodCBiZWZvcmUKICAgIC8vICMgICB0aGlzIGFwcCBjYWxsIGluIHRoZSBncm91cAogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gcmVsYXRpdmUgaW5kZXggbGV0cyBzZXZlcmFsIHBheW1lbnQgYW5kCiAgICAvLyAjICAgYXBwIGNhbGwgcGFpcnMgc2hhcmUgb25lIGdyb3VwCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIHJlcXVpcmVfcGF5bWVudChzZWxmLCB3aG86IEFjY291bnQsIGFtb3VudDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBjb250cmFjdC5weTozMzcKICAgIC8vIHBheW1lbnQgPSBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihUeG4uZ3JvdXBfaW5kZXggLSAxKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBjb250cmFjdC5weTozMzgKICAgIC8vIGFzc2VydCBwYXltZW50LnNlbmRlciA9PSB3aG8sICJwYXltZW50IHNlbmRlciBhY2N1cmF0ZSIKICAgIGR1cAogICAgZ3R4bnMgU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICBhc3NlcnQgLy8gcGF5bWVudCBzZW5kZXIgYWNjdXJhdGUKICAgIC8vIGNvbnRyYWN0LnB5OjMzOQogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IGFtb3VudCwgInBheW1lbnQgYW1vdW50IGFjY3VyYXRlIgogICAgZHVwCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGFzc2VydCAvLyBwYXltZW50IGFtb3VudCBhY2N1cmF0ZQogICAgLy8gY29udHJhY3QucHk6MzQwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAicGF5bWVudCByZWNlaXZlciBhY2N1cmF0ZSIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBwYXltZW50IHJlY2VpdmVyIGFjY3VyYXRlCiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5wYXJ0aWNpcGF0ZSh2b3RlX2s6IGJ5dGVzLCBzZWxfazogYnl0ZXMsIHZvdGVfZnN0OiBieXRlcywgdm90ZV9sc3Q6IGJ5dGVzLCB2b3RlX2tkOiBieXRlcywgc3Bfa2V5OiBieXRlcykgLT4gdm9pZDoKcGFydGljaXBhdGU6CiAgICAvLyBjb250cmFjdC5weToxMDQtMTIyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBwYXJ0aWNpcGF0ZQogICAgLy8gIyBhcmd1bWVudHM6CiAgICAvLyAjIC0ga2V5IHJlZ2lzdHJhdGlvbiBwYXJhbXMKICAgIC8vICMgcHVycG9zZTogYWxsb3cgY29udHJhY3QgdG8gcGFydGljcGF0ZSBpbgogICAgLy8gIyAgICAgICAgICBjb25zZW5zdXMKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBtdXN0IGJlIGNhbGxhYmxlIGJ5IG93bmVyIG9ubHkKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIGNvbnRyYWN0IGdlbmVyYXRlcyBpdG54IGZvciBrZXlyZWcKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gMiBmZWVzLCBwYWlkIGJ5IHRoZSBjYWxsZXIgdGhyb3VnaCBmZWUKICAgIC8vICMgICBwb29saW5nCiAgICAvLyAjIC0gaXR4biBmZWUgaXMgemVybyBzbyB0aGUgY29udHJhY3QgYWNjb3VudCBpcwogICAgLy8gIyAgIG5ldmVyIGRyYWluZWQgaW50byBmZWVzIGFuZCBNQUIgaXMgbm90CiAgICAvLyAjICAgcmVsZXZhbnQKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBhcnRpY2lwYXRlKHNlbGYsIHZvdGVfazogQnl0ZXMsIHNlbF9rOiBCeXRlcywgdm90ZV9mc3Q6IGFyYzQuVUludDY0LCB2b3RlX2xzdDogYXJjNC5VSW50NjQsIHZvdGVfa2Q6IGFyYzQuVUludDY0LCBzcF9rZXk6IEJ5dGVzKSAtPiBOb25lOgogICAgcHJvdG8gNiAwCiAgICAvLyBjb250cmFjdC5weToxMjMKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgzKSkgIyBGdWxsCiAgICBpbnQgMwogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjEyNAogICAgLy8gc2VsZi5yZXF1aXJlX293bmVyKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9vd25lcgogICAgLy8gY29udHJhY3QucHk6MTI1LTEzMwogICAgLy8gaXR4bi5LZXlSZWdpc3RyYXRpb24oCiAgICAvLyAgICAgdm90ZV9rZXk9dm90ZV9rLAogICAgLy8gICAgIHNlbGVjdGlvbl9rZXk9c2VsX2ssCiAgICAvLyAgICAgdm90ZV9maXJzdD12b3RlX2ZzdC5uYXRpdmUsCiAgICAvLyAgICAgdm90ZV9sYXN0PXZvdGVfbHN0Lm5hdGl2ZSwKICAgIC8vICAgICB2b3RlX2tleV9kaWx1dGlvbj12b3RlX2tkLm5hdGl2ZSwKICAgIC8vICAgICBzdGF0ZV9wcm9vZl9rZXk9c3Bfa2V5LAogICAgLy8gICAgIGZlZT0wCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBjb250cmFjdC5weToxMjgKICAgIC8vIHZvdGVfZmlyc3Q9dm90ZV9mc3QubmF0aXZlLAogICAgZnJhbWVfZGlnIC00CiAgICBidG9pCiAgICAvLyBjb250cmFjdC5weToxMjkKICAgIC8vIHZvdGVfbGFzdD12b3RlX2xzdC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjEzMAogICAgLy8gdm90ZV9rZXlfZGlsdXRpb249dm90ZV9rZC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBTdGF0ZVByb29mUEsKICAgIGl0eG5fZmllbGQgVm90ZUtleURpbHV0aW9uCiAgICBpdHhuX2ZpZWxkIFZvdGVMYXN0CiAgICBpdHhuX2ZpZWxkIFZvdGVGaXJzdAogICAgZnJhbWVfZGlnIC01CiAgICBpdHhuX2ZpZWxkIFNlbGVjdGlvblBLCiAgICBmcmFtZV9kaWcgLTYKICAgIGl0eG5fZmllbGQgVm90ZVBLCiAgICAvLyBjb250cmFjdC5weToxMjUKICAgIC8vIGl0eG4uS2V5UmVnaXN0cmF0aW9uKAogICAgaW50IGtleXJlZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gY29udHJhY3QucHk6MTMyCiAgICAvLyBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weToxMjUtMTMzCiAgICAvLyBpdHhuLktleVJlZ2lzdHJhdGlvbigKICAgIC8vICAgICB2b3RlX2tleT12b3RlX2ssCiAgICAvLyAgICAgc2VsZWN0aW9uX2tleT1zZWxfaywKICAgIC8vICAgICB2b3RlX2ZpcnN0PXZvdGVfZnN0Lm5hdGl2ZSwKICAgIC8vICAgICB2b3RlX2xhc3Q9dm90ZV9sc3QubmF0aXZlLAogICAgLy8gICAgIHZvdGVfa2V5X2RpbHV0aW9uPXZvdGVfa2QubmF0aXZlLAogICAgLy8gICAgIHN0YXRlX3Byb29mX2tleT1zcF9rZXksCiAgICAvLyAgICAgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy53aXRoZHJhdyhhbW91bnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CndpdGhkcmF3OgogICAgLy8gY29udHJhY3QucHk6MTM0LTE1NAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogd2l0aGRyYXcKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIGFtb3VudAogICAgLy8gIyByZXR1cm5zOgogICAgLy8gIyAtIG1hYgogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGZ1bmRzIGZyb20gY29udHJhY3QKICAgIC8vICMgcHJlLWNvbmRpdGlvbnMKICAgIC8vICMgLSBvbmx5IGNhbGxhYmxlIGJ5IG93bmVyCiAgICAvLyAjIC0gbGV0IGJhbGFuY2UgYmUgdGhlIGN1cnJlbnQgYmFsYW5jZSBvZiB0aGUKICAgIC8vICMgICBjb250cmFjdAogICAgLy8gIyAtIGJhbGFuY2UgLSBhbW91bnQgPj0gbWFiCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSB0cmFuc2ZlciBhbW91bnQgZnJvbSB0aGUgY29udHJhY3QgYWNjb3VudAogICAgLy8gIyAgIHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIDIgZmVlcywgcGFpZCBieSB0aGUgY2FsbGVyIHRocm91Z2ggZmVlCiAgICAvLyAjICAgcG9vbGluZwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgd2l0aGRyYXcoc2VsZiwgYW1vdW50OiBhcmM0LlVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBjb250cmFjdC5weToxNTUKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgzKSkgIyBGdWxsCiAgICBpbnQgMwogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjE1NgogICAgLy8gc2VsZi5yZXF1aXJlX293bmVyKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9vd25lcgogICAgLy8gY29udHJhY3QucHk6MTU3CiAgICAvLyBtYWIgPSBzZWxmLmNhbGN1bGF0ZV9tYWIoKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWFiCiAgICBkdXAKICAgIC8vIGNvbnRyYWN0LnB5OjE1OAogICAgLy8gYXZhaWxhYmxlX2JhbGFuY2UgPSBzZWxmLmdldF9hdmFpbGFibGVfYmFsYW5jZSgpCiAgICBjYWxsc3ViIGdldF9hdmFpbGFibGVfYmFsYW5jZQogICAgLy8gY29udHJhY3QucHk6MTU5CiAgICAvLyBhc3NlcnQgYXZhaWxhYmxlX2JhbGFuY2UgLSBhbW91bnQubmF0aXZlID49IG1hYiwgIm1hYiBhdmFpbGFibGUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMwogICAgLQogICAgPD0KICAgIGFzc2VydCAvLyBtYWIgYXZhaWxhYmxlCiAgICAvLyBjb250cmFjdC5weToxNjAKICAgIC8vIGlmIGFtb3VudCA+IDA6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPgogICAgYnogd2l0aGRyYXdfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBjb250cmFjdC5weToxNjEtMTY1CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgYW1vdW50PWFtb3VudC5uYXRpdmUsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6MTYzCiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgZnJhbWVfZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBjb250cmFjdC5weToxNjEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIGNvbnRyYWN0LnB5OjE2NAogICAgLy8gZmVlPTAKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gY29udHJhY3QucHk6MTYxLTE2NQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIGFtb3VudD1hbW91bnQubmF0aXZlLAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0Cgp3aXRoZHJhd19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBjb250cmFjdC5weToxNjYKICAgIC8vIHJldHVybiBtYWIKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmNhbGN1bGF0ZV9tYWIoKSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV9tYWI6CiAgICAvLyBjb250cmFjdC5weTo0MDQtNDIyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBjYWxjdWxhdGVfbWFiIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGNhbGN1YWx0ZSBtaW5pbXVtIGFsbG93YWJsZSBiYWxhbmNlCiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBsZXQgcGVyaW9kID0gbnVtYmVyIG9mIG1vbnRocyB0byB0byBsb2NrdXAKICAgIC8vICMgICAgICAgdG90YWwgPSB0b3RhbCBhbW91bnQgaW50aWFsbHkgZnVuZGVkIChhaXJkcm9wICsgbG9ja3VwIGJvbnVzKQogICAgLy8gIyAgICAgICB5ID0gdmVzdGluZyBkZWxheSBpbiBtb250aHMKICAgIC8vICMgICAgICAgcCA9IDEgLyAoc2VsZi5wZXJpb2QgeCAxMikgb3IgMSAvIChwZXJpb2QpCiAgICAvLyAjIC0gbWltdW11bSBhbGxvd2FibGUgYmFsYW5jZSA9CiAgICAvLyAjICAgICB0b3RhbCB4IG1pbigxLCBwIHggbWF4KDAsIChwZXJpb2QgLSAobm93KCkgLSBmdW5kaW5nICsgeSB4IHNlY29uZHMtaW4tbW9udGgpKSAvIHNlY29uZHMtaW4tbW9udGgpKQogICAgLy8gIyAtIGxvY2t1cF9lbmQgPSBmdW5kaW5nICsgcCB4IHNlY29uZHMtaW4tcGVyaW9kCiAgICAvLyAjICAgdmVzdGluZ19lbmQgPSBsb2NrdXBfZW5kICsgeSB4IHNlY29uZHMtaW4tcGVyaW9kCiAgICAvLyAjICAgYXJlIGNvbXB1dGVkIG9uY2UgYnkgZmlsbAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjdWxhdGVfbWFiKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gY29udHJhY3QucHk6NDIzCiAgICAvLyBub3cgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZHVwCiAgICAvLyBjb250cmFjdC5weTo0MjQtNDI3CiAgICAvLyAjIGlmIGxvY2tlZCB1cCB0aGVuIHRvdGFsCiAgICAvLyAjIGVsaWYgZnVsbHkgdmVzdGVkIHRoZW4gemVybwogICAgLy8gIyBlbHNlIGNhbGN1bGF0ZSBtYWIgdXNpbmcgZWxhcHNlZCBwZXJpb2RzCiAgICAvLyBpZiBub3cgPCBzZWxmLmxvY2t1cF9lbmQ6ICMgIGlmIGxvY2tlZCB1cCB0aGVuIHRvdGFsCiAgICBpbnQgMAogICAgYnl0ZSAibG9ja3VwX2VuZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgbG9ja3VwX2VuZCBleGlzdHMKICAgIDwKICAgIGJ6IGNhbGN1bGF0ZV9tYWJfZWxzZV9ib2R5QDIKICAgIC8vIGNvbnRyYWN0LnB5OjQyOAogICAgLy8gcmV0dXJuIHNlbGYudG90YWwKICAgIGludCAwCiAgICBieXRlICJ0b3RhbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgdG90YWwgZXhpc3RzCiAgICBzd2FwCiAgICByZXRzdWIKCmNhbGN1bGF0ZV9tYWJfZWxzZV9ib2R5QDI6CiAgICAvLyBjb250cmFjdC5weTo0MjkKICAgIC8vIGVsaWYgbm93ID49IHNlbGYudmVzdGluZ19lbmQ6ICMgIGVsaWYgZnVsbHkgdmVzdGVkIHRoZW4gemVybwogICAgaW50IDAKICAgIGJ5dGUgInZlc3RpbmdfZW5kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayB2ZXN0aW5nX2VuZCBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICA8PQogICAgYnogY2FsY3VsYXRlX21hYl9lbHNlX2JvZHlANAogICAgLy8gY29udHJhY3QucHk6NDMwCiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnQgMAogICAgc3dhcAogICAgcmV0c3ViCgpjYWxjdWxhdGVfbWFiX2Vsc2VfYm9keUA0OgogICAgLy8gY29udHJhY3QucHk6NDMyCiAgICAvLyB5ID0gVGVtcGxhdGVWYXJbVUludDY0XSgiVkVTVElOR19ERUxBWSIpICMgdmVzdGluZyBkZWxheQogICAgaW50IFRNUExfVkVTVElOR19ERUxBWQogICAgLy8gY29udHJhY3QucHk6NDMzCiAgICAvLyBtID0gKG5vdyAtIHNlbGYubG9ja3VwX2VuZCkgLy8gVGVtcGxhdGVWYXJbVUludDY0XSgiUEVSSU9EX1NFQ09ORFMiKSAjIGVsYXBzZWQgcGVyaW9kIGFmdGVyIGxvY2t1cAogICAgaW50IDAKICAgIGJ5dGUgImxvY2t1cF9lbmQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGxvY2t1cF9lbmQgZXhpc3RzCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgLQogICAgaW50IFRNUExfUEVSSU9EX1NFQ09ORFMKICAgIC8KICAgIC8vIGNvbnRyYWN0LnB5OjQzNAogICAgLy8gcmV0dXJuIChzZWxmLnRvdGFsICogKHkgLSBtKSkgLy8geQogICAgaW50IDAKICAgIGJ5dGUgInRvdGFsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayB0b3RhbCBleGlzdHMKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIC0KICAgICoKICAgIHN3YXAKICAgIC8KICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmdldF9hdmFpbGFibGVfYmFsYW5jZSgpIC0+IHVpbnQ2NDoKZ2V0X2F2YWlsYWJsZV9iYWxhbmNlOgogICAgLy8gY29udHJhY3QucHk6MjkyLTMwMAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X2F2YWlsYWJsZV9iYWxhbmNlIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGdldCBhdmFpbGFibGUgYmFsYW5jZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X2F2YWlsYWJsZV9iYWxhbmNlKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gY29udHJhY3QucHk6MzAxCiAgICAvLyBiYWxhbmNlID0gb3AuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGJhbGFuY2UKICAgIC8vIGNvbnRyYWN0LnB5OjMwMgogICAgLy8gbWluX2JhbGFuY2UgPSBvcC5HbG9iYWwubWluX2JhbGFuY2UKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICAvLyBjb250cmFjdC5weTozMDMKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gYmFsYW5jZSAtIG1pbl9iYWxhbmNlCiAgICAtCiAgICAvLyBjb250cmFjdC5weTozMDQKICAgIC8vIHJldHVybiBhdmFpbGFibGVfYmFsYW5jZQogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcud2l0aGRyYXdfbWF4KCkgLT4gdWludDY0Ogp3aXRoZHJhd19tYXg6CiAgICAvLyBjb250cmFjdC5weToxNjctMTg5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiB3aXRoZHJhd19tYXgKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHJldHVybnM6CiAgICAvLyAjIC0gYW1vdW50IHdpdGhkcmF3bgogICAgLy8gIyBwdXJwb3NlOiBleHRyYWN0IGFsbCBmdW5kcyBhYm92ZSBtYWIgZnJvbQogICAgLy8gIyAgICAgICAgICBjb250cmFjdAogICAgLy8gIyBwcmUtY29uZGl0aW9ucwogICAgLy8gIyAtIG9ubHkgY2FsbGFibGUgYnkgb3duZXIKICAgIC8vICMgLSBsZXQgYmFsYW5jZSBiZSB0aGUgY3VycmVudCBiYWxhbmNlIG9mIHRoZQogICAgLy8gIyAgIGNvbnRyYWN0CiAgICAvLyAjIC0gYmFsYW5jZSA+PSBtYWIKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIHRyYW5zZmVyIGJhbGFuY2UgLSBtYWIgZnJvbSB0aGUgY29udHJhY3QKICAgIC8vICMgICBhY2NvdW50IHRvIG93bmVyCiAgICAvLyAjIG5vdGVzOgogICAgLy8gIyAtIHNhbWUgY2hlY2tzIGFzIHdpdGhkcmF3IHdpdGggdGhlIGFtb3VudAogICAgLy8gIyAgIGNvbXB1dGVkIG9uLWNoYWluCiAgICAvLyAjIC0gMiBmZWVzLCBwYWlkIGJ5IHRoZSBjYWxsZXIgdGhyb3VnaCBmZWUKICAgIC8vICMgICBwb29saW5nCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiB3aXRoZHJhd19tYXgoc2VsZikgLT4gVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBjb250cmFjdC5weToxOTAKICAgIC8vIHNlbGYuZW5mb3JjZV9zdGVwKFVJbnQ2NCgzKSkgIyBGdWxsCiAgICBpbnQgMwogICAgY2FsbHN1YiBlbmZvcmNlX3N0ZXAKICAgIC8vIGNvbnRyYWN0LnB5OjE5MQogICAgLy8gc2VsZi5yZXF1aXJlX293bmVyKCkKICAgIGNhbGxzdWIgcmVxdWlyZV9vd25lcgogICAgLy8gY29udHJhY3QucHk6MTkyCiAgICAvLyBtYWIgPSBzZWxmLmNhbGN1bGF0ZV9tYWIoKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfbWFiCiAgICAvLyBjb250cmFjdC5weToxOTMKICAgIC8vIGF2YWlsYWJsZV9iYWxhbmNlID0gc2VsZi5nZXRfYXZhaWxhYmxlX2JhbGFuY2UoKQogICAgY2FsbHN1YiBnZXRfYXZhaWxhYmxlX2JhbGFuY2UKICAgIC8vIGNvbnRyYWN0LnB5OjE5NAogICAgLy8gYXNzZXJ0IGF2YWlsYWJsZV9iYWxhbmNlID49IG1hYiwgIm1hYiBhdmFpbGFibGUiCiAgICBkdXAKICAgIGRpZyAyCiAgICA+PQogICAgYXNzZXJ0IC8vIG1hYiBhdmFpbGFibGUKICAgIC8vIGNvbnRyYWN0LnB5OjE5NQogICAgLy8gYW1vdW50ID0gYXZhaWxhYmxlX2JhbGFuY2UgLSBtYWIKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgLy8gY29udHJhY3QucHk6MTk2CiAgICAvLyBpZiBhbW91bnQgPiAwOgogICAgYnogd2l0aGRyYXdfbWF4X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gY29udHJhY3QucHk6MTk3LTIwMQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6MTk5CiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgZnJhbWVfZGlnIDAKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBjb250cmFjdC5weToxOTcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIGNvbnRyYWN0LnB5OjIwMAogICAgLy8gZmVlPTAKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gY29udHJhY3QucHk6MTk3LTIwMQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIGFtb3VudD1hbW91bnQsCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCndpdGhkcmF3X21heF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBjb250cmFjdC5weToyMDIKICAgIC8vIHJldHVybiBhbW91bnQKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy50cmFuc2Zlcihvd25lcjogYnl0ZXMpIC0+IHZvaWQ6CnRyYW5zZmVyOgogICAgLy8gY29udHJhY3QucHk6MjAzLTIxOAogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogdHJhbnNmZXIKICAgIC8vICMgYXJndW1lbnRzOgogICAgLy8gIyAtIG93bmVyLCBuZXcgb3duZXIKICAgIC8vICMgcHVycG9zZTogY2hhbmdlIG93bmVyCiAgICAvLyAjIHByZS1jb25kaXRpb25zCiAgICAvLyAjIC0gb25seSBjYWxsYWJsZSBieSB0aGUgb3duZXIKICAgIC8vICMgLSBuZXcgb3duZXIgaXMgbm90IHRoZSB6ZXJvIGFkZHJlc3MKICAgIC8vICMgcG9zdC1jb25kaXRpb25zOgogICAgLy8gIyAtIG5ldyBvd25lcgogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSBmZWUgdGFrZW4gb3V0IG9mIGFtb3VudCB0cmFuc2ZlcmVkIHRvCiAgICAvLyAjICAgb3duZXIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHRyYW5zZmVyKHNlbGYsIG93bmVyOiBhcmM0LkFkZHJlc3MpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjIxOQogICAgLy8gc2VsZi5lbmZvcmNlX3N0ZXAoVUludDY0KDMpKSAjIEZ1bGwKICAgIGludCAzCiAgICBjYWxsc3ViIGVuZm9yY2Vfc3RlcAogICAgLy8gY29udHJhY3QucHk6MjIwCiAgICAvLyBzZWxmLnJlcXVpcmVfb3duZXIoKQogICAgY2FsbHN1YiByZXF1aXJlX293bmVyCiAgICAvLyBjb250cmFjdC5weToyMjEKICAgIC8vIGFzc2VydCBzZWxmLm93bmVyICE9IG93bmVyLm5hdGl2ZSwgIm5ldyBvd25lciBtdXN0IG5vdCBiZSBvd25lciIKICAgIGludCAwCiAgICBieXRlICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgb3duZXIgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgICE9CiAgICBhc3NlcnQgLy8gbmV3IG93bmVyIG11c3Qgbm90IGJlIG93bmVyCiAgICAvLyBjb250cmFjdC5weToyMjIKICAgIC8vIGFzc2VydCBvd25lci5uYXRpdmUgIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgIm93bmVyIG11c3QgYmUgaW5pdGlhbGl6ZWQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBvd25lciBtdXN0IGJlIGluaXRpYWxpemVkCiAgICAvLyBjb250cmFjdC5weToyMjMKICAgIC8vIHNlbGYub3duZXIgPSBvd25lci5uYXRpdmUKICAgIGJ5dGUgIm93bmVyIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuU21hcnRDb250cmFjdFN0YWtpbmcuY2xvc2UoKSAtPiB2b2lkOgpjbG9zZToKICAgIC8vIGNvbnRyYWN0LnB5OjIyNC0yNDIKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMgZnVuY3Rpb246IGNsb3NlCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBkZWxldGVzIGNvbnRyYWN0CiAgICAvLyAjIHByZS1jb25kaXRpb25zOgogICAgLy8gIyAtIG1hYiBpcyAwCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczoKICAgIC8vICMgLSBjb250cmFjdCBpcyBkZWxldGVkCiAgICAvLyAjIC0gYWNjb3VudCBjbG9zZWQgb3V0IHRvIG93bmVyIGlmIGl0IGhhcyBhIGJhbGFuY2UKICAgIC8vICMgLSAyIGZlZXMsIHBhaWQgYnkgdGhlIGNhbGxlciB0aHJvdWdoIGZlZQogICAgLy8gIyAgIHBvb2xpbmcKICAgIC8vICMgbm90ZXM6CiAgICAvLyAjIC0gc2hvdWxkIGJlIGFsbGVkIHdpdGggb25Db21wbGV0aW9uCiAgICAvLyAjICAgZGVsZXRlQXBwbGljYXRpb24KICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsKICAgIC8vICAgICBPbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uCiAgICAvLyBdKQogICAgLy8gZGVmIGNsb3NlKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIGNvbnRyYWN0LnB5OjI0MwogICAgLy8gc2VsZi5lbmZvcmNlX3N0ZXAoVUludDY0KDMpKSAjIEZ1bGwKICAgIGludCAzCiAgICBjYWxsc3ViIGVuZm9yY2Vfc3RlcAogICAgLy8gY29udHJhY3QucHk6MjQ0CiAgICAvLyBzZWxmLnJlcXVpcmVfb3duZXIoKQogICAgY2FsbHN1YiByZXF1aXJlX293bmVyCiAgICAvLyBjb250cmFjdC5weToyNDUKICAgIC8vIGFzc2VydCBzZWxmLmNhbGN1bGF0ZV9tYWIoKSA9PSAwLCAibWFiIGlzIHplcm8iCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9tYWIKICAgICEKICAgIGFzc2VydCAvLyBtYWIgaXMgemVybwogICAgLy8gY29udHJhY3QucHk6MjQ2CiAgICAvLyBvY2EgPSBUeG4ub25fY29tcGxldGlvbgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgLy8gY29udHJhY3QucHk6MjQ3CiAgICAvLyBpZiBvY2EgPT0gT25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbjoKICAgIGludCBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGJ6IGNsb3NlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gY29udHJhY3QucHk6MjQ4CiAgICAvLyBhdmFpbGFibGVfYmFsYW5jZSA9IHNlbGYuZ2V0X2F2YWlsYWJsZV9iYWxhbmNlKCkKICAgIGNhbGxzdWIgZ2V0X2F2YWlsYWJsZV9iYWxhbmNlCiAgICAvLyBjb250cmFjdC5weToyNDkKICAgIC8vIGlmIGF2YWlsYWJsZV9iYWxhbmNlID4gMDoKICAgIGJ6IGNsb3NlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gY29udHJhY3QucHk6MjUwLTI1NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPXNlbGYub3duZXIsCiAgICAvLyAgICAgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIGNvbnRyYWN0LnB5OjI1MQogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gY29udHJhY3QucHk6MjUyCiAgICAvLyBjbG9zZV9yZW1haW5kZXJfdG89c2VsZi5vd25lciwKICAgIGludCAwCiAgICBieXRlICJvd25lciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgb3duZXIgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIGNvbnRyYWN0LnB5OjI1MAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gY29udHJhY3QucHk6MjUzCiAgICAvLyBmZWU9MAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weToyNTAtMjU0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89c2VsZi5vd25lciwKICAgIC8vICAgICBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCmNsb3NlX2FmdGVyX2lmX2Vsc2VANToKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLnN0YXR1cygpIC0+IGJ5dGVzOgpzdGF0dXM6CiAgICAvLyBjb250cmFjdC5weToyNTUtMjgxCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIGZ1bmN0aW9uOiBzdGF0dXMKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHJldHVybnM6CiAgICAvLyAjIC0gb3duZXIsIGZ1bmRlciwgcGVyaW9kLCBmdW5kaW5nLCB0b3RhbCwKICAgIC8vICMgICBtYWIsIGF2YWlsYWJsZSBiYWxhbmNlLCBzdGVwCiAgICAvLyAjIHB1cnBvc2U6IHJlYWQgc3RhdGUsIG1hYiBhbmQgYXZhaWxhYmxlCiAgICAvLyAjICAgICAgICAgIGJhbGFuY2UgaW4gb25lIHNpbXVsYXRlZCBjYWxsCiAgICAvLyAjIHByZS1jb25kaXRpb25zOiBOb25lCiAgICAvLyAjIHBvc3QtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBub3RlczoKICAgIC8vICMgLSByZWFkb25seSwgY2FsbGFibGUgaW4gYW55IHN0ZXAKICAgIC8vICMgLSBhdmFpbGFibGUgYmFsYW5jZSBpcyAwIHdoaWxlIHRoZSBiYWxhbmNlCiAgICAvLyAjICAgaXMgYmVsb3cgdGhlIG1pbmltdW0gYmFsYW5jZSwgZS5nLiByaWdodAogICAgLy8gIyAgIGFmdGVyIGNyZWF0aW9uCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBzdGF0dXMoc2VsZikgLT4gYXJjNC5UdXBsZVsKICAgIC8vICAgICBhcmM0LkFkZHJlc3MsCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzLAogICAgLy8gICAgIGFyYzQuVUludDY0LAogICAgLy8gICAgIGFyYzQuVUludDY0LAogICAgLy8gICAgIGFyYzQuVUludDY0LAogICAgLy8gICAgIGFyYzQuVUludDY0LAogICAgLy8gICAgIGFyYzQuVUludDY0LAogICAgLy8gICAgIGFyYzQuVUludDY0LAogICAgLy8gXToKICAgIHByb3RvIDAgMQogICAgLy8gY29udHJhY3QucHk6MjgzCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5vd25lciksCiAgICBpbnQgMAogICAgYnl0ZSAib3duZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIG93bmVyIGV4aXN0cwogICAgLy8gY29udHJhY3QucHk6Mjg0CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5mdW5kZXIpLAogICAgaW50IDAKICAgIGJ5dGUgImZ1bmRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGVyIGV4aXN0cwogICAgLy8gY29udHJhY3QucHk6Mjg1CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnBlcmlvZCksCiAgICBpbnQgMAogICAgYnl0ZSAicGVyaW9kIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBwZXJpb2QgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBjb250cmFjdC5weToyODYKICAgIC8vIGFyYzQuVUludDY0KHNlbGYuZnVuZGluZyksCiAgICBpbnQgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgZnVuZGluZyBleGlzdHMKICAgIGl0b2IKICAgIC8vIGNvbnRyYWN0LnB5OjI4NwogICAgLy8gYXJjNC5VSW50NjQoc2VsZi50b3RhbCksCiAgICBpbnQgMAogICAgYnl0ZSAidG90YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHRvdGFsIGV4aXN0cwogICAgaXRvYgogICAgLy8gY29udHJhY3QucHk6Mjg4CiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLmNhbGN1bGF0ZV9tYWIoKSksCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9tYWIKICAgIGl0b2IKICAgIC8vIGNvbnRyYWN0LnB5OjI4OQogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5nZXRfc3RhdHVzX2JhbGFuY2UoKSksCiAgICBjYWxsc3ViIGdldF9zdGF0dXNfYmFsYW5jZQogICAgaXRvYgogICAgLy8gY29udHJhY3QucHk6MjkwCiAgICAvLyBhcmM0LlVJbnQ2NChzZWxmLnN0ZXApLAogICAgaW50IDAKICAgIGJ5dGUgInN0ZXAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHN0ZXAgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBjb250cmFjdC5weToyODItMjkxCiAgICAvLyByZXR1cm4gYXJjNC5UdXBsZSgoCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKHNlbGYub3duZXIpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLmZ1bmRlciksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi5wZXJpb2QpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuZnVuZGluZyksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi50b3RhbCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoc2VsZi5jYWxjdWxhdGVfbWFiKCkpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuZ2V0X3N0YXR1c19iYWxhbmNlKCkpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuc3RlcCksCiAgICAvLyApKQogICAgdW5jb3ZlciA3CiAgICB1bmNvdmVyIDcKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLmdldF9zdGF0dXNfYmFsYW5jZSgpIC0+IHVpbnQ2NDoKZ2V0X3N0YXR1c19iYWxhbmNlOgogICAgLy8gY29udHJhY3QucHk6MzA1LTMxNQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogZ2V0X3N0YXR1c19iYWxhbmNlIChpbnRlcm5hbCkKICAgIC8vICMgYXJndW1lbnRzOiBOb25lCiAgICAvLyAjIHB1cnBvc2U6IGdldCBhdmFpbGFibGUgYmFsYW5jZSwgMCBpbnN0ZWFkCiAgICAvLyAjICAgICAgICAgIG9mIGZhaWxpbmcgYmVsb3cgdGhlIG1pbmltdW0KICAgIC8vICMgICAgICAgICAgYmFsYW5jZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IE5vbmUKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X3N0YXR1c19iYWxhbmNlKHNlbGYpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gY29udHJhY3QucHk6MzE2CiAgICAvLyBiYWxhbmNlID0gb3AuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGJhbGFuY2UKICAgIGR1cAogICAgLy8gY29udHJhY3QucHk6MzE3CiAgICAvLyBtaW5fYmFsYW5jZSA9IG9wLkdsb2JhbC5taW5fYmFsYW5jZQogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gY29udHJhY3QucHk6MzE4CiAgICAvLyBpZiBiYWxhbmNlIDwgbWluX2JhbGFuY2U6CiAgICA8CiAgICBieiBnZXRfc3RhdHVzX2JhbGFuY2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBjb250cmFjdC5weTozMTkKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X3N0YXR1c19iYWxhbmNlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIGNvbnRyYWN0LnB5OjMyMAogICAgLy8gcmV0dXJuIGJhbGFuY2UgLSBtaW5fYmFsYW5jZQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICAtCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LlNtYXJ0Q29udHJhY3RTdGFraW5nLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICAvLyBjb250cmFjdC5weToxOS0yNgogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyBmdW5jdGlvbjogX19pbml0X18gKGJ1aWx0aW4pCiAgICAvLyAjIGFyZ3VtZW50czogTm9uZQogICAgLy8gIyBwdXJwb3NlOiBjb25zdHJ1Y3QgaW5pdGlhbCBzdGF0ZQogICAgLy8gIyBwcmUtY29uZGl0aW9uczogTm9uZQogICAgLy8gIyBwb3N0LWNvbmRpdGlvbnM6IGluaXRpYWwgc3RhdGUgc2V0CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gY29udHJhY3QucHk6MjcKICAgIC8vIHNlbGYub3duZXIgPSBBY2NvdW50KCkgICAgICAjIHplcm8gYWRkcmVzcwogICAgYnl0ZSAib3duZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weToyOAogICAgLy8gc2VsZi5mdW5kZXIgPSBBY2NvdW50KCkgICAgICMgemVybyBhZGRyZXNzCiAgICBieXRlICJmdW5kZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weToyOQogICAgLy8gc2VsZi5wZXJpb2QgPSBVSW50NjQoKSAgICAgICMgMAogICAgYnl0ZSAicGVyaW9kIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTozMAogICAgLy8gc2VsZi5mdW5kaW5nID0gVUludDY0KCkgICAgICMgMAogICAgYnl0ZSAiZnVuZGluZyIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MzEKICAgIC8vIHNlbGYudG90YWwgPSBVSW50NjQoKSAgICAgICAjIDAKICAgIGJ5dGUgInRvdGFsIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTozMgogICAgLy8gc2VsZi5zdGVwID0gVUludDY0KCkgICAgICAgICMgMCwgTm9uLWV4aXN0ZW50CiAgICBieXRlICJzdGVwIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTozMwogICAgLy8gc2VsZi5sb2NrdXBfZW5kID0gVUludDY0KCkgICMgMAogICAgYnl0ZSAibG9ja3VwX2VuZCIKICAgIGludCAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MzQKICAgIC8vIHNlbGYudmVzdGluZ19lbmQgPSBVSW50NjQoKSAjIDAKICAgIGJ5dGUgInZlc3RpbmdfZW5kIgogICAgaW50IDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
         "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpjb250cmFjdC5TbWFydENvbnRyYWN0U3Rha2luZy5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIFNtYXJ0Q29udHJhY3RTdGFraW5nKEFSQzRDb250cmFjdCk6CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
     },
     "state": {
         "global": {
             "num_byte_slices": 2,
-            "num_uints": 3
+            "num_uints": 6
         },
         "local": {
             "num_byte_slices": 0,
@@ -84,6 +95,10 @@ _APP_SPEC_JSON = r"""{
                     "type": "uint64",
                     "key": "funding"
                 },
+                "lockup_end": {
+                    "type": "uint64",
+                    "key": "lockup_end"
+                },
                 "owner": {
                     "type": "bytes",
                     "key": "owner"
@@ -92,9 +107,17 @@ _APP_SPEC_JSON = r"""{
                     "type": "uint64",
                     "key": "period"
                 },
+                "step": {
+                    "type": "uint64",
+                    "key": "step"
+                },
                 "total": {
                     "type": "uint64",
                     "key": "total"
+                },
+                "vesting_end": {
+                    "type": "uint64",
+                    "key": "vesting_end"
                 }
             },
             "reserved": {}
@@ -191,6 +214,13 @@ _APP_SPEC_JSON = r"""{
                     "type": "uint64"
                 }
             },
+            {
+                "name": "withdraw_max",
+                "args": [],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
             {
                 "name": "transfer",
                 "args": [
@@ -209,6 +239,13 @@ _APP_SPEC_JSON = r"""{
                 "returns": {
                     "type": "void"
                 }
+            },
+            {
+                "name": "status",
+                "args": [],
+                "returns": {
+                    "type": "(address,address,uint64,uint64,uint64,uint64,uint64,uint64)"
+                }
             }
         ],
         "networks": {}
@@ -346,6 +383,13 @@ class WithdrawArgs(_ArgsBase[int]):
         return "withdraw(uint64)uint64"
 
 
+@dataclasses.dataclass(kw_only=True)
+class WithdrawMaxArgs(_ArgsBase[int]):
+    @staticmethod
+    def method() -> str:
+        return "withdraw_max()uint64"
+
+
 @dataclasses.dataclass(kw_only=True)
 class TransferArgs(_ArgsBase[None]):
     owner: str
@@ -355,6 +399,13 @@ class TransferArgs(_ArgsBase[None]):
         return "transfer(address)void"
 
 
+@dataclasses.dataclass(kw_only=True)
+class StatusArgs(_ArgsBase[tuple[str, str, int, int, int, int, int, int]]):
+    @staticmethod
+    def method() -> str:
+        return "status()(address,address,uint64,uint64,uint64,uint64,uint64,uint64)"
+
+
 @dataclasses.dataclass(kw_only=True)
 class CloseArgs(_ArgsBase[None]):
     @staticmethod
@@ -387,9 +438,12 @@ class GlobalState:
     def __init__(self, data: dict[bytes, bytes | int]):
         self.funder = ByteReader(typing.cast(bytes, data.get(b"funder")))
         self.funding = typing.cast(int, data.get(b"funding"))
+        self.lockup_end = typing.cast(int, data.get(b"lockup_end"))
         self.owner = ByteReader(typing.cast(bytes, data.get(b"owner")))
         self.period = typing.cast(int, data.get(b"period"))
+        self.step = typing.cast(int, data.get(b"step"))
         self.total = typing.cast(int, data.get(b"total"))
+        self.vesting_end = typing.cast(int, data.get(b"vesting_end"))
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -556,6 +610,25 @@ class Composer:
         )
         return self
 
+    def withdraw_max(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `withdraw_max()uint64` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = WithdrawMaxArgs()
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
     def transfer(
         self,
         *,
@@ -579,6 +652,25 @@ class Composer:
         )
         return self
 
+    def status(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `status()(address,address,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = StatusArgs()
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
     def create_bare(
         self,
         *,
@@ -891,6 +983,24 @@ class SmartContractStakingClient:
         )
         return result
 
+    def withdraw_max(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `withdraw_max()uint64` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = WithdrawMaxArgs()
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def transfer(
         self,
         *,
@@ -913,6 +1023,24 @@ class SmartContractStakingClient:
         )
         return result
 
+    def status(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[tuple[str, str, int, int, int, int, int, int]]:
+        """Calls `status()(address,address,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method
+        
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[tuple[str, str, int, int, int, int, int, int]]: The result of the transaction"""
+
+        args = StatusArgs()
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
     def create_bare(
         self,
         *,
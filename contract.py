@@ -29,6 +29,9 @@ class SmartContractStaking(ARC4Contract):
         self.period = UInt64()      # 0
         self.funding = UInt64()     # 0
         self.total = UInt64()       # 0
+        self.step = UInt64()        # 0, Non-existent
+        self.lockup_end = UInt64()  # 0
+        self.vesting_end = UInt64() # 0
     ##############################################
     # function: constructor
     # arguments:
@@ -36,15 +39,18 @@ class SmartContractStaking(ARC4Contract):
     # - funder, who is this
     # - total, total amount without lockup
     # purpose: create contract
-    # pre-conditions: None
+    # pre-conditions:
+    # - owner is not the zero address
     # post-conditions: set owner and funder
     ##############################################
     @arc4.abimethod
     def setup(self, owner: arc4.Address) -> None:
         self.enforce_step(UInt64(0)) # Non-existant
         self.require_creator()
+        assert owner.native != Global.zero_address, "owner must be initialized"
         self.funder = Txn.sender
         self.owner = owner.native
+        self.step = UInt64(1) # Fresh
     ##############################################
     # function: configure
     # arguments:
@@ -62,6 +68,7 @@ class SmartContractStaking(ARC4Contract):
         assert period > 0, "period must be greater than 0" 
         assert period <= 5, "period must be less than or equal to 5"
         self.period = period.native
+        self.step = UInt64(2) # Ready
     ##############################################
     # function: fill
     # arguments:
@@ -70,11 +77,14 @@ class SmartContractStaking(ARC4Contract):
     # pre-conditions
     # - period must be set
     # - funding and total must be uninitialized
-    # - must be combined with pyament transaction
+    # - must be preceded by payment transaction
     #   for total amount
     # - must be only callable by funder 
+    # - funding must be greater than zero
     # post-conditions: 
     # - total and funding are set to arguments
+    # - lockup_end and vesting_end are set from
+    #   funding and period
     ##############################################
     @arc4.abimethod
     def fill(self, total: arc4.UInt64, funding: arc4.UInt64) -> None:
@@ -82,8 +92,15 @@ class SmartContractStaking(ARC4Contract):
         self.require_funder()
         self.require_payment(self.funder, total.native)
         assert total > 0, "payment is greater than zero"
+        assert funding > 0, "funding must be initialized"
         self.total = total.native
         self.funding = funding.native
+        seconds_in_period = TemplateVar[UInt64]("PERIOD_SECONDS")
+        p = TemplateVar[UInt64]("LOCKUP_DELAY") * self.period # lockup period
+        lockup_end = funding.native + p * seconds_in_period
+        self.lockup_end = lockup_end
+        self.vesting_end = lockup_end + TemplateVar[UInt64]("VESTING_DELAY") * seconds_in_period
+        self.step = UInt64(3) # Full
     ##############################################
     # function: participate
     # arguments:
@@ -92,22 +109,19 @@ class SmartContractStaking(ARC4Contract):
     #          consensus
     # pre-conditions
     # - must be callable by owner only
-    # - must be combined with transaction transfering
-    #   one fee into the contract account
     # post-conditions: 
     # - contract generates itnx for keyreg
     # notes:
-    # - fee payment is to prevent potential draining
-    #   into fees, even though it is not likely that
-    #   a user may attempt to drain their funds
-    # - MAB is not relevant due to the fee payment
-    #   added
+    # - 2 fees, paid by the caller through fee
+    #   pooling
+    # - itxn fee is zero so the contract account is
+    #   never drained into fees and MAB is not
+    #   relevant
     ##############################################
     @arc4.abimethod
     def participate(self, vote_k: Bytes, sel_k: Bytes, vote_fst: arc4.UInt64, vote_lst: arc4.UInt64, vote_kd: arc4.UInt64, sp_key: Bytes) -> None: 
         self.enforce_step(UInt64(3)) # Full
         self.require_owner()
-        self.require_payment(self.owner, UInt64(1000))
         itxn.KeyRegistration(
             vote_key=vote_k,
             selection_key=sel_k,
@@ -115,7 +129,7 @@ class SmartContractStaking(ARC4Contract):
             vote_last=vote_lst.native,
             vote_key_dilution=vote_kd.native,
             state_proof_key=sp_key,
-            fee=1000
+            fee=0
         ).submit()
     ##############################################
     # function: withdraw
@@ -128,13 +142,13 @@ class SmartContractStaking(ARC4Contract):
     # - only callable by owner
     # - let balance be the current balance of the
     #   contract
-    # - let fee be one fee value
-    # - balance - amount - fee >= mag
+    # - balance - amount >= mab
     # post-conditions: 
     # - transfer amount from the contract account
     #   to owner
     # notes:
-    # - 2 fees
+    # - 2 fees, paid by the caller through fee
+    #   pooling
     ##############################################
     @arc4.abimethod
     def withdraw(self, amount: arc4.UInt64) -> UInt64:
@@ -147,15 +161,53 @@ class SmartContractStaking(ARC4Contract):
             itxn.Payment(
                 amount=amount.native,
                 receiver=Txn.sender,
+                fee=0
             ).submit()
         return mab
     ##############################################
+    # function: withdraw_max
+    # arguments: None
+    # returns:
+    # - amount withdrawn
+    # purpose: extract all funds above mab from
+    #          contract
+    # pre-conditions
+    # - only callable by owner
+    # - let balance be the current balance of the
+    #   contract
+    # - balance >= mab
+    # post-conditions:
+    # - transfer balance - mab from the contract
+    #   account to owner
+    # notes:
+    # - same checks as withdraw with the amount
+    #   computed on-chain
+    # - 2 fees, paid by the caller through fee
+    #   pooling
+    ##############################################
+    @arc4.abimethod
+    def withdraw_max(self) -> UInt64:
+        self.enforce_step(UInt64(3)) # Full
+        self.require_owner()
+        mab = self.calculate_mab()
+        available_balance = self.get_available_balance()
+        assert available_balance >= mab, "mab available"
+        amount = available_balance - mab
+        if amount > 0:
+            itxn.Payment(
+                amount=amount,
+                receiver=Txn.sender,
+                fee=0
+            ).submit()
+        return amount
+    ##############################################
     # function: transfer
     # arguments:
     # - owner, new owner
     # purpose: change owner
     # pre-conditions
     # - only callable by the owner
+    # - new owner is not the zero address
     # post-conditions: 
     # - new owner
     # notes:
@@ -167,6 +219,7 @@ class SmartContractStaking(ARC4Contract):
         self.enforce_step(UInt64(3)) # Full
         self.require_owner()
         assert self.owner != owner.native, "new owner must not be owner"
+        assert owner.native != Global.zero_address, "owner must be initialized"
         self.owner = owner.native
     ##############################################
     # function: close
@@ -177,7 +230,8 @@ class SmartContractStaking(ARC4Contract):
     # post-conditions:
     # - contract is deleted
     # - account closed out to owner if it has a balance
-    # - 2 fees
+    # - 2 fees, paid by the caller through fee
+    #   pooling
     # notes:
     # - should be alled with onCompletion
     #   deleteApplication
@@ -195,9 +249,47 @@ class SmartContractStaking(ARC4Contract):
             if available_balance > 0:
                 itxn.Payment(
                     receiver=Global.creator_address,
-                    close_remainder_to=self.owner
+                    close_remainder_to=self.owner,
+                    fee=0
                 ).submit()
     ##############################################
+    # function: status
+    # arguments: None
+    # returns:
+    # - owner, funder, period, funding, total,
+    #   mab, available balance, step
+    # purpose: read state, mab and available
+    #          balance in one simulated call
+    # pre-conditions: None
+    # post-conditions: None
+    # notes:
+    # - readonly, callable in any step
+    # - available balance is 0 while the balance
+    #   is below the minimum balance, e.g. right
+    #   after creation
+    ##############################################
+    @arc4.abimethod(readonly=True)
+    def status(self) -> arc4.Tuple[
+        arc4.Address,
+        arc4.Address,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+        arc4.UInt64,
+    ]:
+        return arc4.Tuple((
+            arc4.Address(self.owner),
+            arc4.Address(self.funder),
+            arc4.UInt64(self.period),
+            arc4.UInt64(self.funding),
+            arc4.UInt64(self.total),
+            arc4.UInt64(self.calculate_mab()),
+            arc4.UInt64(self.get_status_balance()),
+            arc4.UInt64(self.step),
+        ))
+    ##############################################
     # function: get_available_balance (internal)
     # arguments: None
     # purpose: get available balance
@@ -211,17 +303,41 @@ class SmartContractStaking(ARC4Contract):
         available_balance = balance - min_balance
         return available_balance
     ##############################################
-    # function: require_payment (internal)
+    # function: get_status_balance (internal)
     # arguments: None
-    # purpose: check payment
+    # purpose: get available balance, 0 instead
+    #          of failing below the minimum
+    #          balance
     # pre-conditions: None
     # post-conditions: None
     ##############################################
     @subroutine
+    def get_status_balance(self) -> UInt64:
+        balance = op.balance(Global.current_application_address)
+        min_balance = op.Global.min_balance
+        if balance < min_balance:
+            return UInt64(0)
+        return balance - min_balance
+    ##############################################
+    # function: require_payment (internal)
+    # arguments:
+    # - who, payment sender
+    # - amount, payment amount
+    # purpose: check payment
+    # pre-conditions:
+    # - payment is the transaction right before
+    #   this app call in the group
+    # post-conditions: None
+    # notes:
+    # - relative index lets several payment and
+    #   app call pairs share one group
+    ##############################################
+    @subroutine
     def require_payment(self, who: Account, amount: UInt64) -> None:
-        assert gtxn.PaymentTransaction(0).sender == who, "payment sender accurate"
-        assert gtxn.PaymentTransaction(0).amount == amount, "payment amount accurate"
-        assert gtxn.PaymentTransaction(0).receiver == Global.current_application_address, "payment receiver accurate"
+        payment = gtxn.PaymentTransaction(Txn.group_index - 1)
+        assert payment.sender == who, "payment sender accurate"
+        assert payment.amount == amount, "payment amount accurate"
+        assert payment.receiver == Global.current_application_address, "payment receiver accurate"
     ##############################################
     # function: require_creator (internal)
     # arguments: None
@@ -260,34 +376,31 @@ class SmartContractStaking(ARC4Contract):
     # - enforce that method may be allowed in step
     # pre-conditions: None
     # post-conditions: None
+    # notes:
+    # - steps:
+    #   0 Non-existent, nothing initialized
+    #   1 Fresh, funder and owner initialized
+    #   2 Ready, period initialized
+    #   3 Full, funding and total initialized
+    # - Fresh is also Ready since period 0 is
+    #   within bounds
+    # - setup, configure, fill and transfer
+    #   assert what the step implies: funder is
+    #   creator, owner is set, period <= 5,
+    #   funding and total > 0
     ##############################################
     @subroutine
     def enforce_step(self, n: UInt64) -> None:
+        step = self.step
         match n:
             case UInt64(0): # Non-existent
-                assert self.funder == Global.zero_address, "funder must not be initialized"
-                assert self.owner == Global.zero_address, "owner must not be initialized"
-                assert self.period == 0, "period must not be initialize"
-                assert self.funding == 0, "funding must not be initialize"
-                assert self.total == 0, "total must not be initialized"
+                assert step == 0, "step must be non-existent"
             case UInt64(1): # Fresh
-                assert self.funder == Global.creator_address, "funder must be initialize" 
-                assert self.owner != Global.zero_address, "owner must be initialized"
-                assert self.period == 0, "period must not be initialized"
-                assert self.funding == 0, "funding must not be initialized"
-                assert self.total == 0, "total must not be initialized"
+                assert step == 1, "step must be fresh"
             case UInt64(2): # Ready
-                assert self.funder == Global.creator_address, "funder must be initialize"
-                assert self.owner != Global.zero_address, "owner must be initialized"
-                assert self.period <= 5, "period within bounds" 
-                assert self.funding == 0, "funding must not be initialized"
-                assert self.total == 0, "total must not be initialized"
+                assert step == 1 or step == 2, "step must be ready"
             case UInt64(3): # Full
-                assert self.funder == Global.creator_address, "funder must be initialize"
-                assert self.owner != Global.zero_address, "owner must be initialized"
-                assert self.period <= 5, "period within bounds"
-                assert self.funding > 0, "funding must be initialized"
-                assert self.total > 0, "total must be initialized"
+                assert step == 3, "step must be full"
     ##############################################
     # function: calculate_mab (internal)
     # arguments: None
@@ -301,24 +414,22 @@ class SmartContractStaking(ARC4Contract):
     #       p = 1 / (self.period x 12) or 1 / (period)
     # - mimumum allowable balance =
     #     total x min(1, p x max(0, (period - (now() - funding + y x seconds-in-month)) / seconds-in-month))
+    # - lockup_end = funding + p x seconds-in-period
+    #   vesting_end = lockup_end + y x seconds-in-period
+    #   are computed once by fill
     ##############################################
     @subroutine
     def calculate_mab(self) -> UInt64:
         now = Global.latest_timestamp
-        y = TemplateVar[UInt64]("VESTING_DELAY") # vesting delay
-        seconds_in_period = TemplateVar[UInt64]("PERIOD_SECONDS") 
-        p = TemplateVar[UInt64]("LOCKUP_DELAY") * self.period # lockup period
-        locked_up = now < self.funding + p * seconds_in_period
-        fully_vested = now >= self.funding + (y + p) * seconds_in_period
-        lockup_seconds = p * seconds_in_period
         # if locked up then total
         # elif fully vested then zero
         # else calculate mab using elapsed periods
-        if locked_up: #  if locked up then total
+        if now < self.lockup_end: #  if locked up then total
             return self.total 
-        elif fully_vested: #  elif fully vested then zero
+        elif now >= self.vesting_end: #  elif fully vested then zero
             return UInt64(0) 
         else: #  else calculate mab using elapsed periods
-            m =  (now - (self.funding + lockup_seconds)) // seconds_in_period # elapsed period after lockup
+            y = TemplateVar[UInt64]("VESTING_DELAY") # vesting delay
+            m = (now - self.lockup_end) // TemplateVar[UInt64]("PERIOD_SECONDS") # elapsed period after lockup
             return (self.total * (y - m)) // y
 
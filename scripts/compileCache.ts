@@ -0,0 +1,77 @@
+import algosdk from "algosdk";
+
+import { createHash } from "crypto";
+import { mkdirSync, readFileSync, renameSync, unlinkSync, writeFileSync } from "fs";
+import { homedir } from "os";
+import { join } from "path";
+
+// on-disk cache of TEAL compiled by algod
+// - keyed by the sha256 of the source sent to algod, i.e. the TEAL with the
+//   deploy time params substituted, so each parameter set compiles once
+// - entries keep the full source and are verified against it and against the
+//   program hash algod returned, a bad entry is discarded and compiled again
+// - same entries and default directory as staking/compile_cache.py, so both
+//   deploy paths share them
+
+// default directory of staking.compile_cache
+export const DEFAULT_DIRECTORY = join(homedir(), ".cache", "smart-contract-staking", "compiled");
+
+type CompileResponse = { hash: string; result: string; sourcemap?: unknown };
+
+const readEntry = (path: string, source: string, sourcemap: boolean): CompileResponse | undefined => {
+  let entry: { source: string; result: CompileResponse };
+  try {
+    entry = JSON.parse(readFileSync(path, "utf8"));
+  } catch (e: any) {
+    if (e.code !== "ENOENT") unlinkSync(path);
+    return undefined;
+  }
+  const { result } = entry;
+  const program = new Uint8Array(Buffer.from(result?.result ?? "", "base64"));
+  if (entry.source !== source || new algosdk.LogicSigAccount(program).address() !== result.hash) {
+    unlinkSync(path);
+    return undefined;
+  }
+  if (sourcemap && result.sourcemap === undefined) return undefined;
+  return result;
+};
+
+const writeEntry = (directory: string, path: string, source: string, result: CompileResponse) => {
+  mkdirSync(directory, { recursive: true });
+  const temporary = `${path}.${process.pid}.tmp`;
+  writeFileSync(temporary, JSON.stringify({ source, result }));
+  renameSync(temporary, path);
+};
+
+// returns algodClient with compile served from the cache in directory
+export const withCompileCache = (
+  algodClient: algosdk.Algodv2,
+  directory = DEFAULT_DIRECTORY
+): algosdk.Algodv2 =>
+  new Proxy(algodClient, {
+    get(target, prop, receiver) {
+      if (prop !== "compile") return Reflect.get(target, prop, receiver);
+      return (source: string | Uint8Array) => {
+        const request = target.compile(source);
+        const text = typeof source === "string" ? source : Buffer.from(source).toString("utf8");
+        const key = createHash("sha256").update(text).digest("hex");
+        const path = join(directory, `${key}.json`);
+        let sourcemap = false;
+        const cached = {
+          sourcemap(map = true) {
+            sourcemap = map;
+            request.sourcemap(map);
+            return cached;
+          },
+          async do(headers = {}) {
+            const hit = readEntry(path, text, sourcemap);
+            if (hit) return hit;
+            const result = await request.do(headers);
+            writeEntry(directory, path, text, result as CompileResponse);
+            return result;
+          },
+        };
+        return cached;
+      };
+    },
+  });
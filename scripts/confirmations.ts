@@ -0,0 +1,92 @@
+import algosdk from "algosdk";
+
+// confirms submitted groups by following blocks instead of polling each txid
+// - one loop waits for each new round with status/wait-for-block-after and
+//   reads the round's txids, resolving every pending group seen in it, that is
+//   two requests per round however many groups are pending
+// - a group not seen by the end of its last valid round is rejected
+// - the loop only runs while groups are pending
+
+type Group = {
+  txIDs: string[];
+  firstValid: number;
+  lastValid: number;
+  seen: number;
+  resolve: (round: number) => void;
+  reject: (error: unknown) => void;
+};
+
+export class ConfirmationTracker {
+  // last round checked
+  round?: number;
+  private groups = new Set<Group>();
+  private pending = new Map<string, Group>();
+  private running = false;
+
+  constructor(private algodClient: algosdk.Algodv2) {}
+
+  // resolves with the round the group is confirmed in, call before submitting
+  track(txIDs: string[], firstValid: number, lastValid: number): Promise<number> {
+    return new Promise((resolve, reject) => {
+      const group = { txIDs, firstValid, lastValid, seen: 0, resolve, reject };
+      this.groups.add(group);
+      txIDs.forEach((txID) => this.pending.set(txID, group));
+      if (!this.running) {
+        this.running = true;
+        this.run();
+      }
+    });
+  }
+
+  // stops tracking a group that failed to submit, its promise never settles
+  cancel(txIDs: string[]) {
+    const group = this.pending.get(txIDs[0]);
+    if (group) this.remove(group);
+  }
+
+  private remove(group: Group) {
+    this.groups.delete(group);
+    group.txIDs.forEach((txID) => {
+      if (this.pending.get(txID) === group) this.pending.delete(txID);
+    });
+  }
+
+  private async run() {
+    try {
+      let lastRound = Number((await this.algodClient.status().do())["last-round"]);
+      // a group tracked now is submitted after every round checked before
+      let round = Math.min(...[...this.groups].map((group) => group.firstValid));
+      if (this.round !== undefined) round = Math.max(round, this.round + 1);
+      while (this.groups.size) {
+        if (round > lastRound) {
+          lastRound = Number((await this.algodClient.statusAfterBlock(round - 1).do())["last-round"]);
+          continue;
+        }
+        const { blockTxids } = await this.algodClient.getBlockTxids(round).do();
+        for (const txID of blockTxids ?? []) {
+          const group = this.pending.get(txID);
+          if (!group) continue;
+          this.pending.delete(txID);
+          if (++group.seen === group.txIDs.length) {
+            this.remove(group);
+            group.resolve(round);
+          }
+        }
+        for (const group of [...this.groups]) {
+          if (group.lastValid > round) continue;
+          this.remove(group);
+          group.reject(new Error(`Transaction ${group.txIDs[0]} expired after round ${round}`));
+        }
+        this.round = round;
+        round += 1;
+      }
+    } catch (e) {
+      for (const group of [...this.groups]) {
+        this.remove(group);
+        group.reject(e);
+      }
+    } finally {
+      this.running = false;
+    }
+  }
+}
@@ -1,5 +1,9 @@
 import { SmartContractStakingClient, APP_SPEC } from "./SmartContractStakingClient.js"
 
+import { withCompileCache } from "./compileCache.js";
+
+import { ConfirmationTracker } from "./confirmations.js";
+
 import algosdk from "algosdk";
 
 import { CONTRACT } from "ulujs";
@@ -35,16 +39,27 @@ const indexerClient = new algosdk.Indexer(
   process.env.INDEXER_PORT || ""
 );
 
+const confirmations = new ConfirmationTracker(algodClient);
+
 const signSendAndConfirm = async (txns: string[], sk: any) => {
-  const stxns = txns
+  const utxns = txns
     .map((t) => new Uint8Array(Buffer.from(t, "base64")))
-    .map(algosdk.decodeUnsignedTransaction)
-    .map((t: any) => algosdk.signTransaction(t, sk));
-  console.log(stxns.map((res: any) => res.txID));
-  await algodClient.sendRawTransaction(stxns.map((txn: any) => txn.blob)).do();
-  await Promise.all(
-    stxns.map((res: any) => algosdk.waitForConfirmation(algodClient, res.txID, 4))
+    .map(algosdk.decodeUnsignedTransaction);
+  const stxns = utxns.map((t: any) => algosdk.signTransaction(t, sk));
+  const txIDs = stxns.map((res: any) => res.txID);
+  console.log(txIDs);
+  const confirmed = confirmations.track(
+    txIDs,
+    Math.min(...utxns.map((t: any) => t.firstRound)),
+    Math.min(...utxns.map((t: any) => t.lastRound))
   );
+  try {
+    await algodClient.sendRawTransaction(stxns.map((txn: any) => txn.blob)).do();
+  } catch (e) {
+    confirmations.cancel(txIDs);
+    throw e;
+  }
+  return confirmed;
 };
 
 const deployer = {
@@ -68,7 +83,7 @@ do {
     creatorAddress: deployer.addr,
     name: "20",
     sender: deployer,
-  }, algodClient);
+  }, withCompileCache(algodClient));
   const app = await appClient.deploy({
     deployTimeParams: {
       PERIOD_SECONDS: periodSeconds,
@@ -141,7 +156,7 @@ do {
 do {
   break;
   console.log("participate online");
-  ci2.setPaymentAmount(1000);
+  ci2.setFee(2000);
   const participateR = await ci2.participate(
     new Uint8Array(Buffer.from("rqzFOfwFPvMCkVxk/NKgj8idbwrsEGwxDbQwmHwtACE=", "base64")),
     new Uint8Array(Buffer.from("oxigRtYVOHpCD/qldT814sPYeQGzgUfjBOpbD3NHv0Y=", "base64")),
@@ -160,7 +175,7 @@ do {
 do {
   break;
   console.log("participate offline");
-  ci2.setPaymentAmount(1000);
+  ci2.setFee(2000);
   const participateR = await ci2.participate(
     new Uint8Array(32),
     new Uint8Array(32),
@@ -174,18 +189,17 @@ do {
   console.log(res)
 } while (0)
 
-// step 4: owner withdraws (simulate for mab)
+// step 4: read status (simulate for state, mab and available balance)
 
 do {
   break;
-  ci2.setFee(2000)
-  const withdrawR = await ci2.withdraw(0)
-  if (!withdrawR.success) {
-    console.log(withdrawR)
+  const statusR = await ci.status()
+  if (!statusR.success) {
+    console.log(statusR)
     break
   }
-  const withdraw = withdrawR.returnValue;
-  console.log(withdraw)
+  const [owner, funder, period, funding, total, mab, available, step] = statusR.returnValue;
+  console.log({ owner, funder, period, funding, total, mab, available, step })
 } while (0)
 
 // step 4: owner withdraws
@@ -204,6 +218,22 @@ do {
   console.log(res)
 } while (0)
 
+// step 4: owner withdraws everything above mab
+
+do {
+  break;
+  ci2.setFee(2000)
+  const withdrawMaxR = await ci2.withdraw_max()
+  if (!withdrawMaxR.success) {
+    console.log(withdrawMaxR)
+    break
+  }
+  const withdrawMax = withdrawMaxR.returnValue;
+  console.log(withdrawMax)
+  const res = await signSendAndConfirm(withdrawMaxR.txns, sk2)
+  console.log(res)
+} while (0)
+
 // step 4: owner closes
 
 do {
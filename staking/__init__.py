@@ -0,0 +1 @@
+"""Off-chain tooling for fleets of SmartContractStaking apps."""
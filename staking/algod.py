@@ -0,0 +1,281 @@
+"""Asyncio algod client backed by a shared keep-alive connection pool.
+
+Method names, arguments and return values follow `algosdk.v2client.algod.AlgodClient`
+for the endpoints the staking tooling needs, so code can move between the two by
+adding `await`.
+
+`ControlledAlgodClient` is the synchronous `AlgodClient` sending through the same
+`staking.traffic.TrafficController` limits and retries, for tooling that cannot
+be async.
+"""
+import base64
+import json
+import typing
+
+import aiohttp
+from algosdk import constants, encoding, error, transaction
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
+
+from staking.traffic import TrafficController, endpoint
+
+AlgodResponseType = dict[str, typing.Any] | bytes
+
+
+class AsyncAlgodClient:
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        limit: int = 100,
+        keepalive_timeout: float = 30.0,
+        timeout: float = 30.0,
+        controller: TrafficController | None = None,
+    ) -> None:
+        """
+        One instance should be shared by every client in the process, requests are then multiplexed over at most
+        `limit` pooled connections.
+
+        :param str algod_token: algod API token
+        :param str algod_address: algod address
+        :param dict[str, str] headers: (optional) Extra header name/value for all requests
+        :param int limit: Maximum number of pooled connections
+        :param float keepalive_timeout: Seconds an idle connection is kept open
+        :param float timeout: Total timeout of a single request in seconds, for endpoints whose budget sets none
+        :param TrafficController controller: (optional) Per endpoint concurrency limits and retries, see
+        `staking.traffic`
+        """
+        self.algod_token = algod_token
+        self.algod_address = algod_address
+        self.headers = headers
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.controller = controller or TrafficController()
+        self._session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=self.keepalive_timeout),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncAlgodClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: dict[str, typing.Any] | None = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str = "json",
+    ) -> AlgodResponseType:
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        name = endpoint(requrl)
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        timeout = aiohttp.ClientTimeout(total=self.controller.budget(name).timeout or self.timeout)
+
+        async def send() -> bytes:
+            async with self.session.request(
+                method, self.algod_address + requrl, params=params, data=data, headers=header, timeout=timeout
+            ) as resp:
+                body = await resp.read()
+                if resp.status >= 400:
+                    message: typing.Any = body.decode("utf-8", errors="replace")
+                    payload: dict[str, typing.Any] = {}
+                    try:
+                        payload = json.loads(body)
+                        message = payload["message"]
+                    except (ValueError, KeyError):
+                        pass
+                    raise error.AlgodHTTPError(message, resp.status, payload.get("data"))
+            return body
+
+        body = await self.controller.call(name, send)
+
+        if response_format != "json":
+            return body
+        if not body:
+            return {}
+        try:
+            return typing.cast(dict[str, typing.Any], json.loads(body))
+        except ValueError as ex:
+            raise error.AlgodResponseError("Failed to parse JSON response from algod") from ex
+
+    async def status(self) -> dict[str, typing.Any]:
+        return typing.cast(dict[str, typing.Any], await self.algod_request("GET", "/status"))
+
+    async def status_after_block(self, round_num: int) -> dict[str, typing.Any]:
+        return typing.cast(
+            dict[str, typing.Any], await self.algod_request("GET", f"/status/wait-for-block-after/{round_num}")
+        )
+
+    @typing.overload
+    async def block_info(
+        self, round_num: int, response_format: typing.Literal["json"] = "json"
+    ) -> dict[str, typing.Any]: ...
+
+    @typing.overload
+    async def block_info(self, round_num: int, response_format: typing.Literal["msgpack"]) -> bytes: ...
+
+    async def block_info(self, round_num: int, response_format: str = "json") -> AlgodResponseType:
+        return await self.algod_request(
+            "GET", f"/blocks/{round_num}", {"format": response_format}, response_format=response_format
+        )
+
+    async def get_block_txids(self, round_num: int) -> dict[str, typing.Any]:
+        return typing.cast(dict[str, typing.Any], await self.algod_request("GET", f"/blocks/{round_num}/txids"))
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        res = typing.cast(dict[str, typing.Any], await self.algod_request("GET", "/transactions/params"))
+        return transaction.SuggestedParams(
+            res["fee"],
+            res["last-round"],
+            res["last-round"] + 1000,
+            res["genesis-hash"],
+            res["genesis-id"],
+            False,
+            res["consensus-version"],
+            res["min-fee"],
+        )
+
+    async def application_info(self, application_id: int) -> dict[str, typing.Any]:
+        return typing.cast(dict[str, typing.Any], await self.algod_request("GET", f"/applications/{application_id}"))
+
+    async def account_info(self, address: str, exclude: str | None = None) -> dict[str, typing.Any]:
+        params = {"exclude": exclude} if exclude else None
+        return typing.cast(dict[str, typing.Any], await self.algod_request("GET", f"/accounts/{address}", params))
+
+    async def pending_transaction_info(self, transaction_id: str) -> dict[str, typing.Any]:
+        return typing.cast(
+            dict[str, typing.Any],
+            await self.algod_request("GET", f"/transactions/pending/{transaction_id}", {"format": "json"}),
+        )
+
+    async def send_raw_transaction(self, txn: bytes) -> str:
+        """Broadcasts msgpack encoded signed transaction(s), returning the first transaction ID"""
+
+        resp = await self.algod_request(
+            "POST", "/transactions", data=txn, headers={"Content-Type": "application/x-binary"}
+        )
+        return typing.cast(str, typing.cast(dict, resp)["txId"])
+
+    async def send_transactions(self, txns: typing.Iterable[transaction.GenericSignedTransaction]) -> str:
+        serialized = []
+        for txn in txns:
+            assert not isinstance(txn, transaction.Transaction), f"Attempt to send UNSIGNED transaction {txn}"
+            serialized.append(base64.b64decode(encoding.msgpack_encode(txn)))
+        return await self.send_raw_transaction(b"".join(serialized))
+
+    async def simulate_transactions(self, request: models.SimulateRequest) -> dict[str, typing.Any]:
+        body = base64.b64decode(encoding.msgpack_encode(request))
+        return typing.cast(
+            dict[str, typing.Any],
+            await self.algod_request(
+                "POST", "/transactions/simulate", data=body, headers={"Content-Type": "application/msgpack"}
+            ),
+        )
+
+    async def compile(self, source: str, source_map: bool = False) -> dict[str, typing.Any]:
+        return typing.cast(
+            dict[str, typing.Any],
+            await self.algod_request(
+                "POST",
+                "/teal/compile",
+                params={"sourcemap": "true" if source_map else "false"},
+                data=source.encode("utf-8"),
+                headers={"Content-Type": "application/x-binary"},
+            ),
+        )
+
+
+class ControlledAlgodClient(AlgodClient):
+    """`AlgodClient` sending every request through a `TrafficController`"""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        controller: TrafficController | None = None,
+    ) -> None:
+        """
+        :param str algod_token: algod API token
+        :param str algod_address: algod address
+        :param dict[str, str] headers: (optional) Extra header name/value for all requests
+        :param TrafficController controller: (optional) Per endpoint concurrency limits and retries, see
+        `staking.traffic`
+        """
+        super().__init__(algod_token, algod_address, headers)
+        self.controller = controller or TrafficController()
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params: typing.Any = None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: float | None = 30,
+    ) -> typing.Any:
+        name = endpoint(requrl)
+        timeout = self.controller.budget(name).timeout or timeout
+        return self.controller.call_sync(
+            name,
+            # urlopen takes float seconds, algosdk only annotates them as int
+            lambda: AlgodClient.algod_request(
+                self, method, requrl, params, data, headers, response_format, timeout  # type: ignore[arg-type]
+            ),
+        )
+
+
+async def wait_for_confirmation(
+    algod_client: AsyncAlgodClient, txid: str, wait_rounds: int = 0
+) -> dict[str, typing.Any]:
+    """Waits until `txid` is confirmed, mirroring `algosdk.transaction.wait_for_confirmation`
+
+    :raises ConfirmationTimeoutError: If it is not confirmed within `wait_rounds` rounds (default 1000)
+    :raises TransactionRejectedError: If the node dropped it from the pool"""
+
+    last_round = typing.cast(int, (await algod_client.status())["last-round"])
+    current_round = last_round + 1
+    wait_rounds = wait_rounds or 1000
+
+    while True:
+        if current_round > last_round + wait_rounds:
+            raise error.ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out")
+        try:
+            tx_info = await algod_client.pending_transaction_info(txid)
+            if tx_info.get("pool-error"):
+                raise error.TransactionRejectedError("Transaction rejected: " + tx_info["pool-error"])
+            if tx_info.get("confirmed-round"):
+                return tx_info
+        except error.AlgodHTTPError:
+            # a load balanced node that did not see the submission answers 404
+            pass
+        await algod_client.status_after_block(current_round)
+        current_round += 1
@@ -0,0 +1,370 @@
+"""Static worst-case opcode cost and stack depth of the approval program.
+
+`analyze` walks every path through the TEAL without executing it: one entry per
+ABI method selector found in the router, plus the bare calls. Branch conditions
+are tracked symbolically, so a path is only followed where it is feasible for
+the entry being analyzed:
+
+- the router's `match` on `txna ApplicationArgs 0` takes the method's route only
+- facts learned from `bz` / `bnz` / `assert` on transaction fields, e.g.
+  `txn ApplicationID` being non-zero or `txn OnCompletion == DeleteApplication`,
+  prune the branches contradicting them later on
+- constants passed to subroutines are followed through `frame_dig`, so the
+  `switch` in `enforce_step` takes the case of the step the method enforces
+
+Anything else, state, balances and timestamps, is unknown and both branches are
+followed. The worst case of an entry is the most expensive path that approves;
+paths failing an assert are not counted, algod rejects them whatever they cost.
+
+    python -m staking.analyzer [--budget 700]    # exits 1 if an entry exceeds the budget
+
+No execution is needed, an analysis takes milliseconds.
+"""
+import argparse
+import dataclasses
+import re
+import sys
+import typing
+
+from staking.avm import ARTIFACTS, MAX_APP_PROGRAM_COST, Program, _parse_int
+
+MAX_STACK_DEPTH = 1000
+MAX_PATH_LENGTH = 100_000
+
+# stack value: a constant, a transaction field, `!` or `==` of those, or None when unknown
+_Value = typing.Union[int, bytes, str, tuple, None]
+
+# (pops, pushes) of opcodes pushing only unknown values
+_EFFECTS: dict[str, tuple[int, int]] = {
+    **{op: (2, 1) for op in ("+", "-", "*", "/", "%", "<", ">", "<=", ">=", "&&", "||", "concat")},
+    **{op: (2, 1) for op in ("b<", "b>", "b<=", "b>=")},
+    **{op: (1, 1) for op in ("len", "itob", "btoi", "extract", "balance", "gtxns", "app_global_get")},
+    **{op: (1, 0) for op in ("log", "pop", "itxn_field", "app_global_del")},
+    "app_global_get_ex": (2, 2),
+    "app_global_put": (2, 0),
+    "global": (0, 1),
+    "gtxn": (0, 1),
+    "itxn_begin": (0, 0),
+    "itxn_submit": (0, 0),
+}
+
+
+@dataclasses.dataclass(kw_only=True)
+class EntryReport:
+    entry: str
+    selector: bytes | None
+    cost: int
+    stack_depth: int
+    paths: int
+    rejected_paths: int
+
+
+class _State:
+    __slots__ = ("pc", "stack", "frames", "eq", "ne", "cost", "depth", "steps")
+
+    def __init__(self) -> None:
+        self.pc = 0
+        self.stack: list[_Value] = []
+        self.frames: list[tuple[int, int, int, int]] = []
+        # exact and excluded values of transaction fields
+        self.eq: dict[str, int | bytes] = {}
+        self.ne: dict[str, frozenset] = {}
+        self.cost = 0
+        self.depth = 0
+        self.steps = 0
+
+    def copy(self) -> "_State":
+        state = _State()
+        state.pc = self.pc
+        state.stack = list(self.stack)
+        state.frames = list(self.frames)
+        state.eq = dict(self.eq)
+        state.ne = dict(self.ne)
+        state.cost = self.cost
+        state.depth = self.depth
+        state.steps = self.steps
+        return state
+
+    def truth(self, value: _Value) -> bool | None:
+        """Returns whether `value` is non-zero, None if that is unknown"""
+
+        if isinstance(value, int):
+            return value != 0
+        if isinstance(value, str):
+            if value in self.eq:
+                return self.eq[value] != 0
+            return True if 0 in self.ne.get(value, ()) else None
+        if isinstance(value, tuple) and value[0] == "!":
+            truth = self.truth(value[1])
+            return None if truth is None else not truth
+        if isinstance(value, tuple) and value[0] == "==":
+            _, field, constant = value
+            if field in self.eq:
+                return self.eq[field] == constant
+            return False if constant in self.ne.get(field, ()) else None
+        return None
+
+    def assume(self, value: _Value, truth: bool) -> bool:
+        """Records that `value` is non-zero if `truth`, zero otherwise, returning False if that is infeasible"""
+
+        known = self.truth(value)
+        if known is not None:
+            return known == truth
+        if isinstance(value, str):
+            if truth:
+                self.ne[value] = self.ne.get(value, frozenset()) | {0}
+            else:
+                self.eq[value] = 0
+        elif isinstance(value, tuple) and value[0] == "!":
+            return self.assume(value[1], not truth)
+        elif isinstance(value, tuple) and value[0] == "==":
+            _, field, constant = value
+            if truth:
+                self.eq[field] = constant
+            else:
+                self.ne[field] = self.ne.get(field, frozenset()) | {constant}
+        return True
+
+
+def _is_constant(value: _Value) -> bool:
+    return isinstance(value, (int, bytes))
+
+
+def _equals(a: _Value, b: _Value) -> _Value:
+    if _is_constant(a) and _is_constant(b):
+        return int(type(a) is type(b) and a == b)
+    if isinstance(a, str) and _is_constant(b):
+        return ("==", a, b)
+    if isinstance(b, str) and _is_constant(a):
+        return ("==", b, a)
+    return None
+
+
+def _not(value: _Value) -> _Value:
+    if isinstance(value, int):
+        return int(value == 0)
+    if value is None or isinstance(value, bytes):
+        return None
+    return ("!", value)
+
+
+class _Analysis:
+    def __init__(self, program: Program) -> None:
+        self.program = program
+        self.worst: _State | None = None
+        self.depth = 0
+        self.paths = 0
+        self.rejected = 0
+
+    def _finish(self, state: _State, approved: bool) -> None:
+        if not approved:
+            self.rejected += 1
+            return
+        self.paths += 1
+        self.depth = max(self.depth, state.depth)
+        if self.worst is None or state.cost > self.worst.cost:
+            self.worst = state
+
+    def run(self, state: _State) -> None:
+        pending = [state]
+        while pending:
+            state = pending.pop()
+            pending.extend(self._step_until_fork(state))
+
+    def _step_until_fork(self, state: _State) -> list[_State]:  # noqa: C901
+        program = self.program
+        while True:
+            if state.pc >= len(program):
+                self._finish(state, len(state.stack) == 1 and state.truth(state.stack[0]) is not False)
+                return []
+            state.steps += 1
+            if state.steps > MAX_PATH_LENGTH:
+                raise ValueError(f"path longer than {MAX_PATH_LENGTH} steps, the program may loop")
+            tokens = program.tokens[state.pc]
+            op, args = tokens[0], tokens[1:]
+            state.cost += program.costs[state.pc]
+            stack = state.stack
+            next_pc = state.pc + 1
+
+            if op in ("int", "pushint"):
+                stack.append(None if args[0].startswith("TMPL_") else _parse_int(args[0], {}))
+            elif op in ("byte", "pushbytes", "method", "addr"):
+                stack.append(program._byte_constant(tokens))
+            elif op in ("txn", "txna"):
+                stack.append(" ".join(tokens))
+            elif op == "==":
+                b, a = stack.pop(), stack.pop()
+                stack.append(_equals(a, b))
+            elif op == "!=":
+                b, a = stack.pop(), stack.pop()
+                stack.append(_not(_equals(a, b)))
+            elif op == "!":
+                stack.append(_not(stack.pop()))
+            elif op == "assert":
+                if not state.assume(stack.pop(), True):
+                    self._finish(state, False)
+                    return []
+            elif op == "err":
+                self._finish(state, False)
+                return []
+            elif op == "return":
+                self._finish(state, state.truth(stack.pop()) is not False)
+                return []
+            elif op in ("b", "callsub"):
+                if op == "callsub":
+                    state.frames.append((next_pc, len(stack), -1, 0))
+                next_pc = program.labels[args[0]]
+            elif op in ("bz", "bnz"):
+                condition = stack.pop()
+                target = program.labels[args[0]]
+                taken = op == "bnz"
+                forks = []
+                for truth, pc in ((taken, target), (not taken, next_pc)):
+                    fork = state.copy()
+                    if fork.assume(condition, truth):
+                        fork.pc = pc
+                        forks.append(fork)
+                return self._forks(state, forks)
+            elif op in ("switch", "match"):
+                targets = [program.labels[label] for label in args]
+                if op == "switch":
+                    cases: list[_Value] = list(range(len(targets)))
+                    value = stack.pop()
+                else:
+                    value = stack.pop()
+                    cases = stack[-len(targets):]
+                    del stack[-len(targets):]
+                forks = []
+                for case, target in [*zip(cases, targets), (None, next_pc)]:
+                    fork = state.copy()
+                    if case is None:
+                        # no case matched, every case must differ
+                        if all(fork.assume(_equals(value, other), False) for other in cases):
+                            fork.pc = target
+                            forks.append(fork)
+                    elif fork.assume(_equals(value, case), True):
+                        fork.pc = target
+                        forks.append(fork)
+                return self._forks(state, forks)
+            elif op == "proto":
+                return_pc, _, _, _ = state.frames[-1]
+                state.frames[-1] = (return_pc, len(stack), int(args[0]), int(args[1]))
+            elif op == "retsub":
+                return_pc, frame_pointer, arguments, returns = state.frames.pop()
+                if arguments >= 0:
+                    stack[frame_pointer - arguments:] = stack[frame_pointer:frame_pointer + returns]
+                next_pc = return_pc
+            elif op == "frame_dig":
+                stack.append(stack[state.frames[-1][1] + int(args[0])])
+            elif op == "frame_bury":
+                value = stack.pop()
+                stack[state.frames[-1][1] + int(args[0])] = value
+            elif op == "dup":
+                stack.append(stack[-1])
+            elif op == "dup2":
+                stack.extend(stack[-2:])
+            elif op == "dupn":
+                stack.extend([stack[-1]] * int(args[0]))
+            elif op == "swap":
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+            elif op == "dig":
+                stack.append(stack[-1 - int(args[0])])
+            elif op == "bury":
+                stack[-1 - int(args[0])] = stack.pop()
+            elif op == "cover":
+                stack.insert(len(stack) - 1 - int(args[0]), stack.pop())
+            elif op == "uncover":
+                stack.append(stack.pop(-1 - int(args[0])))
+            elif op == "popn":
+                del stack[len(stack) - int(args[0]):]
+            elif op in _EFFECTS:
+                pops, pushes = _EFFECTS[op]
+                if len(stack) < pops:
+                    raise ValueError(f"stack underflow at line {program.lines[state.pc]}")
+                del stack[len(stack) - pops:]
+                stack.extend([None] * pushes)
+            else:
+                raise ValueError(f"unsupported opcode {op} at line {program.lines[state.pc]}")
+            state.depth = max(state.depth, len(stack))
+            state.pc = next_pc
+
+    def _forks(self, state: _State, forks: list[_State]) -> list[_State]:
+        if not forks:
+            self._finish(state, False)
+        return forks
+
+
+def selectors(program: Program) -> dict[str, bytes]:
+    """Returns the selector of every ABI method the router matches, by signature"""
+
+    return {
+        tokens[1][1:-1]: program._byte_constant(tokens) for tokens in program.tokens if tokens[0] == "method"
+    }
+
+
+def _entry(program: Program, facts: dict[str, int | bytes], not_zero: typing.Iterable[str] = ()) -> _State:
+    state = _State()
+    state.eq.update(facts)
+    for field in not_zero:
+        state.ne[field] = frozenset({0})
+    return state
+
+
+def analyze(program: Program) -> list[EntryReport]:
+    """Returns the worst-case cost and stack depth of every ABI method, then of the bare create and bare calls"""
+
+    entries: list[tuple[str, bytes | None, _State]] = [
+        (signature, selector, _entry(program, {"txna ApplicationArgs 0": selector}, ["txn NumAppArgs"]))
+        for signature, selector in selectors(program).items()
+    ]
+    entries.append(("create (bare)", None, _entry(program, {"txn NumAppArgs": 0, "txn ApplicationID": 0})))
+    entries.append(("call (bare)", None, _entry(program, {"txn NumAppArgs": 0}, ["txn ApplicationID"])))
+    reports = []
+    for name, selector, state in entries:
+        analysis = _Analysis(program)
+        analysis.run(state)
+        worst = analysis.worst
+        reports.append(
+            EntryReport(
+                entry=name,
+                selector=selector,
+                cost=program.prologue_cost + worst.cost if worst else 0,
+                stack_depth=analysis.depth,
+                paths=analysis.paths,
+                rejected_paths=analysis.rejected,
+            )
+        )
+    return reports
+
+
+def load(path: str | None = None) -> Program:
+    """Assembles the approval program, template variables are analyzed as unknown values"""
+
+    source = open(path).read() if path else (ARTIFACTS / "SmartContractStaking.approval.teal").read_text()
+    # any value does, `int TMPL_*` is not followed as a constant
+    return Program(source, {name: 1 for name in re.findall(r"TMPL_(\w+)", source)})
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("teal", nargs="?", help="approval program, defaults to the compiled artifact")
+    parser.add_argument("--budget", type=int, default=MAX_APP_PROGRAM_COST, help="opcode budget per app call")
+    args = parser.parse_args(argv)
+
+    reports = analyze(load(args.teal))
+    over = False
+    print(f"{'entry':<80} {'cost':>5} {'stack':>5} {'paths':>5}")
+    for report in reports:
+        if not report.paths:
+            print(f"{report.entry:<80} {'rejected':>17}")
+            continue
+        flag = ""
+        if report.cost > args.budget or report.stack_depth > MAX_STACK_DEPTH:
+            over = True
+            flag = " !"
+        print(f"{report.entry:<80} {report.cost:>5} {report.stack_depth:>5} {report.paths:>5}{flag}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Persistent (creator, name) -> app index for resolving deploys without the indexer.
+
+`ApplicationClient.deploy` resolves an existing app by creator and name through
+`algokit_utils.get_creator_apps`, which reads every app the creator made and its
+transactions on each run. `AppIndex` keeps the same metadata in a local SQLite
+database, built from algokit's deployer notes (`NOTE_PREFIX`) in the blocks it
+follows:
+
+- an app create sent with a deployer note adds the app under its creator and name
+- a later app call the creator sends with a deployer note, i.e. an update,
+  updates the version and flags
+- a DeleteApplication call marks the app deleted
+
+A lookup is one primary key read. `seed` imports a `get_creator_apps` scan so
+creators with a history do not need to be followed from genesis, `sync` then
+applies new blocks from the checkpoint on, each block in one transaction.
+
+    index = AppIndex("apps.sqlite")
+    await index.sync(algod_client, until=last_round)
+    client = SmartContractStakingClient(
+        algod_client, creator=creator, existing_deployments=index.app_lookup(creator, name), ...
+    )
+"""
+import asyncio
+import json
+import sqlite3
+import typing
+
+from algokit_utils import AppDeployMetaData, AppLookup, AppMetaData
+from algokit_utils.deploy import NOTE_PREFIX
+from algosdk.logic import get_application_address
+
+from staking.algod import AsyncAlgodClient
+from staking.blocks import follow_blocks, note, transactions
+
+DELETE_APPLICATION = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS apps (
+    creator TEXT NOT NULL,
+    name TEXT NOT NULL,
+    app_id INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    deletable INTEGER,
+    updatable INTEGER,
+    created_round INTEGER NOT NULL,
+    updated_round INTEGER NOT NULL,
+    created_metadata TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (creator, name)
+);
+CREATE INDEX IF NOT EXISTS apps_app_id ON apps (app_id);
+CREATE TABLE IF NOT EXISTS checkpoint (id INTEGER PRIMARY KEY CHECK (id = 0), round INTEGER NOT NULL);
+"""
+
+
+def _metadata(txn: dict[str, typing.Any]) -> AppDeployMetaData | None:
+    try:
+        value = note(txn).decode("utf-8")
+        if not value.startswith(NOTE_PREFIX):
+            return None
+        metadata = AppDeployMetaData.decode(value.encode("utf-8"))
+    except (ValueError, TypeError, KeyError):
+        return None
+    return metadata if metadata.name else None
+
+
+def _flag(value: bool | None) -> int | None:
+    return None if value is None else int(value)
+
+
+def _unflag(value: int | None) -> bool | None:
+    return None if value is None else bool(value)
+
+
+class AppIndex:
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        :param str path: SQLite database file, created if missing
+        """
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @property
+    def round(self) -> int | None:
+        """Last round applied, None if nothing was applied or seeded yet"""
+
+        row = self.connection.execute("SELECT round FROM checkpoint WHERE id = 0").fetchone()
+        return None if row is None else typing.cast(int, row[0])
+
+    def _checkpoint(self, round_num: int) -> None:
+        self.connection.execute(
+            "INSERT INTO checkpoint (id, round) VALUES (0, ?) ON CONFLICT (id) DO UPDATE SET round = excluded.round",
+            (round_num,),
+        )
+
+    def _create(
+        self, creator: str, app_id: int, metadata: AppDeployMetaData, round_num: int, created: AppDeployMetaData
+    ) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO apps VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+            (
+                creator,
+                created.name,
+                app_id,
+                metadata.version,
+                _flag(metadata.deletable),
+                _flag(metadata.updatable),
+                round_num,
+                round_num,
+                json.dumps(created.__dict__),
+            ),
+        )
+
+    def apply_block(self, round_num: int, block: dict[str, typing.Any]) -> None:
+        """Applies the deploys, updates and deletes of `block`, ignoring rounds already applied
+
+        :param int round_num: Round of `block`
+        :param dict block: Block in algod's JSON encoding, see `staking.blocks`"""
+
+        checkpoint = self.round
+        if checkpoint is not None and round_num <= checkpoint:
+            return
+        with self.connection:
+            for stxn in transactions(block):
+                txn = stxn["txn"]
+                if txn.get("type") != "appl":
+                    continue
+                app_id = txn.get("apid")
+                if app_id is None:
+                    # created, the new app's ID is in the apply data
+                    metadata = _metadata(txn)
+                    if metadata is not None and "apid" in stxn:
+                        self._create(txn["snd"], stxn["apid"], metadata, round_num, metadata)
+                    continue
+                if txn.get("apan") == DELETE_APPLICATION:
+                    self.connection.execute("UPDATE apps SET deleted = 1 WHERE app_id = ?", (app_id,))
+                metadata = _metadata(txn)
+                if metadata is not None:
+                    self.connection.execute(
+                        "UPDATE apps SET version = ?, deletable = ?, updatable = ?, updated_round = ? "
+                        "WHERE app_id = ? AND creator = ?",
+                        (
+                            metadata.version,
+                            _flag(metadata.deletable),
+                            _flag(metadata.updatable),
+                            round_num,
+                            app_id,
+                            txn["snd"],
+                        ),
+                    )
+            self._checkpoint(round_num)
+
+    def seed(self, lookup: AppLookup, round_num: int) -> None:
+        """Imports a `get_creator_apps` scan taken at `round_num`, sync then continues from the following round"""
+
+        with self.connection:
+            for app in lookup.apps.values():
+                self._create(
+                    lookup.creator,
+                    app.app_id,
+                    AppDeployMetaData(app.name, app.version, app.deletable, app.updatable),
+                    app.created_round,
+                    app.created_metadata,
+                )
+                self.connection.execute(
+                    "UPDATE apps SET updated_round = ?, deleted = ? WHERE creator = ? AND name = ?",
+                    (app.updated_round, int(app.deleted), lookup.creator, app.created_metadata.name),
+                )
+            checkpoint = self.round
+            if checkpoint is None or round_num > checkpoint:
+                self._checkpoint(round_num)
+
+    async def sync(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        start_round: int | None = None,
+        until: int | None = None,
+        stop: asyncio.Event | None = None,
+    ) -> None:
+        """Applies blocks from the round after the checkpoint on
+
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param int start_round: (optional) First round when nothing was applied yet, defaults to the latest round
+        :param int until: (optional) Last round to apply, otherwise new blocks are followed until `stop` is set
+        :param asyncio.Event stop: (optional) Event ending the sync"""
+
+        checkpoint = self.round
+        if checkpoint is not None:
+            start_round = checkpoint + 1
+        elif start_round is None:
+            start_round = typing.cast(int, (await algod_client.status())["last-round"])
+        async for round_num, block in follow_blocks(algod_client, start_round, until=until, stop=stop):
+            self.apply_block(round_num, block)
+
+    def _row(self, row: tuple) -> AppMetaData:
+        _, name, app_id, version, deletable, updatable, created_round, updated_round, created, deleted = row
+        return AppMetaData(
+            app_id=app_id,
+            app_address=get_application_address(app_id),
+            name=name,
+            version=version,
+            deletable=_unflag(deletable),
+            updatable=_unflag(updatable),
+            created_round=created_round,
+            updated_round=updated_round,
+            created_metadata=AppDeployMetaData(**json.loads(created)),
+            deleted=bool(deleted),
+        )
+
+    def lookup(self, creator: str, name: str) -> AppMetaData | None:
+        """Returns the app `creator` deployed as `name`, as `get_creator_apps` would"""
+
+        row = self.connection.execute("SELECT * FROM apps WHERE creator = ? AND name = ?", (creator, name)).fetchone()
+        return None if row is None else self._row(row)
+
+    def app_lookup(self, creator: str, name: str | None = None) -> AppLookup:
+        """Returns `existing_deployments` for an `ApplicationClient` of `creator`
+
+        :param str creator: Creator address
+        :param str name: (optional) Only include the app deployed as `name`, all a deploy of `name` reads"""
+
+        if name is None:
+            rows = self.connection.execute("SELECT * FROM apps WHERE creator = ?", (creator,)).fetchall()
+        else:
+            rows = self.connection.execute(
+                "SELECT * FROM apps WHERE creator = ? AND name = ?", (creator, name)
+            ).fetchall()
+        return AppLookup(creator, {row[1]: self._row(row) for row in rows})
@@ -0,0 +1,714 @@
+"""Asyncio variant of the generated `SmartContractStakingClient`.
+
+Calls are built with the generated `Composer` and signed locally, only the algod
+round trips are awaited. Every client created against the same `AsyncAlgodClient`
+shares its keep-alive connection pool, so one process can keep thousands of state
+reads and submissions in flight with `asyncio.gather`.
+
+Creating and deploying apps compiles TEAL and stays on the synchronous client.
+`load_source_map` compiles the deployed approval program once, through a
+`CompileCache` if given, so logic errors carry the TEAL line algod failed at.
+"""
+import asyncio
+import base64
+import typing
+
+import algokit_utils
+import algosdk
+from algokit_utils.deploy import replace_template_variables, strip_comments
+from algokit_utils.logic_error import LogicError, parse_logic_error
+from algosdk.atomic_transaction_composer import (
+    ABIResult,
+    AtomicTransactionComposer,
+    AtomicTransactionComposerStatus,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+)
+from algosdk.source_map import SourceMap
+from algosdk.v2client import models
+
+from artifacts.SmartContractStakingClient import (
+    APP_SPEC,
+    CloseArgs,
+    Composer,
+    ConfigureArgs,
+    FillArgs,
+    GlobalState,
+    ParticipateArgs,
+    SetupArgs,
+    SimulateOptions,
+    StatusArgs,
+    TransferArgs,
+    WithdrawArgs,
+    WithdrawMaxArgs,
+)
+from staking.algod import AsyncAlgodClient, wait_for_confirmation
+from staking.compile_cache import CompileCache
+from staking.confirmations import ConfirmationTracker
+from staking.fees import fee_pooled_parameters
+from staking.instrumentation import NO_STAGE, Instrumentation
+from staking.params import SHARED, SuggestedParamsCache
+
+__all__ = [
+    "AsyncComposer",
+    "AsyncSmartContractStakingClient",
+    "CloseArgs",
+    "ConfigureArgs",
+    "FillArgs",
+    "GlobalState",
+    "ParticipateArgs",
+    "SetupArgs",
+    "SimulateOptions",
+    "StatusArgs",
+    "TransferArgs",
+    "WithdrawArgs",
+    "WithdrawMaxArgs",
+]
+
+_ComposeCall = typing.Callable[[Composer], Composer]
+
+
+def _label(atc: AtomicTransactionComposer) -> str:
+    return ",".join(dict.fromkeys(method.name for method in atc.method_dict.values())) or "bare"
+
+
+def decode_global_state(state: list[dict[str, typing.Any]]) -> dict[bytes, bytes | int]:
+    """Decodes the `global-state` of an algod application response with raw keys, as `get_global_state(raw=True)`"""
+
+    decoded: dict[bytes, bytes | int] = {}
+    for state_value in state:
+        value = state_value["value"]
+        if value["type"] == 1:
+            decoded[base64.b64decode(state_value["key"])] = base64.b64decode(value["bytes"])
+        else:
+            decoded[base64.b64decode(state_value["key"])] = value["uint"]
+    return decoded
+
+
+class _SimulateResult:
+    """Stands in for the algod client inside `AtomicTransactionComposer.simulate` once the response was awaited"""
+
+    def __init__(self, response: dict[str, typing.Any]):
+        self._response = response
+
+    def simulate_transactions(self, request: models.SimulateRequest) -> dict[str, typing.Any]:
+        return self._response
+
+
+class AsyncComposer:
+    """Queues calls like the generated `Composer`, building the group only once suggested params were awaited
+
+    `participate`, `withdraw`, `withdraw_max` and `delete_close` pay their inner transaction through fee pooling,
+    see `staking.fees`, unless `transaction_parameters` carry suggested params.
+    """
+
+    def __init__(self, client: "AsyncSmartContractStakingClient", atc: AtomicTransactionComposer):
+        self.client = client
+        self.atc = atc
+        self._calls: list[_ComposeCall] = []
+        # ABI method names of the queued calls, for instrumentation
+        self._methods: list[str] = []
+
+    def _pooled(
+        self, method: str, transaction_parameters: algokit_utils.TransactionParameters | None
+    ) -> algokit_utils.TransactionParameters | None:
+        # called once params were awaited, the caller's own suggested params are kept as they are
+        if transaction_parameters is not None and transaction_parameters.suggested_params is not None:
+            return transaction_parameters
+        sp = typing.cast(algosdk.transaction.SuggestedParams, self.client.app_client.suggested_params)
+        return fee_pooled_parameters(method, sp, transaction_parameters)
+
+    def _queue(self, method: str, call: _ComposeCall) -> "AsyncComposer":
+        self._methods.append(method)
+        self._calls.append(call)
+        return self
+
+    async def build(self) -> AtomicTransactionComposer:
+        if self._calls:
+            instrumentation = self.client.instrumentation
+            label = ",".join(dict.fromkeys(self._methods)) if instrumentation else ""
+            with instrumentation.stage(label, "params") if instrumentation else NO_STAGE:
+                await self.client.prepare()
+            with instrumentation.stage(label, "encode") if instrumentation else NO_STAGE:
+                composer = Composer(self.client.app_client, self.atc)
+                calls, self._calls, self._methods = self._calls, [], []
+                for call in calls:
+                    call(composer)
+        return self.atc
+
+    async def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        return await self.client.simulate_atc(await self.build(), options)
+
+    async def execute(self) -> AtomicTransactionResponse:
+        return await self.client.execute_atc(await self.build())
+
+    def setup(
+        self,
+        *,
+        owner: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `setup(address)void` ABI method
+
+        :param str owner: The `owner` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue("setup", lambda c: c.setup(owner=owner, transaction_parameters=transaction_parameters))
+
+    def configure(
+        self,
+        *,
+        period: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `configure(uint64)void` ABI method
+
+        :param int period: The `period` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue(
+            "configure", lambda c: c.configure(period=period, transaction_parameters=transaction_parameters)
+        )
+
+    def fill(
+        self,
+        *,
+        total: int,
+        funding: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `fill(uint64,uint64)void` ABI method
+
+        :param int total: The `total` ABI parameter
+        :param int funding: The `funding` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue(
+            "fill",
+            lambda c: c.fill(total=total, funding=funding, transaction_parameters=transaction_parameters)
+        )
+
+    def participate(
+        self,
+        *,
+        vote_k: bytes | bytearray,
+        sel_k: bytes | bytearray,
+        vote_fst: int,
+        vote_lst: int,
+        vote_kd: int,
+        sp_key: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `participate(byte[],byte[],uint64,uint64,uint64,byte[])void` ABI method
+
+        :param bytes | bytearray vote_k: The `vote_k` ABI parameter
+        :param bytes | bytearray sel_k: The `sel_k` ABI parameter
+        :param int vote_fst: The `vote_fst` ABI parameter
+        :param int vote_lst: The `vote_lst` ABI parameter
+        :param int vote_kd: The `vote_kd` ABI parameter
+        :param bytes | bytearray sp_key: The `sp_key` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue(
+            "participate",
+            lambda c: c.participate(
+                vote_k=vote_k,
+                sel_k=sel_k,
+                vote_fst=vote_fst,
+                vote_lst=vote_lst,
+                vote_kd=vote_kd,
+                sp_key=sp_key,
+                transaction_parameters=self._pooled("participate", transaction_parameters),
+            )
+        )
+
+    def withdraw(
+        self,
+        *,
+        amount: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `withdraw(uint64)uint64` ABI method
+
+        :param int amount: The `amount` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue(
+            "withdraw",
+            lambda c: c.withdraw(
+                amount=amount, transaction_parameters=self._pooled("withdraw", transaction_parameters)
+            ),
+        )
+
+    def withdraw_max(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `withdraw_max()uint64` ABI method
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue(
+            "withdraw_max",
+            lambda c: c.withdraw_max(transaction_parameters=self._pooled("withdraw_max", transaction_parameters)),
+        )
+
+    def transfer(
+        self,
+        *,
+        owner: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `transfer(address)void` ABI method
+
+        :param str owner: The `owner` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue("transfer", lambda c: c.transfer(owner=owner, transaction_parameters=transaction_parameters))
+
+    def delete_close(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `close()void` ABI method
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue(
+            "close", lambda c: c.delete_close(transaction_parameters=self._pooled("close", transaction_parameters))
+        )
+
+    def status(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to `status()(address,address,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns AsyncComposer: This AsyncComposer instance"""
+
+        return self._queue("status", lambda c: c.status(transaction_parameters=transaction_parameters))
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "AsyncComposer":
+        """Adds a call to the application with on completion set to ClearState
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+
+        return self._queue("bare", lambda c: c.clear_state(transaction_parameters, app_args))
+
+
+class AsyncSmartContractStakingClient:
+    """Asyncio counterpart of `SmartContractStakingClient` for an existing app"""
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        app_id: int,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        wait_rounds: int = 4,
+        confirmations: ConfirmationTracker | None = None,
+        params_cache: SuggestedParamsCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        approval_source_map: SourceMap | None = None,
+    ) -> None:
+        """
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param int app_id: The app_id of an existing application
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param SuggestedParams suggested_params: Fixed params to use, otherwise taken from `params_cache`
+        :param int wait_rounds: Rounds to wait for a submitted group to be confirmed when polling
+        :param ConfirmationTracker confirmations: (optional) Tracker confirming submitted groups from new blocks
+        instead of polling each one, groups then wait until their last valid round
+        :param SuggestedParamsCache params_cache: (optional) Cache of suggested params, defaults to the one shared by
+        the process
+        :param Instrumentation instrumentation: (optional) Records the latency of each stage of every call, bytes sent,
+        opcode cost and errors, see `staking.instrumentation`
+        :param SourceMap approval_source_map: (optional) Source map of the deployed approval program, see
+        `load_source_map`
+        """
+
+        self.app_spec = APP_SPEC
+        self.algod_client = algod_client
+        self.wait_rounds = wait_rounds
+        self.confirmations = confirmations
+        self.params_cache = params_cache or SHARED
+        self.instrumentation = instrumentation
+        self.approval_source_map = approval_source_map
+        self._suggested_params = suggested_params
+        # the synchronous client only builds transactions here, it never gets to talk to algod
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=None,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self._suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self._suggested_params = value
+        self.app_client.suggested_params = value
+
+    async def prepare(self) -> None:
+        """Sets suggested params for the next group from the cache unless fixed params were given"""
+
+        if self._suggested_params is None:
+            self.app_client.suggested_params = await self.params_cache.get_async(self.algod_client)
+
+    async def load_source_map(
+        self, template_values: typing.Mapping[str, int], compile_cache: CompileCache | None = None
+    ) -> SourceMap:
+        """Compiles the approval program as deployed with `template_values` and keeps its source map for logic errors
+
+        :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+        :param CompileCache compile_cache: (optional) Cache to compile through, shared with deploys
+        :returns SourceMap: The source map, also set as `approval_source_map`"""
+
+        # the source deploys compile, so the cache entry is shared
+        source = strip_comments(replace_template_variables(self.app_spec.approval_program, template_values))
+        if compile_cache is not None:
+            result = await compile_cache.compile_async(self.algod_client, source, source_map=True)
+        else:
+            result = await self.algod_client.compile(source, source_map=True)
+        self.approval_source_map = SourceMap(result["sourcemap"])
+        return self.approval_source_map
+
+    def _logic_error(self, ex: Exception) -> Exception | None:
+        data = parse_logic_error(str(ex))
+        if data is None:
+            return None
+        return LogicError(
+            logic_error_str=str(ex),
+            logic_error=ex,
+            program=self.app_spec.approval_program,
+            source_map=self.approval_source_map,
+            **data,
+        )
+
+    async def execute_atc(self, atc: AtomicTransactionComposer) -> AtomicTransactionResponse:
+        """Signs, submits and waits for `atc`, the asyncio equivalent of `AtomicTransactionComposer.execute`"""
+
+        instrumentation = self.instrumentation
+        with instrumentation.stage(_label(atc), "sign") if instrumentation else NO_STAGE:
+            signed = atc.gather_signatures()
+            blob = b"".join(base64.b64decode(algosdk.encoding.msgpack_encode(txn)) for txn in signed)
+        return await self.execute_signed(atc, atc.tx_ids, blob)
+
+    async def execute_signed(
+        self, atc: AtomicTransactionComposer, tx_ids: list[str], signed: bytes
+    ) -> AtomicTransactionResponse:
+        """Submits and waits for the group of `atc` signed elsewhere, e.g. by a `staking.signing.SigningPool`
+
+        :param AtomicTransactionComposer atc: Composer the group was built with, its ABI results are parsed
+        :param list[str] tx_ids: IDs of the signed transactions, in group order
+        :param bytes signed: Signed group, msgpack encoded"""
+
+        instrumentation = self.instrumentation
+        label = _label(atc) if instrumentation else ""
+        confirmation = None
+        try:
+            if self.confirmations is not None:
+                txns = [txn.txn for txn in atc.txn_list]
+                confirmation = self.confirmations.track(
+                    tx_ids,
+                    min(txn.first_valid_round for txn in txns),
+                    min(txn.last_valid_round for txn in txns),
+                )
+            with instrumentation.stage(label, "send") if instrumentation else NO_STAGE:
+                await self.algod_client.send_raw_transaction(signed)
+                if instrumentation:
+                    instrumentation.sent(label, len(signed))
+            atc.status = AtomicTransactionComposerStatus.SUBMITTED
+            with instrumentation.stage(label, "confirm") if instrumentation else NO_STAGE:
+                if confirmation is not None:
+                    tx_infos = dict(zip(tx_ids, await confirmation))
+                    confirmed = tx_infos[tx_ids[0]]
+                else:
+                    confirmed = await wait_for_confirmation(self.algod_client, tx_ids[0], self.wait_rounds)
+                    tx_infos = {tx_ids[0]: confirmed}
+            atc.status = AtomicTransactionComposerStatus.COMMITTED
+        except Exception as ex:
+            if confirmation is not None:
+                confirmation.cancel()
+            logic_error = self._logic_error(ex)
+            if instrumentation:
+                instrumentation.failed(label, logic_error or ex)
+            if logic_error:
+                raise logic_error from ex
+            raise
+
+        async def parse(index: int, method: algosdk.abi.Method) -> ABIResult:
+            tx_id = tx_ids[index]
+            try:
+                tx_info = tx_infos.get(tx_id) or await self.algod_client.pending_transaction_info(tx_id)
+                return atc.parse_result(method, tx_id, tx_info)
+            except Exception as ex:
+                return ABIResult(
+                    tx_id=tx_id, raw_value=bytes(), return_value=None, decode_error=ex, tx_info={}, method=method
+                )
+
+        with instrumentation.stage(label, "decode") if instrumentation else NO_STAGE:
+            results = await asyncio.gather(*(parse(index, method) for index, method in atc.method_dict.items()))
+        return AtomicTransactionResponse(
+            confirmed_round=confirmed["confirmed-round"], tx_ids=tx_ids, results=list(results)
+        )
+
+    async def simulate_atc(
+        self, atc: AtomicTransactionComposer, options: SimulateOptions | None = None
+    ) -> SimulateAtomicTransactionResponse:
+        """Simulates `atc`, the asyncio equivalent of `AtomicTransactionComposer.simulate`"""
+
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[],
+        ) if options else models.SimulateRequest(txn_groups=[])
+        instrumentation = self.instrumentation
+        label = _label(atc) if instrumentation else ""
+        with instrumentation.stage(label, "sign") if instrumentation else NO_STAGE:
+            request.txn_groups = [models.SimulateRequestTransactionGroup(txns=atc.gather_signatures())]
+        with instrumentation.stage(label, "simulate") if instrumentation else NO_STAGE:
+            response = await self.algod_client.simulate_transactions(request)
+            if instrumentation:
+                instrumentation.consumed(label, response["txn-groups"][0].get("app-budget-consumed", 0))
+        with instrumentation.stage(label, "decode") if instrumentation else NO_STAGE:
+            return atc.simulate(_SimulateResult(response), request)  # type: ignore[arg-type]
+
+    async def get_global_state(self) -> GlobalState:
+        """Returns the application's global state wrapped in a strongly typed class with options to format the stored value"""
+
+        info = await self.algod_client.application_info(self.app_id)
+        return GlobalState(decode_global_state(info.get("params", {}).get("global-state", [])))
+
+    async def _call(self, composer: AsyncComposer) -> typing.Any:
+        return algokit_utils.TransactionResponse.from_atr(await composer.execute())
+
+    async def _call_readonly(self, composer: AsyncComposer) -> typing.Any:
+        result = await composer.simulate(SimulateOptions(allow_more_logs=True, allow_empty_signatures=True))
+        if result.failure_message:
+            ex = Exception(result.failure_message)
+            error = self._logic_error(ex) or ex
+            if self.instrumentation:
+                self.instrumentation.failed(_label(composer.atc), error)
+            raise error
+        return algokit_utils.TransactionResponse.from_atr(result)
+
+    async def setup(
+        self,
+        *,
+        owner: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `setup(address)void` ABI method
+
+        :param str owner: The `owner` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        return await self._call(self.compose().setup(owner=owner, transaction_parameters=transaction_parameters))
+
+    async def configure(
+        self,
+        *,
+        period: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `configure(uint64)void` ABI method
+
+        :param int period: The `period` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        return await self._call(self.compose().configure(period=period, transaction_parameters=transaction_parameters))
+
+    async def fill(
+        self,
+        *,
+        total: int,
+        funding: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `fill(uint64,uint64)void` ABI method
+
+        :param int total: The `total` ABI parameter
+        :param int funding: The `funding` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        return await self._call(
+            self.compose().fill(total=total, funding=funding, transaction_parameters=transaction_parameters)
+        )
+
+    async def participate(
+        self,
+        *,
+        vote_k: bytes | bytearray,
+        sel_k: bytes | bytearray,
+        vote_fst: int,
+        vote_lst: int,
+        vote_kd: int,
+        sp_key: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `participate(byte[],byte[],uint64,uint64,uint64,byte[])void` ABI method
+
+        :param bytes | bytearray vote_k: The `vote_k` ABI parameter
+        :param bytes | bytearray sel_k: The `sel_k` ABI parameter
+        :param int vote_fst: The `vote_fst` ABI parameter
+        :param int vote_lst: The `vote_lst` ABI parameter
+        :param int vote_kd: The `vote_kd` ABI parameter
+        :param bytes | bytearray sp_key: The `sp_key` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        return await self._call(
+            self.compose().participate(
+                vote_k=vote_k,
+                sel_k=sel_k,
+                vote_fst=vote_fst,
+                vote_lst=vote_lst,
+                vote_kd=vote_kd,
+                sp_key=sp_key,
+                transaction_parameters=transaction_parameters,
+            )
+        )
+
+    async def withdraw(
+        self,
+        *,
+        amount: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `withdraw(uint64)uint64` ABI method
+
+        :param int amount: The `amount` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        return await self._call(self.compose().withdraw(amount=amount, transaction_parameters=transaction_parameters))
+
+    async def withdraw_max(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `withdraw_max()uint64` ABI method
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction, the amount withdrawn"""
+
+        return await self._call(self.compose().withdraw_max(transaction_parameters=transaction_parameters))
+
+    async def transfer(
+        self,
+        *,
+        owner: str,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `transfer(address)void` ABI method
+
+        :param str owner: The `owner` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        return await self._call(self.compose().transfer(owner=owner, transaction_parameters=transaction_parameters))
+
+    async def delete_close(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `close()void` ABI method
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        return await self._call(self.compose().delete_close(transaction_parameters=transaction_parameters))
+
+    async def status(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[tuple[str, str, int, int, int, int, int, int]]:
+        """Calls `status()(address,address,uint64,uint64,uint64,uint64,uint64,uint64)` ABI method
+
+        The method is readonly, so the call is simulated rather than submitted, as the synchronous client does.
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[tuple[str, str, int, int, int, int, int, int]]: The result of the
+        transaction, owner, funder, period, funding, total, mab, available balance and step"""
+
+        return await self._call_readonly(self.compose().status(transaction_parameters=transaction_parameters))
+
+    async def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        return await self._call(self.compose().clear_state(transaction_parameters, app_args))
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> AsyncComposer:
+        return AsyncComposer(self, atc or AtomicTransactionComposer())
@@ -0,0 +1,1355 @@
+"""In-process AVM for running the approval program without a network.
+
+`Program` assembles TEAL source, with template variables substituted, into a
+list of Python closures, one per instruction, each returning the next program
+counter. `Ledger` keeps balances, apps and their global state in memory and
+executes transaction groups atomically the way algod evaluates them:
+
+- every top level transaction pays its fee, fees are pooled across the group
+  and inner transactions draw on the pooled credit
+- app calls share a pooled opcode budget of 700 per app call in the group
+- payments may not overspend and accounts must keep their minimum balance
+- an inner transaction may only pay accounts referenced by the group
+- app global state is checked against the app's schema
+- a failing transaction rolls back the whole group
+
+Only the opcodes the staking contract needs are implemented, unknown opcodes are
+rejected when a program is assembled. `Ledger.latest_timestamp` is what
+`global LatestTimestamp` returns and can be set freely.
+
+Addresses are 32 byte public keys internally, public methods also accept their
+base32 form.
+"""
+import base64
+import dataclasses
+import functools
+import hashlib
+import pathlib
+import typing
+
+from algosdk import abi, encoding
+
+UINT64_MAX = 2**64 - 1
+MAX_GROUP_SIZE = 16
+MAX_APP_PROGRAM_COST = 700
+MAX_INNER_TRANSACTIONS = 256
+MIN_BALANCE = 100_000
+APP_PAGE_MIN_BALANCE = 100_000
+SCHEMA_UINT_MIN_BALANCE = 28_500
+SCHEMA_BYTES_MIN_BALANCE = 50_000
+ZERO_ADDRESS = bytes(32)
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+TYPE_ENUMS = {"pay": 1, "keyreg": 2, "acfg": 3, "axfer": 4, "afrz": 5, "appl": 6}
+_TYPES = {value: key for key, value in TYPE_ENUMS.items()}
+
+NO_OP = 0
+OPT_IN = 1
+CLOSE_OUT = 2
+CLEAR_STATE = 3
+UPDATE_APPLICATION = 4
+DELETE_APPLICATION = 5
+
+_NAMED_INTS = {
+    **TYPE_ENUMS,
+    "NoOp": NO_OP,
+    "OptIn": OPT_IN,
+    "CloseOut": CLOSE_OUT,
+    "ClearState": CLEAR_STATE,
+    "UpdateApplication": UPDATE_APPLICATION,
+    "DeleteApplication": DELETE_APPLICATION,
+}
+
+ARTIFACTS = pathlib.Path(__file__).resolve().parent.parent / "artifacts"
+
+_AddressLike = bytes | str
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_address(address: str) -> bytes:
+    return typing.cast(bytes, encoding.decode_address(address))
+
+
+def address_bytes(address: _AddressLike) -> bytes:
+    """Returns the 32 byte public key of a base32 address"""
+
+    if isinstance(address, str):
+        return _decode_address(address)
+    return address
+
+
+def application_address(app_id: int) -> bytes:
+    return hashlib.new("sha512_256", b"appID" + app_id.to_bytes(8, "big")).digest()
+
+
+class LogicEvalError(Exception):
+    """A transaction of the group was rejected, the group was rolled back"""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        txn_index: int,
+        pc: int | None = None,
+        line: int | None = None,
+        cost: int | None = None,
+    ):
+        super().__init__(
+            f"transaction {txn_index}: {message}" + (f" pc={pc}" if pc is not None else "")
+            + (f" line={line}" if line is not None else "")
+        )
+        self.message = message
+        self.txn_index = txn_index
+        self.pc = pc
+        self.line = line
+        # opcode cost spent until the program failed
+        self.cost = cost
+
+
+class _Panic(Exception):
+    pass
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class Transaction:
+    type: str
+    sender: bytes
+    fee: int = 1000
+    note: bytes = b""
+    receiver: bytes = ZERO_ADDRESS
+    amount: int = 0
+    close_remainder_to: bytes = ZERO_ADDRESS
+    app_id: int = 0
+    on_complete: int = NO_OP
+    app_args: list[bytes] = dataclasses.field(default_factory=list)
+    accounts: list[bytes] = dataclasses.field(default_factory=list)
+    foreign_apps: list[int] = dataclasses.field(default_factory=list)
+    approval_program: "Program | None" = None
+    clear_program: "Program | None" = None
+    global_num_uint: int = 0
+    global_num_byte_slice: int = 0
+    vote_pk: bytes = b""
+    selection_pk: bytes = b""
+    state_proof_pk: bytes = b""
+    vote_first: int = 0
+    vote_last: int = 0
+    vote_key_dilution: int = 0
+    group_index: int = 0
+
+
+def payment(
+    sender: _AddressLike,
+    receiver: _AddressLike,
+    amount: int,
+    *,
+    fee: int = 1000,
+    close_remainder_to: _AddressLike = ZERO_ADDRESS,
+) -> Transaction:
+    return Transaction(
+        type="pay",
+        sender=address_bytes(sender),
+        receiver=address_bytes(receiver),
+        amount=amount,
+        fee=fee,
+        close_remainder_to=address_bytes(close_remainder_to),
+    )
+
+
+def app_call(
+    sender: _AddressLike,
+    app_id: int,
+    app_args: typing.Sequence[bytes] = (),
+    *,
+    fee: int = 1000,
+    on_complete: int = NO_OP,
+    accounts: typing.Sequence[_AddressLike] = (),
+    foreign_apps: typing.Sequence[int] = (),
+) -> Transaction:
+    return Transaction(
+        type="appl",
+        sender=address_bytes(sender),
+        app_id=app_id,
+        app_args=list(app_args),
+        fee=fee,
+        on_complete=on_complete,
+        accounts=[address_bytes(account) for account in accounts],
+        foreign_apps=list(foreign_apps),
+    )
+
+
+@dataclasses.dataclass(kw_only=True)
+class Application:
+    app_id: int
+    creator: bytes
+    approval_program: "Program"
+    clear_program: "Program"
+    global_num_uint: int
+    global_num_byte_slice: int
+    global_state: dict[bytes, int | bytes] = dataclasses.field(default_factory=dict)
+    address: bytes = b""
+
+    def __post_init__(self) -> None:
+        self.address = application_address(self.app_id)
+
+
+@dataclasses.dataclass(kw_only=True)
+class TransactionResult:
+    logs: list[bytes] = dataclasses.field(default_factory=list)
+    cost: int = 0
+    inner_transactions: list[Transaction] = dataclasses.field(default_factory=list)
+    app_id: int | None = None
+
+    @property
+    def return_value(self) -> bytes | None:
+        """Raw ABI return value, the last log without its return prefix"""
+
+        if self.logs and self.logs[-1][:4] == ABI_RETURN_PREFIX:
+            return self.logs[-1][4:]
+        return None
+
+
+_Stack = list[int | bytes]
+_Op = typing.Callable[[_Stack, "_Eval", int], int]
+
+
+class _Eval:
+    """State of one program evaluation"""
+
+    __slots__ = (
+        "ledger", "group", "txn", "app", "logs", "frames", "itxn", "inner", "returned", "result", "available"
+    )
+
+    def __init__(self, ledger: "Ledger", group: typing.Sequence[Transaction], txn: Transaction, app: Application):
+        self.ledger = ledger
+        self.group = group
+        self.txn = txn
+        self.app = app
+        self.logs: list[bytes] = []
+        # (return pc, frame pointer, proto arguments, proto return values)
+        self.frames: list[tuple[int, int, int, int]] = []
+        self.itxn: dict[str, typing.Any] | None = None
+        self.inner: list[Transaction] = []
+        self.returned = False
+        self.result: int | bytes = 0
+        self.available: set[bytes] | None = None
+
+
+def _int(value: int | bytes) -> int:
+    if type(value) is not int:
+        raise _Panic("expected uint64, got bytes")
+    return value
+
+
+def _bytes(value: int | bytes) -> bytes:
+    if type(value) is not bytes:
+        raise _Panic("expected bytes, got uint64")
+    return value
+
+
+def _address(value: int | bytes) -> bytes:
+    if type(value) is not bytes or len(value) != 32:
+        raise _Panic("expected a 32 byte address")
+    return value
+
+
+def _global_fields() -> dict[str, typing.Callable[[_Eval], int | bytes]]:
+    return {
+        "MinTxnFee": lambda ev: ev.ledger.min_fee,
+        "MinBalance": lambda ev: MIN_BALANCE,
+        "MaxTxnLife": lambda ev: 1000,
+        "ZeroAddress": lambda ev: ZERO_ADDRESS,
+        "GroupSize": lambda ev: len(ev.group),
+        "Round": lambda ev: ev.ledger.round,
+        "LatestTimestamp": lambda ev: ev.ledger.latest_timestamp,
+        "CurrentApplicationID": lambda ev: ev.app.app_id,
+        "CurrentApplicationAddress": lambda ev: ev.app.address,
+        "CreatorAddress": lambda ev: ev.app.creator,
+        "GroupID": lambda ev: bytes(32),
+    }
+
+
+def _txn_fields() -> dict[str, typing.Callable[[Transaction], int | bytes]]:
+    return {
+        "Sender": lambda t: t.sender,
+        "Fee": lambda t: t.fee,
+        "Note": lambda t: t.note,
+        "Receiver": lambda t: t.receiver,
+        "Amount": lambda t: t.amount,
+        "CloseRemainderTo": lambda t: t.close_remainder_to,
+        "Type": lambda t: t.type.encode(),
+        "TypeEnum": lambda t: TYPE_ENUMS[t.type],
+        "GroupIndex": lambda t: t.group_index,
+        "ApplicationID": lambda t: t.app_id,
+        "OnCompletion": lambda t: t.on_complete,
+        "NumAppArgs": lambda t: len(t.app_args),
+        "NumAccounts": lambda t: len(t.accounts),
+        "NumApplications": lambda t: len(t.foreign_apps),
+        "GlobalNumUint": lambda t: t.global_num_uint,
+        "GlobalNumByteSlice": lambda t: t.global_num_byte_slice,
+        "VotePK": lambda t: t.vote_pk,
+        "SelectionPK": lambda t: t.selection_pk,
+        "StateProofPK": lambda t: t.state_proof_pk,
+        "VoteFirst": lambda t: t.vote_first,
+        "VoteLast": lambda t: t.vote_last,
+        "VoteKeyDilution": lambda t: t.vote_key_dilution,
+    }
+
+
+def _txn_array_fields() -> dict[str, typing.Callable[[Transaction, int], int | bytes]]:
+    return {
+        "ApplicationArgs": lambda t, i: t.app_args[i],
+        # index 0 is the sender
+        "Accounts": lambda t, i: t.sender if i == 0 else t.accounts[i - 1],
+        "Applications": lambda t, i: t.app_id if i == 0 else t.foreign_apps[i - 1],
+    }
+
+
+_GLOBAL_FIELDS = _global_fields()
+_TXN_FIELDS = _txn_fields()
+_TXN_ARRAY_FIELDS = _txn_array_fields()
+
+# itxn_field name: (Transaction attribute, expected type)
+_ITXN_FIELDS: dict[str, tuple[str, type]] = {
+    "Sender": ("sender", bytes),
+    "Fee": ("fee", int),
+    "Note": ("note", bytes),
+    "Receiver": ("receiver", bytes),
+    "Amount": ("amount", int),
+    "CloseRemainderTo": ("close_remainder_to", bytes),
+    "TypeEnum": ("type", int),
+    "Type": ("type", bytes),
+    "VotePK": ("vote_pk", bytes),
+    "SelectionPK": ("selection_pk", bytes),
+    "StateProofPK": ("state_proof_pk", bytes),
+    "VoteFirst": ("vote_first", int),
+    "VoteLast": ("vote_last", int),
+    "VoteKeyDilution": ("vote_key_dilution", int),
+}
+_ADDRESS_FIELDS = ("sender", "receiver", "close_remainder_to")
+
+
+def _parse_int(token: str, template_values: typing.Mapping[str, int]) -> int:
+    if token.startswith("TMPL_"):
+        return int(template_values[token[len("TMPL_"):]])
+    if token in _NAMED_INTS:
+        return _NAMED_INTS[token]
+    return int(token, 0)
+
+
+def _parse_bytes(tokens: list[str]) -> bytes:
+    token = tokens[0]
+    if token.startswith('"'):
+        return token[1:-1].encode().decode("unicode_escape").encode("latin-1")
+    if token.startswith("0x"):
+        return bytes.fromhex(token[2:])
+    if token in ("base64", "b64"):
+        return base64.b64decode(tokens[1])
+    if token.startswith(("base64(", "b64(")):
+        return base64.b64decode(token[token.index("(") + 1:-1])
+    raise ValueError(f"unsupported byte constant {' '.join(tokens)}")
+
+
+def tokenize(line: str) -> tuple[list[str], str]:
+    """Splits a TEAL line into tokens and its trailing comment"""
+
+    tokens: list[str] = []
+    i, n = 0, len(line)
+    while i < n:
+        c = line[i]
+        if c.isspace():
+            i += 1
+        elif line.startswith("//", i):
+            return tokens, line[i + 2:].strip()
+        elif c == '"':
+            j = i + 1
+            while j < n and line[j] != '"':
+                j += 2 if line[j] == "\\" else 1
+            tokens.append(line[i:j + 1])
+            i = j + 1
+        else:
+            j = i
+            while j < n and not line[j].isspace():
+                j += 1
+            tokens.append(line[i:j])
+            i = j
+    return tokens, ""
+
+
+class Program:
+    """Assembled TEAL program
+
+    `costs[pc]` is the opcode cost of instruction `pc`, `lines[pc]` its line in the source and `sources[pc]` its text.
+    """
+
+    def __init__(self, source: str, template_values: typing.Mapping[str, int] | None = None) -> None:
+        self.template_values = dict(template_values or {})
+        self.version = 1
+        self.ops: list[_Op] = []
+        self.lines: list[int] = []
+        self.sources: list[str] = []
+        self.messages: list[str] = []
+        self.labels: dict[str, int] = {}
+        instructions: list[tuple[int, list[str], str]] = []
+        ints: dict[int, int] = {}
+        byte_constants: dict[bytes, int] = {}
+
+        for number, line in enumerate(source.splitlines(), start=1):
+            tokens, comment = tokenize(line)
+            if not tokens:
+                continue
+            if tokens[0] == "#pragma":
+                if tokens[1] == "version":
+                    self.version = int(tokens[2])
+                continue
+            if len(tokens) == 1 and tokens[0].endswith(":"):
+                self.labels[tokens[0][:-1]] = len(instructions)
+                continue
+            instructions.append((number, tokens, comment))
+            if tokens[0] == "int":
+                value = _parse_int(tokens[1], self.template_values)
+                ints[value] = ints.get(value, 0) + 1
+            elif tokens[0] in ("byte", "method", "addr"):
+                constant = self._byte_constant(tokens)
+                byte_constants[constant] = byte_constants.get(constant, 0) + 1
+
+        self.tokens: list[list[str]] = []
+        for number, tokens, comment in instructions:
+            self.ops.append(self._assemble(tokens))
+            self.tokens.append(tokens)
+            self.lines.append(number)
+            self.sources.append(" ".join(tokens))
+            self.messages.append(comment)
+        self.costs = [1] * len(self.ops)
+        # the assembler moves constants used more than once into intcblock / bytecblock, most used first
+        self.intcblock = sorted((value for value, count in ints.items() if count > 1), key=lambda v: -ints[v])
+        self.bytecblock = sorted(
+            (value for value, count in byte_constants.items() if count > 1), key=lambda v: -byte_constants[v]
+        )
+        self.prologue_cost = bool(self.intcblock) + bool(self.bytecblock)
+
+    @classmethod
+    def from_file(cls, path: str | pathlib.Path, template_values: typing.Mapping[str, int] | None = None) -> "Program":
+        return cls(pathlib.Path(path).read_text(), template_values)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    @property
+    def size(self) -> int:
+        """Size in bytes of the assembled program
+
+        Follows the assembler's encoding, constants used more than once are referenced from intcblock / bytecblock
+        and the others pushed with pushint / pushbytes, so it matches `goal clerk compile` up to the order it picks
+        for constants used equally often."""
+
+        intc = {value: index for index, value in enumerate(self.intcblock)}
+        bytec = {value: index for index, value in enumerate(self.bytecblock)}
+        size = _varuint_size(self.version)
+        if intc:
+            size += 1 + _varuint_size(len(intc)) + sum(_varuint_size(value) for value in intc)
+        if bytec:
+            size += 1 + _varuint_size(len(bytec)) + sum(_varuint_size(len(value)) + len(value) for value in bytec)
+        for tokens in self.tokens:
+            op = tokens[0]
+            if op in ("int", "pushint"):
+                value = _parse_int(tokens[1], self.template_values)
+                index = intc.get(value) if op == "int" else None
+                size += 1 + _varuint_size(value) if index is None else 1 if index < 4 else 2
+            elif op in ("byte", "method", "addr", "pushbytes"):
+                constant = self._byte_constant(tokens)
+                index = bytec.get(constant) if op != "pushbytes" else None
+                if index is None:
+                    size += 1 + _varuint_size(len(constant)) + len(constant)
+                else:
+                    size += 1 if index < 4 else 2
+            elif op in ("switch", "match"):
+                size += 2 + 2 * (len(tokens) - 1)
+            else:
+                size += 1 + _IMMEDIATE_SIZES.get(op, 0)
+        return size
+
+    @staticmethod
+    def _byte_constant(tokens: list[str]) -> bytes:
+        if tokens[0] == "method":
+            return typing.cast(bytes, abi.Method.from_signature(tokens[1][1:-1]).get_selector())
+        if tokens[0] == "addr":
+            return address_bytes(tokens[1])
+        return _parse_bytes(tokens[1:])
+
+    def _label(self, label: str) -> int:
+        try:
+            return self.labels[label]
+        except KeyError:
+            raise ValueError(f"unknown label {label}") from None
+
+    def _assemble(self, tokens: list[str]) -> _Op:  # noqa: C901
+        op, args = tokens[0], tokens[1:]
+
+        if op in ("int", "pushint"):
+            value = _parse_int(args[0], self.template_values)
+
+            def push(stack: _Stack, ev: _Eval, pc: int) -> int:
+                stack.append(value)
+                return pc + 1
+
+            return push
+        if op in ("byte", "pushbytes", "method", "addr"):
+            constant = self._byte_constant(tokens)
+
+            def push_bytes(stack: _Stack, ev: _Eval, pc: int) -> int:
+                stack.append(constant)
+                return pc + 1
+
+            return push_bytes
+        if op in _SIMPLE_OPS:
+            return _SIMPLE_OPS[op]
+        if op in ("b", "bz", "bnz", "callsub"):
+            target = self._label(args[0])
+            return _branch(op, target)
+        if op == "switch":
+            targets = [self._label(label) for label in args]
+
+            def switch(stack: _Stack, ev: _Eval, pc: int) -> int:
+                index = _int(stack.pop())
+                return targets[index] if index < len(targets) else pc + 1
+
+            return switch
+        if op == "match":
+            targets = [self._label(label) for label in args]
+            n = len(targets)
+
+            def match(stack: _Stack, ev: _Eval, pc: int) -> int:
+                if len(stack) < n + 1:
+                    raise _Panic("stack underflow")
+                value = stack.pop()
+                cases = stack[-n:]
+                del stack[-n:]
+                for case, target in zip(cases, targets):
+                    if type(case) is type(value) and case == value:
+                        return target
+                return pc + 1
+
+            return match
+        if op in ("txn", "txna"):
+            if op == "txna" or args[0] in _TXN_ARRAY_FIELDS:
+                array_field = _TXN_ARRAY_FIELDS[args[0]]
+                index = int(args[1])
+
+                def txna(stack: _Stack, ev: _Eval, pc: int) -> int:
+                    try:
+                        stack.append(array_field(ev.txn, index))
+                    except IndexError:
+                        raise _Panic(f"invalid {args[0]} index {index}") from None
+                    return pc + 1
+
+                return txna
+            field = _TXN_FIELDS[args[0]]
+
+            def txn(stack: _Stack, ev: _Eval, pc: int) -> int:
+                stack.append(field(ev.txn))
+                return pc + 1
+
+            return txn
+        if op in ("gtxns", "gtxn"):
+            field = _TXN_FIELDS[args[-1]]
+            fixed = int(args[0]) if op == "gtxn" else None
+
+            def gtxns(stack: _Stack, ev: _Eval, pc: int) -> int:
+                index = fixed if fixed is not None else _int(stack.pop())
+                if index >= len(ev.group):
+                    raise _Panic(f"gtxn lookup TxnGroup[{index}] but it only has {len(ev.group)}")
+                stack.append(field(ev.group[index]))
+                return pc + 1
+
+            return gtxns
+        if op == "global":
+            global_field = _GLOBAL_FIELDS[args[0]]
+
+            def global_(stack: _Stack, ev: _Eval, pc: int) -> int:
+                stack.append(global_field(ev))
+                return pc + 1
+
+            return global_
+        if op in ("frame_dig", "frame_bury", "dig", "cover", "uncover", "proto", "extract", "bury", "popn", "dupn"):
+            return _IMMEDIATE_OPS[op](*(int(arg) for arg in args))
+        if op == "itxn_field":
+            attribute, expected = _ITXN_FIELDS[args[0]]
+            name = args[0]
+
+            def itxn_field(stack: _Stack, ev: _Eval, pc: int) -> int:
+                if ev.itxn is None:
+                    raise _Panic("itxn_field without itxn_begin")
+                value = stack.pop()
+                if type(value) is not expected:
+                    raise _Panic(f"{name} has the wrong type")
+                if isinstance(value, bytes) and attribute in _ADDRESS_FIELDS and len(value) != 32:
+                    raise _Panic(f"{name} must be a 32 byte address")
+                ev.itxn[attribute] = value
+                return pc + 1
+
+            return itxn_field
+        raise ValueError(f"unsupported opcode {op}")
+
+    def run(self, ev: _Eval, budget: int) -> tuple[bool, int]:
+        """Evaluates the program, returning whether it approved and its cost
+
+        :raises _Panic: With the failing pc in `args[1]`"""
+
+        ops = self.ops
+        stack: _Stack = []
+        end = len(ops)
+        pc = 0
+        cost = self.prologue_cost
+        try:
+            while pc < end:
+                cost += 1
+                if cost > budget:
+                    raise _Panic(f"dynamic cost budget exceeded, executing {self.sources[pc]}")
+                pc = ops[pc](stack, ev, pc)
+        except _Panic as ex:
+            ex.args = (ex.args[0], pc, cost)
+            raise
+        except IndexError:
+            raise _Panic("stack underflow", pc, cost) from None
+        if ev.returned:
+            result = ev.result
+        elif len(stack) != 1:
+            raise _Panic(f"stack len is {len(stack)} instead of 1", pc, cost)
+        else:
+            result = stack[0]
+        if type(result) is not int:
+            raise _Panic("stack finished with bytes not int", pc, cost)
+        return result != 0, cost
+
+
+def _varuint_size(value: int) -> int:
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+# bytes of immediates following the opcode byte
+_IMMEDIATE_SIZES = {
+    "b": 2,
+    "bz": 2,
+    "bnz": 2,
+    "callsub": 2,
+    "txn": 1,
+    "txna": 2,
+    "gtxn": 2,
+    "gtxns": 1,
+    "global": 1,
+    "itxn_field": 1,
+    "frame_dig": 1,
+    "frame_bury": 1,
+    "dig": 1,
+    "bury": 1,
+    "cover": 1,
+    "uncover": 1,
+    "popn": 1,
+    "dupn": 1,
+    "proto": 2,
+    "extract": 2,
+}
+
+
+def _branch(op: str, target: int) -> _Op:
+    if op == "b":
+        return lambda stack, ev, pc: target
+    if op == "bz":
+
+        def bz(stack: _Stack, ev: _Eval, pc: int) -> int:
+            return pc + 1 if _int(stack.pop()) else target
+
+        return bz
+    if op == "bnz":
+
+        def bnz(stack: _Stack, ev: _Eval, pc: int) -> int:
+            return target if _int(stack.pop()) else pc + 1
+
+        return bnz
+
+    def callsub(stack: _Stack, ev: _Eval, pc: int) -> int:
+        ev.frames.append((pc + 1, len(stack), -1, 0))
+        return target
+
+    return callsub
+
+
+def _proto(arguments: int, returns: int) -> _Op:
+    def proto(stack: _Stack, ev: _Eval, pc: int) -> int:
+        if not ev.frames:
+            raise _Panic("proto with no callsub")
+        if len(stack) < arguments:
+            raise _Panic("callsub to proto that requires more arguments than available")
+        return_pc, _, _, _ = ev.frames[-1]
+        ev.frames[-1] = (return_pc, len(stack), arguments, returns)
+        return pc + 1
+
+    return proto
+
+
+def _retsub(stack: _Stack, ev: _Eval, pc: int) -> int:
+    if not ev.frames:
+        raise _Panic("retsub with empty callstack")
+    return_pc, frame_pointer, arguments, returns = ev.frames.pop()
+    if arguments >= 0:
+        if len(stack) < frame_pointer + returns:
+            raise _Panic("retsub executed with stack below frame")
+        # the return values are the first values pushed above the frame, anything above them is dropped
+        stack[frame_pointer - arguments:] = stack[frame_pointer:frame_pointer + returns]
+    return return_pc
+
+
+def _frame_pointer(ev: _Eval) -> int:
+    if not ev.frames or ev.frames[-1][2] < 0:
+        raise _Panic("frame_dig with no proto")
+    return ev.frames[-1][1]
+
+
+def _frame_dig(i: int) -> _Op:
+    def frame_dig(stack: _Stack, ev: _Eval, pc: int) -> int:
+        index = _frame_pointer(ev) + i
+        if index < 0 or index >= len(stack):
+            raise _Panic(f"frame_dig {i} outside the stack")
+        stack.append(stack[index])
+        return pc + 1
+
+    return frame_dig
+
+
+def _frame_bury(i: int) -> _Op:
+    def frame_bury(stack: _Stack, ev: _Eval, pc: int) -> int:
+        value = stack.pop()
+        index = _frame_pointer(ev) + i
+        if index < 0 or index >= len(stack):
+            raise _Panic(f"frame_bury {i} outside the stack")
+        stack[index] = value
+        return pc + 1
+
+    return frame_bury
+
+
+def _dig(n: int) -> _Op:
+    def dig(stack: _Stack, ev: _Eval, pc: int) -> int:
+        if n >= len(stack):
+            raise _Panic("dig beyond the stack")
+        stack.append(stack[-1 - n])
+        return pc + 1
+
+    return dig
+
+
+def _bury(n: int) -> _Op:
+    def bury(stack: _Stack, ev: _Eval, pc: int) -> int:
+        if n == 0 or n >= len(stack):
+            raise _Panic("bury beyond the stack")
+        stack[-1 - n] = stack.pop()
+        return pc + 1
+
+    return bury
+
+
+def _cover(n: int) -> _Op:
+    def cover(stack: _Stack, ev: _Eval, pc: int) -> int:
+        if n >= len(stack):
+            raise _Panic("cover beyond the stack")
+        stack.insert(len(stack) - 1 - n, stack.pop())
+        return pc + 1
+
+    return cover
+
+
+def _uncover(n: int) -> _Op:
+    def uncover(stack: _Stack, ev: _Eval, pc: int) -> int:
+        if n >= len(stack):
+            raise _Panic("uncover beyond the stack")
+        stack.append(stack.pop(-1 - n))
+        return pc + 1
+
+    return uncover
+
+
+def _popn(n: int) -> _Op:
+    def popn(stack: _Stack, ev: _Eval, pc: int) -> int:
+        if n > len(stack):
+            raise _Panic("popn beyond the stack")
+        del stack[len(stack) - n:]
+        return pc + 1
+
+    return popn
+
+
+def _dupn(n: int) -> _Op:
+    def dupn(stack: _Stack, ev: _Eval, pc: int) -> int:
+        stack.extend([stack[-1]] * n)
+        return pc + 1
+
+    return dupn
+
+
+def _extract(start: int, length: int) -> _Op:
+    def extract(stack: _Stack, ev: _Eval, pc: int) -> int:
+        value = _bytes(stack.pop())
+        end = len(value) if length == 0 else start + length
+        if start > len(value) or end > len(value):
+            raise _Panic("extraction out of range")
+        stack.append(value[start:end])
+        return pc + 1
+
+    return extract
+
+
+_IMMEDIATE_OPS: dict[str, typing.Callable[..., _Op]] = {
+    "frame_dig": _frame_dig,
+    "frame_bury": _frame_bury,
+    "dig": _dig,
+    "bury": _bury,
+    "cover": _cover,
+    "uncover": _uncover,
+    "proto": _proto,
+    "extract": _extract,
+    "popn": _popn,
+    "dupn": _dupn,
+}
+
+
+def _add(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    result = a + b
+    if result > UINT64_MAX:
+        raise _Panic("+ overflowed")
+    stack.append(result)
+    return pc + 1
+
+
+def _sub(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    if b > a:
+        raise _Panic("- would result negative")
+    stack.append(a - b)
+    return pc + 1
+
+
+def _mul(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    result = a * b
+    if result > UINT64_MAX:
+        raise _Panic("* overflowed")
+    stack.append(result)
+    return pc + 1
+
+
+def _div(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    if b == 0:
+        raise _Panic("/ 0")
+    stack.append(a // b)
+    return pc + 1
+
+
+def _mod(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    if b == 0:
+        raise _Panic("% 0")
+    stack.append(a % b)
+    return pc + 1
+
+
+def _compare(compare: typing.Callable[[int, int], bool]) -> _Op:
+    def op(stack: _Stack, ev: _Eval, pc: int) -> int:
+        b = _int(stack.pop())
+        a = _int(stack.pop())
+        stack.append(1 if compare(a, b) else 0)
+        return pc + 1
+
+    return op
+
+
+def _byte_compare(compare: typing.Callable[[int, int], bool]) -> _Op:
+    def op(stack: _Stack, ev: _Eval, pc: int) -> int:
+        b = _bytes(stack.pop())
+        a = _bytes(stack.pop())
+        if len(a) > 64 or len(b) > 64:
+            raise _Panic("byte math input longer than 64 bytes")
+        stack.append(1 if compare(int.from_bytes(a, "big"), int.from_bytes(b, "big")) else 0)
+        return pc + 1
+
+    return op
+
+
+def _eq(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = stack.pop()
+    a = stack.pop()
+    if type(a) is not type(b):
+        raise _Panic("cannot compare uint64 to bytes")
+    stack.append(1 if a == b else 0)
+    return pc + 1
+
+
+def _ne(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = stack.pop()
+    a = stack.pop()
+    if type(a) is not type(b):
+        raise _Panic("cannot compare uint64 to bytes")
+    stack.append(0 if a == b else 1)
+    return pc + 1
+
+
+def _not(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack.append(0 if _int(stack.pop()) else 1)
+    return pc + 1
+
+
+def _and(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    stack.append(1 if a and b else 0)
+    return pc + 1
+
+
+def _or(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _int(stack.pop())
+    a = _int(stack.pop())
+    stack.append(1 if a or b else 0)
+    return pc + 1
+
+
+def _assert(stack: _Stack, ev: _Eval, pc: int) -> int:
+    if not _int(stack.pop()):
+        raise _Panic("assert failed")
+    return pc + 1
+
+
+def _err(stack: _Stack, ev: _Eval, pc: int) -> int:
+    raise _Panic("err opcode executed")
+
+
+def _return(stack: _Stack, ev: _Eval, pc: int) -> int:
+    ev.result = stack.pop()
+    ev.returned = True
+    return 1 << 62
+
+
+def _pop(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack.pop()
+    return pc + 1
+
+
+def _dup(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack.append(stack[-1])
+    return pc + 1
+
+
+def _dup2(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack.extend(stack[-2:])
+    return pc + 1
+
+
+def _swap(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack[-1], stack[-2] = stack[-2], stack[-1]
+    return pc + 1
+
+
+def _concat(stack: _Stack, ev: _Eval, pc: int) -> int:
+    b = _bytes(stack.pop())
+    a = _bytes(stack.pop())
+    if len(a) + len(b) > 4096:
+        raise _Panic("concat produced a too big byte array")
+    stack.append(a + b)
+    return pc + 1
+
+
+def _len(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack.append(len(_bytes(stack.pop())))
+    return pc + 1
+
+
+def _itob(stack: _Stack, ev: _Eval, pc: int) -> int:
+    stack.append(_int(stack.pop()).to_bytes(8, "big"))
+    return pc + 1
+
+
+def _btoi(stack: _Stack, ev: _Eval, pc: int) -> int:
+    value = _bytes(stack.pop())
+    if len(value) > 8:
+        raise _Panic(f"btoi arg too long, got {len(value)} bytes")
+    stack.append(int.from_bytes(value, "big"))
+    return pc + 1
+
+
+def _log(stack: _Stack, ev: _Eval, pc: int) -> int:
+    ev.logs.append(_bytes(stack.pop()))
+    return pc + 1
+
+
+def _app_id(ev: _Eval, value: int | bytes) -> Application:
+    app_id = _int(value)
+    if app_id == 0 or app_id == ev.app.app_id:
+        return ev.app
+    if app_id <= len(ev.txn.foreign_apps):
+        app_id = ev.txn.foreign_apps[app_id - 1]
+    app = ev.ledger.apps.get(app_id)
+    if app is None:
+        raise _Panic(f"unavailable App {app_id}")
+    return app
+
+
+def _app_global_get(stack: _Stack, ev: _Eval, pc: int) -> int:
+    value = ev.app.global_state.get(_bytes(stack.pop()))
+    stack.append(0 if value is None else value)
+    return pc + 1
+
+
+def _app_global_get_ex(stack: _Stack, ev: _Eval, pc: int) -> int:
+    key = _bytes(stack.pop())
+    value = _app_id(ev, stack.pop()).global_state.get(key)
+    if value is None:
+        stack.append(0)
+        stack.append(0)
+    else:
+        stack.append(value)
+        stack.append(1)
+    return pc + 1
+
+
+def _app_global_put(stack: _Stack, ev: _Eval, pc: int) -> int:
+    value = stack.pop()
+    key = _bytes(stack.pop())
+    if len(key) > 64:
+        raise _Panic("key too long")
+    if type(value) is bytes and len(key) + len(value) > 128:
+        raise _Panic("key/value total too long")
+    ev.ledger._put(ev.app.global_state, key, value)
+    return pc + 1
+
+
+def _app_global_del(stack: _Stack, ev: _Eval, pc: int) -> int:
+    ev.ledger._put(ev.app.global_state, _bytes(stack.pop()), None)
+    return pc + 1
+
+
+def _balance(stack: _Stack, ev: _Eval, pc: int) -> int:
+    account = stack.pop()
+    if type(account) is int:
+        try:
+            account = ev.txn.sender if account == 0 else ev.txn.accounts[account - 1]
+        except IndexError:
+            raise _Panic(f"invalid Account reference {account!r}") from None
+    stack.append(ev.ledger.balances.get(_address(account), 0))
+    return pc + 1
+
+
+def _itxn_begin(stack: _Stack, ev: _Eval, pc: int) -> int:
+    if ev.itxn is not None:
+        raise _Panic("itxn_begin without itxn_submit")
+    ev.itxn = {"sender": ev.app.address, "fee": ev.ledger.min_fee}
+    return pc + 1
+
+
+def _itxn_submit(stack: _Stack, ev: _Eval, pc: int) -> int:
+    fields = ev.itxn
+    if fields is None:
+        raise _Panic("itxn_submit without itxn_begin")
+    ev.itxn = None
+    kind = fields.pop("type", None)
+    if type(kind) is int:
+        kind = _TYPES.get(kind)
+    elif type(kind) is bytes:
+        kind = kind.decode()
+    if kind not in ("pay", "keyreg"):
+        raise _Panic(f"unsupported inner transaction type {kind}")
+    txn = Transaction(type=kind, **fields)
+    if txn.sender != ev.app.address:
+        raise _Panic("unauthorized inner transaction sender")
+    if ev.ledger._inner_count >= MAX_INNER_TRANSACTIONS:
+        raise _Panic("too many inner transactions")
+    ev.ledger._inner_count += 1
+    ev.ledger._fee_credit += txn.fee - ev.ledger.min_fee
+    if ev.ledger._fee_credit < 0:
+        raise _Panic("fee too small")
+    if kind == "pay":
+        if ev.available is None:
+            ev.available = ev.ledger._group_available(ev.group)
+        for account in (txn.receiver, txn.close_remainder_to):
+            if account != ZERO_ADDRESS and account not in ev.available:
+                raise _Panic(f"unavailable Account {encoding.encode_address(account)}")
+    try:
+        ev.ledger._apply(txn)
+    except LogicEvalError as ex:
+        raise _Panic(ex.message) from None
+    ev.inner.append(txn)
+    return pc + 1
+
+
+_SIMPLE_OPS: dict[str, _Op] = {
+    "+": _add,
+    "-": _sub,
+    "*": _mul,
+    "/": _div,
+    "%": _mod,
+    "<": _compare(lambda a, b: a < b),
+    ">": _compare(lambda a, b: a > b),
+    "<=": _compare(lambda a, b: a <= b),
+    ">=": _compare(lambda a, b: a >= b),
+    "b<": _byte_compare(lambda a, b: a < b),
+    "b>": _byte_compare(lambda a, b: a > b),
+    "b<=": _byte_compare(lambda a, b: a <= b),
+    "b>=": _byte_compare(lambda a, b: a >= b),
+    "==": _eq,
+    "!=": _ne,
+    "!": _not,
+    "&&": _and,
+    "||": _or,
+    "assert": _assert,
+    "err": _err,
+    "return": _return,
+    "pop": _pop,
+    "dup": _dup,
+    "dup2": _dup2,
+    "swap": _swap,
+    "concat": _concat,
+    "len": _len,
+    "itob": _itob,
+    "btoi": _btoi,
+    "log": _log,
+    "retsub": _retsub,
+    "app_global_get": _app_global_get,
+    "app_global_get_ex": _app_global_get_ex,
+    "app_global_put": _app_global_put,
+    "app_global_del": _app_global_del,
+    "balance": _balance,
+    "itxn_begin": _itxn_begin,
+    "itxn_submit": _itxn_submit,
+}
+
+_MISSING = object()
+
+
+class Ledger:
+    """Accounts and apps in memory, executing transaction groups atomically"""
+
+    def __init__(self, *, latest_timestamp: int = 0, round: int = 1, min_fee: int = 1000, first_app_id: int = 1001):
+        self.latest_timestamp = latest_timestamp
+        self.round = round
+        self.min_fee = min_fee
+        self.balances: dict[bytes, int] = {}
+        self.apps: dict[int, Application] = {}
+        self.participation: dict[bytes, Transaction] = {}
+        self._app_min_balances: dict[bytes, int] = {}
+        self._next_app_id = first_app_id
+        self._journal: list[tuple[dict, typing.Any, typing.Any]] | None = None
+        self._fee_credit = 0
+        self._inner_count = 0
+        self._touched: set[bytes] = set()
+
+    def fund(self, address: _AddressLike, amount: int) -> None:
+        """Adds `amount` out of thin air, outside of any group"""
+
+        account = address_bytes(address)
+        self.balances[account] = self.balances.get(account, 0) + amount
+
+    def balance(self, address: _AddressLike) -> int:
+        return self.balances.get(address_bytes(address), 0)
+
+    def min_balance(self, address: _AddressLike) -> int:
+        account = address_bytes(address)
+        return MIN_BALANCE + self._app_min_balances.get(account, 0)
+
+    def app(self, app_id: int) -> Application:
+        return self.apps[app_id]
+
+    def _put(self, mapping: dict, key: typing.Any, value: typing.Any) -> None:
+        if self._journal is not None:
+            self._journal.append((mapping, key, mapping.get(key, _MISSING)))
+        if value is None:
+            mapping.pop(key, None)
+        else:
+            mapping[key] = value
+
+    def _rollback(self, journal: list[tuple[dict, typing.Any, typing.Any]]) -> None:
+        for mapping, key, value in reversed(journal):
+            if value is _MISSING:
+                mapping.pop(key, None)
+            else:
+                mapping[key] = value
+
+    def _group_available(self, group: typing.Sequence[Transaction]) -> set[bytes]:
+        available: set[bytes] = set()
+        for txn in group:
+            available.update((txn.sender, txn.receiver, txn.close_remainder_to, *txn.accounts))
+            for app_id in (txn.app_id, *txn.foreign_apps):
+                if app_id:
+                    available.add(application_address(app_id))
+        return available
+
+    def _pay(self, account: bytes, amount: int) -> None:
+        balance = self.balances.get(account, 0)
+        if amount > balance:
+            raise LogicEvalError(
+                f"overspend (account {encoding.encode_address(account)}, balance {balance}, spending {amount})",
+                txn_index=-1,
+            )
+        self._put(self.balances, account, balance - amount)
+        self._touched.add(account)
+
+    def _receive(self, account: bytes, amount: int) -> None:
+        self._put(self.balances, account, self.balances.get(account, 0) + amount)
+        self._touched.add(account)
+
+    def _apply(self, txn: Transaction) -> None:
+        """Moves the funds of a payment, or registers keys, the fee was already paid"""
+
+        if txn.type == "pay":
+            self._pay(txn.sender, txn.amount)
+            self._receive(txn.receiver, txn.amount)
+            if txn.close_remainder_to != ZERO_ADDRESS:
+                remainder = self.balances.get(txn.sender, 0)
+                self._pay(txn.sender, remainder)
+                self._receive(txn.close_remainder_to, remainder)
+                self._put(self.balances, txn.sender, None)
+        elif txn.type == "keyreg":
+            self._put(self.participation, txn.sender, txn)
+        else:
+            raise LogicEvalError(f"unsupported transaction type {txn.type}", txn_index=-1)
+
+    def _call(self, group: typing.Sequence[Transaction], txn: Transaction, budget: int) -> TransactionResult:
+        creating = txn.app_id == 0
+        if creating:
+            if txn.approval_program is None or txn.clear_program is None:
+                raise LogicEvalError("app create without programs", txn_index=txn.group_index)
+            app = Application(
+                app_id=self._next_app_id,
+                creator=txn.sender,
+                approval_program=txn.approval_program,
+                clear_program=txn.clear_program,
+                global_num_uint=txn.global_num_uint,
+                global_num_byte_slice=txn.global_num_byte_slice,
+            )
+            self._next_app_id += 1
+            self._put(self.apps, app.app_id, app)
+            self._put(
+                self._app_min_balances,
+                txn.sender,
+                self._app_min_balances.get(txn.sender, 0)
+                + APP_PAGE_MIN_BALANCE
+                + SCHEMA_UINT_MIN_BALANCE * txn.global_num_uint
+                + SCHEMA_BYTES_MIN_BALANCE * txn.global_num_byte_slice,
+            )
+            self._touched.add(txn.sender)
+        else:
+            found = self.apps.get(txn.app_id)
+            if found is None:
+                raise LogicEvalError(f"application {txn.app_id} does not exist", txn_index=txn.group_index)
+            app = found
+        if txn.on_complete == CLEAR_STATE:
+            raise LogicEvalError("not opted in to the app", txn_index=txn.group_index)
+
+        ev = _Eval(self, group, txn, app)
+        program = app.approval_program
+        try:
+            approved, cost = program.run(ev, budget)
+        except _Panic as ex:
+            message, pc, cost = ex.args
+            line = None
+            if 0 <= pc < len(program):
+                line = program.lines[pc]
+                if program.messages[pc]:
+                    message = f"{message}: {program.messages[pc]}"
+            raise LogicEvalError(message, txn_index=txn.group_index, pc=pc, line=line, cost=cost) from None
+        if not approved:
+            raise LogicEvalError("rejected by ApprovalProgram", txn_index=txn.group_index)
+
+        uints = sum(type(value) is int for value in app.global_state.values())
+        if uints > app.global_num_uint:
+            raise LogicEvalError(f"store integer count {uints} exceeds schema", txn_index=txn.group_index)
+        if len(app.global_state) - uints > app.global_num_byte_slice:
+            raise LogicEvalError(
+                f"store bytes count {len(app.global_state) - uints} exceeds schema", txn_index=txn.group_index
+            )
+        if txn.on_complete == DELETE_APPLICATION:
+            self._put(self.apps, app.app_id, None)
+            self._put(
+                self._app_min_balances,
+                app.creator,
+                self._app_min_balances.get(app.creator, 0)
+                - APP_PAGE_MIN_BALANCE
+                - SCHEMA_UINT_MIN_BALANCE * app.global_num_uint
+                - SCHEMA_BYTES_MIN_BALANCE * app.global_num_byte_slice,
+            )
+        return TransactionResult(logs=ev.logs, cost=cost, inner_transactions=ev.inner, app_id=app.app_id)
+
+    def execute(self, transactions: typing.Sequence[Transaction]) -> list[TransactionResult]:
+        """Executes `transactions` as one atomic group
+
+        :raises LogicEvalError: If any transaction is rejected, nothing of the group is applied"""
+
+        return self._execute(transactions, commit=True)
+
+    def simulate(self, transactions: typing.Sequence[Transaction]) -> list[TransactionResult]:
+        """Executes `transactions` like `execute` and rolls the group back, e.g. for readonly calls"""
+
+        return self._execute(transactions, commit=False)
+
+    def _execute(self, transactions: typing.Sequence[Transaction], *, commit: bool) -> list[TransactionResult]:
+
+        if not transactions or len(transactions) > MAX_GROUP_SIZE:
+            raise LogicEvalError(f"group size {len(transactions)} is not between 1 and {MAX_GROUP_SIZE}", txn_index=0)
+        self._fee_credit = sum(txn.fee for txn in transactions) - self.min_fee * len(transactions)
+        if self._fee_credit < 0:
+            raise LogicEvalError("fee too small", txn_index=0)
+        self._inner_count = 0
+        budget = MAX_APP_PROGRAM_COST * sum(txn.type == "appl" for txn in transactions)
+        journal: list[tuple[dict, typing.Any, typing.Any]] = []
+        self._journal = journal
+        results: list[TransactionResult] = []
+        try:
+            for index, txn in enumerate(transactions):
+                txn.group_index = index
+                self._touched = set()
+                try:
+                    self._pay(txn.sender, txn.fee)
+                    if txn.type == "appl":
+                        result = self._call(transactions, txn, budget)
+                        budget -= result.cost
+                    else:
+                        self._apply(txn)
+                        result = TransactionResult()
+                except LogicEvalError as ex:
+                    if ex.txn_index < 0:
+                        ex = LogicEvalError(ex.message, txn_index=index)
+                    raise ex from None
+                for account in self._touched:
+                    balance = self.balances.get(account, 0)
+                    if balance and balance < self.min_balance(account):
+                        raise LogicEvalError(
+                            f"account {encoding.encode_address(account)} balance {balance} below min "
+                            f"{self.min_balance(account)}",
+                            txn_index=index,
+                        )
+                results.append(result)
+        except BaseException:
+            self._rollback(journal)
+            raise
+        finally:
+            self._journal = None
+        if not commit:
+            self._rollback(journal)
+        return results
+
+
+def load_approval_program(template_values: typing.Mapping[str, int]) -> Program:
+    """Assembles the staking contract's approval program from artifacts"""
+
+    return Program.from_file(ARTIFACTS / "SmartContractStaking.approval.teal", template_values)
+
+
+def load_clear_program() -> Program:
+    return Program.from_file(ARTIFACTS / "SmartContractStaking.clear.teal")
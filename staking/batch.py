@@ -0,0 +1,222 @@
+"""Lifecycle calls for many apps, packed into groups and submitted as a pipeline.
+
+`BatchComposer` takes a stream of `Operation`s, each one ABI call on one app,
+and packs them greedily in order: a group is closed once the next operation
+would take it past `MAX_GROUP_SIZE` transactions or past `max_group_fee`. Every
+transaction carries a flat fee, its own fee plus the fees of its inner
+transactions (see `staking.fees`), so the fee of a group is known before it is
+signed.
+
+Groups are signed on an executor, or in the worker processes of a
+`staking.signing.SigningPool`, while earlier groups are being submitted and
+confirmed, at most `concurrency` groups are in flight at a time. All of them are
+confirmed by the `staking.confirmations.ConfirmationTracker` given, one tracker
+following new blocks for every composer of the process. A failing group is
+reported in its `BatchResult` and does not stop the others.
+"""
+import asyncio
+import concurrent.futures
+import dataclasses
+import typing
+
+import algokit_utils
+import algosdk
+from algosdk.atomic_transaction_composer import (
+    ABIResult,
+    AtomicTransactionComposer,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+
+from artifacts.SmartContractStakingClient import Composer
+from staking.algod import AsyncAlgodClient
+from staking.async_client import AsyncSmartContractStakingClient
+from staking.confirmations import ConfirmationTracker
+from staking.fees import ESTIMATED_SIZE, ESTIMATED_SIZES, INNER_TRANSACTIONS, fee_pooled_params, transaction_fee
+from staking.groups import MAX_GROUP_SIZE, AppCall
+from staking.signing import SigningPool
+
+# generated `Composer` method for every ABI method a batch may call
+_COMPOSER_METHODS = {
+    "setup": "setup",
+    "configure": "configure",
+    "fill": "fill",
+    "participate": "participate",
+    "withdraw": "withdraw",
+    "withdraw_max": "withdraw_max",
+    "transfer": "transfer",
+    "close": "delete_close",
+}
+
+# `fill` is preceded by its payment
+_OUTER_TRANSACTIONS = {
+    "fill": 2,
+}
+
+
+@dataclasses.dataclass(kw_only=True)
+class Operation(AppCall):
+    method: str
+    args: dict[str, typing.Any] = dataclasses.field(default_factory=dict)
+    accounts: list[str] = dataclasses.field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if self.method not in _COMPOSER_METHODS:
+            raise ValueError(f"{self.method} can not be batched")
+
+    @property
+    def transactions(self) -> int:
+        return _OUTER_TRANSACTIONS.get(self.method, 1)
+
+    @property
+    def fees(self) -> int:
+        """Number of transaction fees the operation pays, its own transactions plus its inner transactions"""
+
+        return self.transactions + INNER_TRANSACTIONS.get(self.method, 0)
+
+    @property
+    def estimated_size(self) -> int:
+        return ESTIMATED_SIZES.get(self.method, ESTIMATED_SIZE)
+
+
+@dataclasses.dataclass(kw_only=True)
+class BatchResult:
+    operations: list[Operation]
+    tx_ids: list[str] = dataclasses.field(default_factory=list)
+    confirmed_round: int | None = None
+    abi_results: list[ABIResult] = dataclasses.field(default_factory=list)
+    error: Exception | None = None
+
+
+class BatchComposer:
+    """Packs `Operation`s for many apps into groups, signs them in parallel and submits them as a pipeline"""
+
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        signer: TransactionSigner | algokit_utils.Account,
+        confirmations: ConfirmationTracker,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        max_group_fee: int | None = None,
+        concurrency: int = 8,
+        executor: concurrent.futures.Executor | None = None,
+        signing_pool: SigningPool | None = None,
+    ) -> None:
+        """
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param TransactionSigner | Account signer: Signer of every transaction, e.g. the owner of all apps
+        :param ConfirmationTracker confirmations: Tracker confirming the groups from new blocks, shared by every
+        composer submitting from the process
+        :param str sender: (optional) Sender address, defaults to the signer's address
+        :param SuggestedParams suggested_params: (optional) Params shared by all groups, fetched once if not given
+        :param int max_group_fee: (optional) Maximum total fee of one group in microAlgos
+        :param int concurrency: Maximum number of groups being signed, submitted or confirmed at a time
+        :param Executor executor: (optional) Executor signing groups, defaults to the event loop's default executor
+        :param SigningPool signing_pool: (optional) Worker processes signing the groups instead of `executor`, holding
+        the key of every sender
+        """
+        self.algod_client = algod_client
+        self.suggested_params = suggested_params
+        self.max_group_fee = max_group_fee
+        self.concurrency = concurrency
+        self.executor = executor
+        self.signing_pool = signing_pool
+        # builds transactions, with app_id switched per operation, and executes groups
+        self.client = AsyncSmartContractStakingClient(
+            algod_client,
+            app_id=0,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            confirmations=confirmations,
+        )
+
+    def _add(
+        self, atc: AtomicTransactionComposer, operation: Operation, sp: algosdk.transaction.SuggestedParams
+    ) -> None:
+        app_client = self.client.app_client
+        app_client.app_id = operation.app_id
+        transaction_parameters = algokit_utils.TransactionParameters(
+            suggested_params=fee_pooled_params(
+                sp, INNER_TRANSACTIONS.get(operation.method, 0), operation.estimated_size
+            ),
+            accounts=operation.accounts or None,
+        )
+        if operation.method == "fill":
+            payment_signer, payment_sender = app_client.resolve_signer_sender()
+            payment = algosdk.transaction.PaymentTxn(
+                payment_sender, fee_pooled_params(sp, 0), app_client.app_address, operation.args["total"]
+            )
+            atc.add_transaction(TransactionWithSigner(payment, payment_signer))
+        composer = Composer(app_client, atc)
+        getattr(composer, _COMPOSER_METHODS[operation.method])(
+            **operation.args, transaction_parameters=transaction_parameters
+        )
+
+    def pack(
+        self,
+        operations: typing.Iterable[Operation],
+        suggested_params: algosdk.transaction.SuggestedParams,
+    ) -> typing.Iterator[tuple[list[Operation], AtomicTransactionComposer]]:
+        """Greedily packs `operations`, in order, into groups within the transaction and fee limits
+
+        :param Iterable[Operation] operations: Operations to pack, consumed lazily
+        :param SuggestedParams suggested_params: Params of every transaction
+        :returns Iterator[tuple[list[Operation], AtomicTransactionComposer]]: Operations of each group and the group"""
+
+        batch: list[Operation] = []
+        atc = AtomicTransactionComposer()
+        fee = 0
+        for operation in operations:
+            operation_fee = operation.fees * transaction_fee(suggested_params, operation.estimated_size)
+            if self.max_group_fee is not None and operation_fee > self.max_group_fee:
+                raise ValueError(f"{operation.method} on {operation.app_id} alone exceeds the maximum group fee")
+            if batch and (
+                atc.get_tx_count() + operation.transactions > MAX_GROUP_SIZE
+                or (self.max_group_fee is not None and fee + operation_fee > self.max_group_fee)
+            ):
+                yield batch, atc
+                batch, atc, fee = [], AtomicTransactionComposer(), 0
+            self._add(atc, operation, suggested_params)
+            batch.append(operation)
+            fee += operation_fee
+        if batch:
+            yield batch, atc
+
+    async def _execute_group(self, operations: list[Operation], atc: AtomicTransactionComposer) -> BatchResult:
+        result = BatchResult(operations=operations)
+        try:
+            if self.signing_pool is not None:
+                result.tx_ids, signed = await self.signing_pool.sign([txn.txn for txn in atc.txn_list])
+                response = await self.client.execute_signed(atc, result.tx_ids, signed)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self.executor, atc.gather_signatures)
+                response = await self.client.execute_atc(atc)
+        except Exception as ex:
+            result.tx_ids = result.tx_ids or atc.tx_ids
+            result.error = ex
+            return result
+        result.tx_ids = response.tx_ids
+        result.confirmed_round = response.confirmed_round
+        result.abi_results = response.abi_results
+        return result
+
+    async def execute(self, operations: typing.Iterable[Operation]) -> list[BatchResult]:
+        """Packs, signs, submits and confirms `operations`
+
+        :param Iterable[Operation] operations: Operations to execute, consumed lazily as groups are packed
+        :returns list[BatchResult]: One result per group, in packing order"""
+
+        sp = self.suggested_params or await self.client.params_cache.get_async(self.algod_client)
+        groups = enumerate(self.pack(operations, sp))
+        results: dict[int, BatchResult] = {}
+
+        async def worker() -> None:
+            for index, (batch, atc) in groups:
+                results[index] = await self._execute_group(batch, atc)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+        return [results[index] for index in range(len(results))]
@@ -0,0 +1,255 @@
+"""Opcode cost of every ABI method along each of its branches.
+
+Every case brings a fresh app on a `staking.avm.Ledger` to the state a branch
+needs, e.g. `withdraw` with amount 0 while locked, vesting and fully vested,
+and runs the call once. It records the opcode cost of the app call, the number
+of inner transactions it submitted and, for calls the contract rejects, the
+assert message. Costs are deterministic, one run per case is enough.
+
+Results are compared to a stored baseline (`benchmark_baseline.json` next to
+this module), so a contract change shows what it costs before it is deployed:
+
+    python -m staking.benchmark             # compare, exits 1 on regressions
+    python -m staking.benchmark --update    # store the current numbers
+
+A case regresses when its cost or inner transaction count grows, or when it no
+longer exists; program size changes are reported only.
+"""
+import argparse
+import dataclasses
+import json
+import pathlib
+import sys
+import typing
+
+from algosdk import account
+
+from staking.avm import (
+    DELETE_APPLICATION,
+    MAX_APP_PROGRAM_COST,
+    Ledger,
+    LogicEvalError,
+    Transaction,
+    load_approval_program,
+    load_clear_program,
+    payment,
+)
+from staking.local import LocalStakingClient, create_transaction, deploy
+from staking.mab import vesting_boundaries
+
+BASELINE = pathlib.Path(__file__).with_name("benchmark_baseline.json")
+
+TEMPLATE_VALUES = {"PERIOD_SECONDS": 2_629_800, "VESTING_DELAY": 12, "LOCKUP_DELAY": 12}
+
+_FUNDING = 1_700_000_000
+_TOTAL = 1_000_000_000_000
+_PERIOD = 1
+
+
+@dataclasses.dataclass(kw_only=True)
+class CaseResult:
+    name: str
+    method: str
+    cost: int
+    inner_transactions: int
+    rejected: str | None = None
+
+
+class _Fixture:
+    """Accounts and a fresh app on its own ledger"""
+
+    def __init__(self, template_values: typing.Mapping[str, int]) -> None:
+        self.template_values = template_values
+        self.ledger = Ledger(latest_timestamp=_FUNDING)
+        self.creator, self.owner, self.next_owner = (account.generate_account()[1] for _ in range(3))
+        for address in (self.creator, self.owner, self.next_owner):
+            self.ledger.fund(address, 10 * _TOTAL)
+        self.lockup_end, self.vesting_end = vesting_boundaries(_FUNDING, _PERIOD, template_values)
+
+    def app(self, step: int) -> tuple[LocalStakingClient, LocalStakingClient]:
+        """Deploys an app and brings it to `step`, returning its creator and owner clients"""
+
+        app_id = deploy(self.ledger, self.creator, self.template_values)
+        creator = LocalStakingClient(self.ledger, app_id, sender=self.creator)
+        owner = LocalStakingClient(self.ledger, app_id, sender=self.owner)
+        self.ledger.fund(creator.app_address, 100_000)
+        if step >= 1:
+            creator.setup(self.owner)
+        if step >= 2:
+            owner.configure(_PERIOD)
+        if step >= 3:
+            creator.fill(_TOTAL, _FUNDING)
+        return creator, owner
+
+    def at(self, when: str) -> None:
+        """Moves the latest timestamp to a point of the vesting schedule"""
+
+        self.ledger.latest_timestamp = {
+            "locked": _FUNDING,
+            "vesting": self.lockup_end + int(self.template_values["PERIOD_SECONDS"]) + 1,
+            "vested": self.vesting_end,
+        }[when]
+
+
+def _create(fixture: _Fixture) -> list[Transaction]:
+    return [create_transaction(fixture.creator, fixture.template_values)]
+
+
+def _setup(fixture: _Fixture, step: int = 0) -> list[Transaction]:
+    creator, _ = fixture.app(step)
+    return [creator.call_transaction("setup", fixture.owner)]
+
+
+def _configure(fixture: _Fixture) -> list[Transaction]:
+    _, owner = fixture.app(1)
+    return [owner.call_transaction("configure", _PERIOD)]
+
+
+def _fill(fixture: _Fixture, step: int) -> list[Transaction]:
+    creator, _ = fixture.app(step)
+    return [
+        payment(fixture.creator, creator.app_address, _TOTAL),
+        creator.call_transaction("fill", _TOTAL, _FUNDING),
+    ]
+
+
+def _participate(fixture: _Fixture) -> list[Transaction]:
+    _, owner = fixture.app(3)
+    return [owner.call_transaction("participate", bytes(32), bytes(32), 1, 1_000_000, 1_000, bytes(64))]
+
+
+def _withdraw(fixture: _Fixture, when: str, amount: int | None) -> list[Transaction]:
+    _, owner = fixture.app(3)
+    fixture.at(when)
+    if amount is None:
+        return [owner.call_transaction("withdraw_max")]
+    return [owner.call_transaction("withdraw", amount)]
+
+
+def _transfer(fixture: _Fixture) -> list[Transaction]:
+    _, owner = fixture.app(3)
+    return [owner.call_transaction("transfer", fixture.next_owner)]
+
+
+def _close(fixture: _Fixture, when: str, empty: bool = False) -> list[Transaction]:
+    _, owner = fixture.app(3)
+    fixture.at(when)
+    if empty:
+        owner.withdraw_max()
+    return [owner.call_transaction("close", accounts=[fixture.creator], on_complete=DELETE_APPLICATION)]
+
+
+def _status(fixture: _Fixture, when: str) -> list[Transaction]:
+    _, owner = fixture.app(3)
+    fixture.at(when)
+    return [owner.call_transaction("status")]
+
+
+_MID_VESTING_AMOUNT = _TOTAL // 100
+
+# name: (method, builder of the group whose last transaction is measured)
+CASES: dict[str, tuple[str, typing.Callable[[_Fixture], list[Transaction]]]] = {
+    "create": ("create", _create),
+    "setup": ("setup", _setup),
+    "setup.rejected_step_fresh": ("setup", lambda f: _setup(f, 1)),
+    "configure": ("configure", _configure),
+    "fill.step_fresh": ("fill", lambda f: _fill(f, 1)),
+    "fill.step_ready": ("fill", lambda f: _fill(f, 2)),
+    "participate": ("participate", _participate),
+    "withdraw.zero_locked": ("withdraw", lambda f: _withdraw(f, "locked", 0)),
+    "withdraw.zero_vesting": ("withdraw", lambda f: _withdraw(f, "vesting", 0)),
+    "withdraw.zero_vested": ("withdraw", lambda f: _withdraw(f, "vested", 0)),
+    "withdraw.amount_vesting": ("withdraw", lambda f: _withdraw(f, "vesting", _MID_VESTING_AMOUNT)),
+    "withdraw.amount_vested": ("withdraw", lambda f: _withdraw(f, "vested", _TOTAL)),
+    "withdraw.rejected_above_mab": ("withdraw", lambda f: _withdraw(f, "locked", 1)),
+    "withdraw_max.locked": ("withdraw_max", lambda f: _withdraw(f, "locked", None)),
+    "withdraw_max.vesting": ("withdraw_max", lambda f: _withdraw(f, "vesting", None)),
+    "withdraw_max.vested": ("withdraw_max", lambda f: _withdraw(f, "vested", None)),
+    "transfer": ("transfer", _transfer),
+    "close.vested": ("close", lambda f: _close(f, "vested")),
+    "close.vested_empty": ("close", lambda f: _close(f, "vested", empty=True)),
+    "close.rejected_locked": ("close", lambda f: _close(f, "locked")),
+    "status.locked": ("status", lambda f: _status(f, "locked")),
+    "status.vesting": ("status", lambda f: _status(f, "vesting")),
+    "status.vested": ("status", lambda f: _status(f, "vested")),
+}
+
+
+def run_case(name: str, template_values: typing.Mapping[str, int] = TEMPLATE_VALUES) -> CaseResult:
+    method, build = CASES[name]
+    fixture = _Fixture(template_values)
+    group = build(fixture)
+    try:
+        result = fixture.ledger.simulate(group)[-1]
+    except LogicEvalError as ex:
+        if ex.cost is None:
+            raise
+        return CaseResult(name=name, method=method, cost=ex.cost, inner_transactions=0, rejected=ex.message)
+    return CaseResult(name=name, method=method, cost=result.cost, inner_transactions=len(result.inner_transactions))
+
+
+def run(template_values: typing.Mapping[str, int] = TEMPLATE_VALUES) -> dict[str, typing.Any]:
+    """Runs every case, returning the results in the baseline format"""
+
+    cases = {}
+    for name in CASES:
+        case = dataclasses.asdict(run_case(name, template_values))
+        del case["name"]
+        cases[name] = case
+    return {
+        "template_values": dict(template_values),
+        "approval_size": load_approval_program(template_values).size,
+        "clear_size": load_clear_program().size,
+        "cases": cases,
+    }
+
+
+def compare(current: dict[str, typing.Any], baseline: dict[str, typing.Any]) -> tuple[list[str], bool]:
+    """Returns report lines for `current` against `baseline` and whether any case regressed"""
+
+    regressed = False
+    lines = [f"{'case':<30} {'method':<13} {'cost':>6} {'delta':>6} {'inner':>5}  rejected"]
+    for name, case in current["cases"].items():
+        before = baseline["cases"].get(name)
+        if before is None:
+            delta = "new"
+        else:
+            change = case["cost"] - before["cost"]
+            delta = f"{change:+d}" if change else ""
+            if change > 0 or case["inner_transactions"] > before["inner_transactions"]:
+                regressed = True
+                delta += " !"
+        lines.append(
+            f"{name:<30} {case['method']:<13} {case['cost']:>6} {delta:>6} {case['inner_transactions']:>5}  "
+            f"{case['rejected'] or ''}"
+        )
+    for name in baseline["cases"].keys() - current["cases"].keys():
+        regressed = True
+        lines.append(f"{name:<30} missing !")
+    worst = max(case["cost"] for case in current["cases"].values())
+    lines.append(f"worst case cost {worst} of {MAX_APP_PROGRAM_COST} per app call")
+    for program in ("approval_size", "clear_size"):
+        change = current[program] - baseline.get(program, current[program])
+        lines.append(f"{program} {current[program]} bytes" + (f" ({change:+d})" if change else ""))
+    return lines, regressed
+
+
+def main(argv: typing.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--update", action="store_true", help="write the current results to the baseline")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    template_values = baseline["template_values"] if baseline else TEMPLATE_VALUES
+    current = run(template_values)
+    lines, regressed = compare(current, baseline or {"cases": {}})
+    print("\n".join(lines))
+    if args.update:
+        args.baseline.write_text(json.dumps(current, indent=4) + "\n")
+        return 0
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Following the chain block by block.
+
+`follow_blocks` yields every block from a start round on, in order, waiting with
+`status/wait-for-block-after` once it has caught up with the node. Indexes built
+on it apply each block and checkpoint its round, so they resume where they
+stopped and the work done is proportional to new blocks only.
+
+Blocks are algod's JSON encoding (`/blocks/{round}?format=json`): addresses are
+base32 strings, byte fields base64 strings and zero values are omitted.
+"""
+import asyncio
+import base64
+import typing
+
+from staking.algod import AsyncAlgodClient
+
+
+async def follow_blocks(
+    algod_client: AsyncAlgodClient,
+    start_round: int,
+    *,
+    until: int | None = None,
+    stop: asyncio.Event | None = None,
+) -> typing.AsyncIterator[tuple[int, dict[str, typing.Any]]]:
+    """Yields (round, block) for every round from `start_round` on
+
+    :param AsyncAlgodClient algod_client: Shared asyncio algod client
+    :param int start_round: First round to yield
+    :param int until: (optional) Last round to yield, otherwise new blocks are followed until `stop` is set
+    :param asyncio.Event stop: (optional) Event ending the iteration, checked between blocks"""
+
+    round_num = start_round
+    last_round = typing.cast(int, (await algod_client.status())["last-round"])
+    while (until is None or round_num <= until) and not (stop and stop.is_set()):
+        if round_num > last_round:
+            status = await algod_client.status_after_block(round_num - 1)
+            last_round = typing.cast(int, status["last-round"])
+            continue
+        block = await algod_client.block_info(round_num)
+        yield round_num, block["block"]
+        round_num += 1
+
+
+def transactions(block: dict[str, typing.Any]) -> typing.Iterator[dict[str, typing.Any]]:
+    """Yields the signed transactions of `block` with their apply data, inner transactions after their parent"""
+
+    pending = list(reversed(block.get("txns", [])))
+    while pending:
+        stxn = pending.pop()
+        yield stxn
+        pending.extend(reversed(stxn.get("dt", {}).get("itx", [])))
+
+
+def app_args(txn: dict[str, typing.Any]) -> list[bytes]:
+    return [base64.b64decode(arg) for arg in txn.get("apaa", [])]
+
+
+def note(txn: dict[str, typing.Any]) -> bytes:
+    return base64.b64decode(txn.get("note", ""))
@@ -0,0 +1,131 @@
+"""MAB cache for serving many queries per app between vesting boundaries.
+
+The MAB only changes once per `PERIOD_SECONDS` after `lockup_end` until
+`vesting_end`, see `staking.mab.next_mab_change`. `MabCache` reads an app's
+global state once, keeps the values the MAB derives from together with the
+current MAB and the timestamp of its next change, and answers from memory until
+that timestamp is reached. Crossing a boundary recomputes the MAB from the kept
+values without another read.
+
+Apps that are not full (`fill` was not called yet) are never cached. Calls that
+change an app are reported through `observe`, which evicts the app so the next
+query reads it again; `close` deletes it, the others are evicted conservatively.
+"""
+import asyncio
+import dataclasses
+import typing
+
+from staking.algod import AsyncAlgodClient
+from staking.async_client import decode_global_state
+from staking.mab import STEP_FULL, calculate_mab, next_mab_change
+
+INVALIDATING_METHODS = frozenset({"fill", "withdraw", "withdraw_max", "transfer", "close"})
+
+
+@dataclasses.dataclass(kw_only=True)
+class _Entry:
+    lockup_end: int
+    vesting_end: int
+    total: int
+    mab: int
+    valid_from: int
+    valid_until: int | None
+
+
+class MabCache:
+    def __init__(self, algod_client: AsyncAlgodClient, template_values: typing.Mapping[str, int]) -> None:
+        """
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+        """
+        self.algod_client = algod_client
+        self.template_values = template_values
+        self._entries: dict[int, _Entry] = {}
+        self._loading: dict[int, asyncio.Future[_Entry | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, app_id: int) -> bool:
+        return app_id in self._entries
+
+    def _refresh(self, entry: _Entry, now: int) -> int:
+        if now < entry.valid_from or (entry.valid_until is not None and now >= entry.valid_until):
+            entry.mab = calculate_mab(entry.lockup_end, entry.vesting_end, entry.total, now, self.template_values)
+            entry.valid_from = now
+            entry.valid_until = next_mab_change(entry.lockup_end, entry.vesting_end, now, self.template_values)
+        return entry.mab
+
+    def get(self, app_id: int, now: int) -> int | None:
+        """Returns the MAB of `app_id` at `now` if the app is cached, without reading it
+
+        :param int app_id: App to look up
+        :param int now: Latest block timestamp"""
+
+        entry = self._entries.get(app_id)
+        if entry is None:
+            return None
+        return self._refresh(entry, now)
+
+    async def _load(self, app_id: int, now: int) -> _Entry | None:
+        info = await self.algod_client.application_info(app_id)
+        state = decode_global_state(info.get("params", {}).get("global-state", []))
+        if state.get(b"step") != STEP_FULL:
+            return None
+        lockup_end = typing.cast(int, state[b"lockup_end"])
+        vesting_end = typing.cast(int, state[b"vesting_end"])
+        total = typing.cast(int, state[b"total"])
+        return _Entry(
+            lockup_end=lockup_end,
+            vesting_end=vesting_end,
+            total=total,
+            mab=calculate_mab(lockup_end, vesting_end, total, now, self.template_values),
+            valid_from=now,
+            valid_until=next_mab_change(lockup_end, vesting_end, now, self.template_values),
+        )
+
+    async def mab(self, app_id: int, now: int) -> int:
+        """Returns the MAB of `app_id` at `now`, reading the app only if it is not cached
+
+        Concurrent queries for the same app share one read.
+
+        :param int app_id: App to look up
+        :param int now: Latest block timestamp
+        :raises AlgodHTTPError: If the app can not be read, e.g. it was deleted"""
+
+        mab = self.get(app_id, now)
+        if mab is not None:
+            return mab
+        loading = self._loading.get(app_id)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load(app_id, now))
+            self._loading[app_id] = loading
+            try:
+                entry = await asyncio.shield(loading)
+            finally:
+                # invalidate() during the read drops it, the read may predate the call
+                current = self._loading.get(app_id) is loading
+                if current:
+                    del self._loading[app_id]
+            if entry is not None and current:
+                self._entries[app_id] = entry
+        else:
+            entry = await asyncio.shield(loading)
+        if entry is None:
+            # not full yet, fill has not set the values the MAB derives from
+            return 0
+        return self._refresh(entry, now)
+
+    def invalidate(self, app_id: int) -> None:
+        self._entries.pop(app_id, None)
+        self._loading.pop(app_id, None)
+
+    def observe(self, app_id: int, method: str) -> None:
+        """Reports a confirmed call of ABI method `method` on `app_id`, evicting the app if the call changes it"""
+
+        if method in INVALIDATING_METHODS:
+            self.invalidate(app_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._loading.clear()
@@ -0,0 +1,158 @@
+"""On-disk cache of TEAL compiled by algod.
+
+Deploying substitutes the template values (`PERIOD_SECONDS`, `VESTING_DELAY`,
+`LOCKUP_DELAY` and algokit's `UPDATABLE` / `DELETABLE`) into the approval and
+clear programs and sends them to algod's compile endpoint, once per app. The
+substituted source is a function of the TEAL and the template values, so
+`CompileCache` keys entries by its SHA-256: each distinct parameter set is
+compiled once and every further deploy reads the bytecode from disk.
+
+Entries are verified when read, the program hash algod returned must be the
+hash of the stored bytecode and the full source stored in the entry must be the
+source it is looked up for; anything else is discarded and compiled again.
+Entries are written atomically, processes deploying in parallel may share a
+directory, and `scripts/compileCache.ts` uses the same entries and default
+directory.
+
+`CachingAlgodClient` is an `AlgodClient` whose `compile` goes through the cache,
+and whose requests go through a traffic controller, pass it to
+`SmartContractStakingClient` to deploy with cached programs.
+"""
+import base64
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import typing
+
+from algosdk import logic
+from algosdk.v2client.algod import AlgodClient
+
+from staking.algod import AsyncAlgodClient, ControlledAlgodClient
+from staking.traffic import TrafficController
+
+DEFAULT_DIRECTORY = pathlib.Path.home() / ".cache" / "smart-contract-staking" / "compiled"
+
+
+class CompileCache:
+    def __init__(self, directory: str | pathlib.Path = DEFAULT_DIRECTORY) -> None:
+        """
+        :param str | Path directory: Directory holding the entries, created when the first entry is stored
+        """
+        self.directory = pathlib.Path(directory)
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, source: str, source_map: bool = False) -> dict[str, typing.Any] | None:
+        """Returns algod's compile response for `source` if it is cached and verified
+
+        :param str source: TEAL as sent to algod, with template values substituted
+        :param bool source_map: Whether the response must include the source map"""
+
+        key = self.key(source)
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+            result = entry["result"]
+            # the file name is only the hash, the entry keeps the full source it was compiled from
+            valid = entry["source"] == source and logic.address(base64.b64decode(result["result"])) == result["hash"]
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            valid = False
+        if not valid:
+            path.unlink(missing_ok=True)
+            return None
+        if source_map and "sourcemap" not in result:
+            return None
+        return typing.cast(dict[str, typing.Any], result)
+
+    def put(self, source: str, result: dict[str, typing.Any]) -> None:
+        """Stores algod's compile response for `source`"""
+
+        key = self.key(source)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump({"source": source, "result": result}, file)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def compile(self, algod_client: AlgodClient, source: str, source_map: bool = False) -> dict[str, typing.Any]:
+        """Returns the compiled `source`, compiling it with `algod_client` only if it is not cached"""
+
+        result = self.get(source, source_map)
+        if result is None:
+            result = typing.cast(dict[str, typing.Any], AlgodClient.compile(algod_client, source, source_map))
+            self.put(source, result)
+        return result
+
+    async def compile_async(
+        self, algod_client: AsyncAlgodClient, source: str, source_map: bool = False
+    ) -> dict[str, typing.Any]:
+        """Asyncio variant of `compile`"""
+
+        result = self.get(source, source_map)
+        if result is None:
+            result = await algod_client.compile(source, source_map)
+            self.put(source, result)
+        return result
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+class CachingAlgodClient(ControlledAlgodClient):
+    """`AlgodClient` serving `compile` from a `CompileCache`"""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        cache: CompileCache | None = None,
+        controller: TrafficController | None = None,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers, controller=controller)
+        self.cache = cache or CompileCache()
+
+    @classmethod
+    def wrap(
+        cls,
+        algod_client: AlgodClient,
+        cache: CompileCache | None = None,
+        controller: TrafficController | None = None,
+    ) -> "CachingAlgodClient":
+        """Returns a caching client for the same node as `algod_client`
+
+        :param AlgodClient algod_client: Client of the node
+        :param CompileCache cache: (optional) Cache, defaults to one in `DEFAULT_DIRECTORY`
+        :param TrafficController controller: (optional) Limits and retries, defaults to the ones of `algod_client` if
+        it is a `ControlledAlgodClient`"""
+
+        if controller is None and isinstance(algod_client, ControlledAlgodClient):
+            controller = algod_client.controller
+        return cls(
+            algod_client.algod_token,
+            algod_client.algod_address,
+            algod_client.headers,
+            cache=cache,
+            controller=controller,
+        )
+
+    def compile(self, source: str, source_map: bool = False, **kwargs: typing.Any) -> dict[str, typing.Any]:
+        if kwargs:
+            # custom request options, e.g. headers or response_format, are not cached
+            return typing.cast(dict[str, typing.Any], super().compile(source, source_map, **kwargs))
+        return self.cache.compile(self, source, source_map)
@@ -0,0 +1,171 @@
+"""Confirming many submitted groups by following blocks instead of polling each one.
+
+`wait_for_confirmation` polls `transactions/pending/{txid}` every round for each
+group waited on, so thousands of groups in flight cost thousands of requests per
+round. `ConfirmationTracker` runs one loop for all of them: it waits for each new
+round with `status/wait-for-block-after`, reads the round's transaction IDs and,
+only when a tracked one is among them, the block. That is two or three requests
+per round however many groups are pending.
+
+`track` registers a group before it is submitted and returns a future of one
+dict per transaction shaped like algod's pending transaction info
+(`confirmed-round`, `logs`, `inner-txns`, `application-index`), built from the
+block, which is all `AtomicTransactionComposer.parse_result` reads. A group not
+seen by the end of its `last_valid` round can no longer be confirmed, its future
+fails with `ConfirmationTimeoutError`. The loop runs while groups are pending.
+
+Blocks are read msgpack encoded, their JSON encoding does not keep logs as bytes.
+"""
+import asyncio
+import base64
+import dataclasses
+import typing
+
+import msgpack  # type: ignore[import-untyped]
+from algosdk import error
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+
+from staking.algod import AsyncAlgodClient
+from staking.params import SHARED, SuggestedParamsCache
+
+TransactionInfo = dict[str, typing.Any]
+
+
+@dataclasses.dataclass(kw_only=True, eq=False)
+class _Group:
+    tx_ids: list[str]
+    first_valid: int
+    last_valid: int
+    future: asyncio.Future[list[TransactionInfo]]
+    confirmed: dict[str, TransactionInfo] = dataclasses.field(default_factory=dict)
+
+
+def _transaction_info(stxn: dict[bytes, typing.Any], round_num: int | None = None) -> TransactionInfo:
+    apply_data = stxn.get(b"dt", {})
+    info: TransactionInfo = {
+        "pool-error": "",
+        "logs": [base64.b64encode(log).decode() for log in apply_data.get(b"lg", [])],
+        "inner-txns": [_transaction_info(inner) for inner in apply_data.get(b"itx", [])],
+    }
+    if round_num is not None:
+        info["confirmed-round"] = round_num
+    if b"apid" in stxn:
+        info["application-index"] = stxn[b"apid"]
+    if b"caid" in stxn:
+        info["asset-index"] = stxn[b"caid"]
+    return info
+
+
+class ConfirmationTracker:
+    def __init__(self, algod_client: AsyncAlgodClient, *, params_cache: SuggestedParamsCache | None = None) -> None:
+        """
+        One instance should be shared by every client submitting from the process.
+
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param SuggestedParamsCache params_cache: (optional) Cache told about every round checked, defaults to the one
+        shared by the process
+        """
+        self.algod_client = algod_client
+        self.params_cache = params_cache or SHARED
+        # last round checked
+        self.round: int | None = None
+        self._groups: set[_Group] = set()
+        self._pending: dict[str, _Group] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def track(
+        self, tx_ids: typing.Sequence[str], first_valid: int, last_valid: int
+    ) -> asyncio.Future[list[TransactionInfo]]:
+        """Returns a future of the info of every transaction in `tx_ids` once they are in a block
+
+        Call it before the group is submitted, cancel the future if submitting fails.
+
+        :param Sequence[str] tx_ids: IDs of the transactions of one group
+        :param int first_valid: First round the group is valid in
+        :param int last_valid: Last valid round of the group, the future then fails with `ConfirmationTimeoutError`"""
+
+        loop = asyncio.get_running_loop()
+        group = _Group(tx_ids=list(tx_ids), first_valid=first_valid, last_valid=last_valid, future=loop.create_future())
+        self._groups.add(group)
+        for tx_id in group.tx_ids:
+            self._pending[tx_id] = group
+        group.future.add_done_callback(lambda _: self._remove(group))
+        if self._task is None:
+            self._task = loop.create_task(self._run())
+        return group.future
+
+    def track_atc(self, atc: AtomicTransactionComposer) -> asyncio.Future[list[TransactionInfo]]:
+        """`track` for the group of `atc`, in the order of `atc.tx_ids`"""
+
+        txns = [txn.txn for txn in atc.build_group()]
+        return self.track(
+            atc.tx_ids,
+            min(txn.first_valid_round for txn in txns),
+            min(txn.last_valid_round for txn in txns),
+        )
+
+    async def wait(
+        self, tx_ids: typing.Sequence[str], first_valid: int, last_valid: int
+    ) -> list[TransactionInfo]:
+        return await self.track(tx_ids, first_valid, last_valid)
+
+    def _remove(self, group: _Group) -> None:
+        self._groups.discard(group)
+        for tx_id in group.tx_ids:
+            if self._pending.get(tx_id) is group:
+                del self._pending[tx_id]
+
+    def _settle(self, group: _Group, result: list[TransactionInfo] | Exception) -> None:
+        # removed right away, the done callback only runs on the next iteration of the event loop
+        self._remove(group)
+        if group.future.done():
+            return
+        if isinstance(result, Exception):
+            group.future.set_exception(result)
+        else:
+            group.future.set_result(result)
+
+    async def _check(self, round_num: int) -> None:
+        response = await self.algod_client.get_block_txids(round_num)
+        found = [
+            (index, tx_id) for index, tx_id in enumerate(response.get("blockTxids") or []) if tx_id in self._pending
+        ]
+        if found:
+            raw = await self.algod_client.block_info(round_num, response_format="msgpack")
+            payset = msgpack.unpackb(raw, raw=True, strict_map_key=False)[b"block"].get(b"txns", [])
+            for index, tx_id in found:
+                # the group may have been cancelled while the block was read
+                group = self._pending.pop(tx_id, None)
+                if group is None:
+                    continue
+                group.confirmed[tx_id] = _transaction_info(payset[index], round_num)
+                if len(group.confirmed) == len(group.tx_ids):
+                    self._settle(group, [group.confirmed[tx_id] for tx_id in group.tx_ids])
+        for group in [group for group in self._groups if group.last_valid <= round_num]:
+            message = f"Transaction id {group.tx_ids[0]} expired after round {round_num}"
+            self._settle(group, error.ConfirmationTimeoutError(message))
+
+    async def _run(self) -> None:
+        try:
+            last_round = typing.cast(int, (await self.algod_client.status())["last-round"])
+            # a group tracked now is submitted after every round checked before
+            round_num = min(group.first_valid for group in self._groups) if self._groups else last_round + 1
+            if self.round is not None:
+                round_num = max(round_num, self.round + 1)
+            while self._groups:
+                if round_num > last_round:
+                    status = await self.algod_client.status_after_block(round_num - 1)
+                    last_round = typing.cast(int, status["last-round"])
+                    continue
+                await self._check(round_num)
+                self.params_cache.observe_round(self.algod_client, round_num)
+                self.round = round_num
+                round_num += 1
+        except Exception as ex:
+            for group in list(self._groups):
+                self._settle(group, ex)
+        finally:
+            self._task = None
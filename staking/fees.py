@@ -0,0 +1,72 @@
+"""Fees for calls whose inner transactions are paid through fee pooling.
+
+`participate`, `withdraw`, `withdraw_max` and `close` submit at most one inner
+transaction with a fee of 0, the outer app call covers it by paying one extra fee.
+
+Under congestion algod suggests a fee per byte rather than a flat fee, each
+transaction then pays its fee per byte times its estimated signed size, at least
+the minimum fee, and the outer call pools that amount for its inner transactions.
+"""
+import copy
+
+import algokit_utils
+import algosdk
+
+INNER_TRANSACTIONS = {
+    "participate": 1,
+    "withdraw": 1,
+    "withdraw_max": 1,
+    "close": 1,
+}
+
+# signed size in bytes, group ID included, rounded up from the largest app call or inner transaction of a method
+ESTIMATED_SIZE = 350
+ESTIMATED_SIZES = {
+    # three keys in the arguments and in the inner key registration
+    "participate": 450,
+}
+
+
+def transaction_fee(suggested_params: algosdk.transaction.SuggestedParams, estimated_size: int = ESTIMATED_SIZE) -> int:
+    """Returns the fee of one transaction of `estimated_size` bytes under `suggested_params`"""
+
+    min_fee = suggested_params.min_fee or algosdk.constants.MIN_TXN_FEE
+    if suggested_params.flat_fee:
+        return max(suggested_params.fee, min_fee)
+    return max(suggested_params.fee * estimated_size, min_fee)
+
+
+def fee_pooled_params(
+    suggested_params: algosdk.transaction.SuggestedParams,
+    inner_transactions: int = 1,
+    estimated_size: int = ESTIMATED_SIZE,
+) -> algosdk.transaction.SuggestedParams:
+    """Returns a copy of `suggested_params` with a flat fee covering the call and its inner transactions
+
+    :param SuggestedParams suggested_params: Params to derive the fee from
+    :param int inner_transactions: Number of inner transactions the call submits with a fee of 0
+    :param int estimated_size: Estimated signed size in bytes of the call and of each inner transaction"""
+
+    sp = copy.copy(suggested_params)
+    sp.flat_fee = True
+    sp.fee = transaction_fee(suggested_params, estimated_size) * (1 + inner_transactions)
+    return sp
+
+
+def fee_pooled_parameters(
+    method: str,
+    suggested_params: algosdk.transaction.SuggestedParams,
+    transaction_parameters: algokit_utils.TransactionParameters | None = None,
+) -> algokit_utils.TransactionParameters:
+    """Returns `transaction_parameters` for `method` (a key of `INNER_TRANSACTIONS`) paying its inner fees
+
+    :param str method: ABI method name
+    :param SuggestedParams suggested_params: Params to derive the fee from
+    :param algokit_utils.TransactionParameters transaction_parameters: (optional) Parameters to extend
+    :returns algokit_utils.TransactionParameters: Parameters to pass to the client or `Composer`"""
+
+    parameters = copy.copy(transaction_parameters) if transaction_parameters else algokit_utils.TransactionParameters()
+    parameters.suggested_params = fee_pooled_params(
+        suggested_params, INNER_TRANSACTIONS[method], ESTIMATED_SIZES.get(method, ESTIMATED_SIZE)
+    )
+    return parameters
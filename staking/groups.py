@@ -0,0 +1,188 @@
+"""Atomic groups carrying calls for several apps.
+
+`require_payment` checks the payment right before each `fill` call, so up to
+`MAX_PAIRS_PER_GROUP` payment + `fill` pairs, for the same or different apps,
+fit in one 16 transaction group. `participate` pays its key registration through
+fee pooling and needs no payment, a group holds `MAX_GROUP_SIZE` of them.
+
+Groups are composed against an `AsyncAlgodClient`, the only round trip, for
+suggested params when none are given, then goes through its traffic controller
+like the rest of the fleet tooling.
+"""
+import dataclasses
+import typing
+
+import algokit_utils
+import algosdk
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+
+from artifacts.SmartContractStakingClient import APP_SPEC, Composer
+from staking.algod import AsyncAlgodClient
+from staking.fees import fee_pooled_parameters
+from staking.params import SHARED
+
+MAX_GROUP_SIZE = AtomicTransactionComposer.MAX_GROUP_SIZE
+MAX_PAIRS_PER_GROUP = MAX_GROUP_SIZE // 2
+
+_T = typing.TypeVar("_T")
+
+
+@dataclasses.dataclass(kw_only=True)
+class AppCall:
+    app_id: int
+
+
+_TCall = typing.TypeVar("_TCall", bound=AppCall)
+
+
+@dataclasses.dataclass(kw_only=True)
+class FillCall(AppCall):
+    total: int
+    funding: int
+
+
+@dataclasses.dataclass(kw_only=True)
+class ParticipateCall(AppCall):
+    vote_k: bytes | bytearray
+    sel_k: bytes | bytearray
+    vote_fst: int
+    vote_lst: int
+    vote_kd: int
+    sp_key: bytes | bytearray
+
+
+def batched(calls: typing.Iterable[_T], size: int) -> typing.Iterator[list[_T]]:
+    """Splits `calls` into lists that each fit in one group
+
+    :param Iterable calls: Calls to split
+    :param int size: Calls per group, `MAX_PAIRS_PER_GROUP` for fills and `MAX_GROUP_SIZE` for participations"""
+
+    batch: list[_T] = []
+    for call in calls:
+        batch.append(call)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _compose_calls(
+    algod_client: AsyncAlgodClient,
+    calls: typing.Sequence[_TCall],
+    add_call: typing.Callable[[Composer, _TCall], Composer],
+    *,
+    transactions_per_call: int,
+    signer: TransactionSigner | algokit_utils.Account,
+    sender: str | None,
+    suggested_params: algosdk.transaction.SuggestedParams | None,
+    atc: AtomicTransactionComposer | None,
+) -> AtomicTransactionComposer:
+    atc = atc or AtomicTransactionComposer()
+    if atc.get_tx_count() + transactions_per_call * len(calls) > MAX_GROUP_SIZE:
+        raise ValueError(f"{len(calls)} calls do not fit in the group, use batched()")
+    sp = suggested_params or await SHARED.get_async(algod_client)
+    for call in calls:
+        # only builds transactions, it never talks to algod
+        app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=None,
+            app_spec=APP_SPEC,
+            app_id=call.app_id,
+            signer=signer,
+            sender=sender,
+            suggested_params=sp,
+        )
+        add_call(Composer(app_client, atc), call)
+    return atc
+
+
+def _add_fill(composer: Composer, call: FillCall) -> Composer:
+    payment_signer, payment_sender = composer.app_client.resolve_signer_sender()
+    sp = typing.cast(algosdk.transaction.SuggestedParams, composer.app_client.suggested_params)
+    composer.atc.add_transaction(
+        TransactionWithSigner(
+            algosdk.transaction.PaymentTxn(payment_sender, sp, composer.app_client.app_address, call.total),
+            payment_signer,
+        )
+    )
+    return composer.fill(total=call.total, funding=call.funding)
+
+
+def _add_participate(composer: Composer, call: ParticipateCall) -> Composer:
+    sp = typing.cast(algosdk.transaction.SuggestedParams, composer.app_client.suggested_params)
+    return composer.participate(
+        vote_k=call.vote_k,
+        sel_k=call.sel_k,
+        vote_fst=call.vote_fst,
+        vote_lst=call.vote_lst,
+        vote_kd=call.vote_kd,
+        sp_key=call.sp_key,
+        transaction_parameters=fee_pooled_parameters("participate", sp),
+    )
+
+
+async def compose_fills(
+    algod_client: AsyncAlgodClient,
+    fills: typing.Sequence[FillCall],
+    *,
+    signer: TransactionSigner | algokit_utils.Account,
+    sender: str | None = None,
+    suggested_params: algosdk.transaction.SuggestedParams | None = None,
+    atc: AtomicTransactionComposer | None = None,
+) -> AtomicTransactionComposer:
+    """Adds a payment of `total` followed by a `fill` call for every app in `fills` to one group
+
+    :param AsyncAlgodClient algod_client: Shared asyncio algod client
+    :param Sequence[FillCall] fills: At most `MAX_PAIRS_PER_GROUP` fills, see `batched(fills, MAX_PAIRS_PER_GROUP)`
+    :param TransactionSigner | Account signer: Funder signer
+    :param str sender: (optional) Funder address, defaults to the signer's address
+    :param SuggestedParams suggested_params: (optional) Params shared by the whole group, defaults to cached params
+    :param AtomicTransactionComposer atc: (optional) Group to add to
+    :returns AtomicTransactionComposer: The group"""
+
+    return await _compose_calls(
+        algod_client,
+        fills,
+        _add_fill,
+        transactions_per_call=2,
+        signer=signer,
+        sender=sender,
+        suggested_params=suggested_params,
+        atc=atc,
+    )
+
+
+async def compose_participations(
+    algod_client: AsyncAlgodClient,
+    participations: typing.Sequence[ParticipateCall],
+    *,
+    signer: TransactionSigner | algokit_utils.Account,
+    sender: str | None = None,
+    suggested_params: algosdk.transaction.SuggestedParams | None = None,
+    atc: AtomicTransactionComposer | None = None,
+) -> AtomicTransactionComposer:
+    """Adds a fee pooled `participate` call for every app in `participations` to one group
+
+    :param AsyncAlgodClient algod_client: Shared asyncio algod client
+    :param Sequence[ParticipateCall] participations: At most `MAX_GROUP_SIZE` key registrations, see
+    `batched(participations, MAX_GROUP_SIZE)`
+    :param TransactionSigner | Account signer: Owner signer
+    :param str sender: (optional) Owner address, defaults to the signer's address
+    :param SuggestedParams suggested_params: (optional) Params shared by the whole group, defaults to cached params
+    :param AtomicTransactionComposer atc: (optional) Group to add to
+    :returns AtomicTransactionComposer: The group"""
+
+    return await _compose_calls(
+        algod_client,
+        participations,
+        _add_participate,
+        transactions_per_call=1,
+        signer=signer,
+        sender=sender,
+        suggested_params=suggested_params,
+        atc=atc,
+    )
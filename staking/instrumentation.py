@@ -0,0 +1,198 @@
+"""Optional instrumentation of the asyncio client.
+
+An `Instrumentation` given to `AsyncSmartContractStakingClient` records, per
+method of the group (`fill`, `withdraw`, ... joined with `,` for groups of
+several methods, `bare` for calls without one), how long each stage of a call
+takes:
+
+- `params`: awaiting suggested params
+- `encode`: adding the calls to the group with the generated `Composer`, ABI
+  encoding included
+- `sign`: signing and msgpack encoding the group
+- `send`: submitting it, the bytes submitted are counted in `bytes_sent`
+- `confirm`: waiting until it is confirmed
+- `decode`: parsing the ABI return values
+- `simulate`: simulating readonly calls, the opcode budget the group consumed
+  is recorded in `cost`
+
+and counts failed calls by the assert message of the logic error ("must be
+owner", "mab available", ...). Messages are TEAL comments, the pc algod reports
+is mapped to its TEAL line by the source map algod returned when compiling the
+program, see `AsyncSmartContractStakingClient.load_source_map`. A logic error
+without a source map, or failing on a line without a message, is counted as
+`LogicError` rather than under a guessed message.
+
+`prometheus()` renders everything in the Prometheus text exposition format.
+Given an OpenTelemetry tracer, each stage is also a span named `staking.<stage>`
+with the method as attribute, `opentelemetry` is only imported then.
+
+Without an instrumentation, the default, the client takes no timestamps and
+builds no labels, a stage costs one `None` check.
+
+Only the asyncio client and its `AsyncComposer` are instrumented, the tooling in
+`staking.batch`, `staking.scheduler` and `staking.sweep` included. The generated
+`SmartContractStakingClient` and `Composer` build, sign, send and confirm within
+one blocking algokit call (`ApplicationClient.call`,
+`AtomicTransactionComposer.execute`), their stages can not be timed apart
+without reimplementing those calls, which is what the asyncio client does.
+"""
+import bisect
+import contextlib
+import dataclasses
+import time
+import typing
+
+from algokit_utils.logic_error import LogicError
+
+from staking.avm import tokenize
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COST_BUCKETS = (25, 50, 75, 100, 150, 200, 300, 500, 700, 1400, 2800, 5600, 11200)
+
+NO_STAGE = contextlib.nullcontext()
+
+
+@dataclasses.dataclass
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = dataclasses.field(init=False)
+    sum: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        # the last count is the +Inf bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels: str) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip([*histogram.buckets, "+Inf"], histogram.counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(**labels, le=str(bound))} {cumulative}")
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+class Instrumentation:
+    def __init__(
+        self,
+        *,
+        tracer: typing.Any = None,
+        latency_buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        cost_buckets: tuple[float, ...] = COST_BUCKETS,
+        namespace: str = "staking",
+    ) -> None:
+        """
+        :param Tracer tracer: (optional) OpenTelemetry tracer recording a span per stage
+        :param tuple[float, ...] latency_buckets: Upper bounds of the latency histogram buckets in seconds
+        :param tuple[float, ...] cost_buckets: Upper bounds of the opcode cost histogram buckets
+        :param str namespace: Prefix of the Prometheus metric names
+        """
+        self.tracer = tracer
+        self.latency_buckets = latency_buckets
+        self.cost_buckets = cost_buckets
+        self.namespace = namespace
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.cost: dict[str, Histogram] = {}
+        self.bytes_sent: dict[str, int] = {}
+        self.errors: dict[tuple[str, str], int] = {}
+        self._current_span: typing.Callable[[], typing.Any] | None = None
+        if tracer is not None:
+            from opentelemetry import trace
+
+            self._current_span = trace.get_current_span
+
+    @contextlib.contextmanager
+    def stage(self, method: str, stage: str) -> typing.Iterator[None]:
+        """Times the block as `stage` of a call of `method`"""
+
+        span = (
+            self.tracer.start_as_current_span(f"{self.namespace}.{stage}", attributes={"staking.method": method})
+            if self.tracer is not None
+            else NO_STAGE
+        )
+        with span:
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                histogram = self.latency.get((method, stage))
+                if histogram is None:
+                    histogram = self.latency[method, stage] = Histogram(self.latency_buckets)
+                histogram.observe(time.perf_counter() - start)
+
+    def _annotate(self, name: str, value: typing.Any) -> None:
+        if self._current_span is not None:
+            self._current_span().set_attribute(name, value)
+
+    def sent(self, method: str, size: int) -> None:
+        self.bytes_sent[method] = self.bytes_sent.get(method, 0) + size
+        self._annotate("staking.bytes_sent", size)
+
+    def consumed(self, method: str, cost: int) -> None:
+        histogram = self.cost.get(method)
+        if histogram is None:
+            histogram = self.cost[method] = Histogram(self.cost_buckets)
+        histogram.observe(cost)
+        self._annotate("staking.opcode_cost", cost)
+
+    @staticmethod
+    def assert_message(ex: Exception) -> str | None:
+        """Returns the assert message of a logic error, None without a source map or a message on its line"""
+
+        if not isinstance(ex, LogicError) or ex.line_no is None or ex.line_no >= len(ex.lines):
+            return None
+        tokens, comment = tokenize(ex.lines[ex.line_no])
+        return comment if tokens and tokens[0] in ("assert", "err") and comment else None
+
+    def failed(self, method: str, ex: Exception) -> None:
+        message = self.assert_message(ex) or type(ex).__name__
+        self.errors[method, message] = self.errors.get((method, message), 0) + 1
+        self._annotate("staking.error", message)
+
+    def prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format"""
+
+        prefix = self.namespace
+        lines = [
+            f"# HELP {prefix}_stage_seconds Latency of each stage of client calls",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        for (method, stage), histogram in sorted(self.latency.items()):
+            lines += _histogram_lines(f"{prefix}_stage_seconds", histogram, method=method, stage=stage)
+        lines += [
+            f"# HELP {prefix}_opcode_cost Opcode budget consumed by simulated groups",
+            f"# TYPE {prefix}_opcode_cost histogram",
+        ]
+        for method, histogram in sorted(self.cost.items()):
+            lines += _histogram_lines(f"{prefix}_opcode_cost", histogram, method=method)
+        lines += [
+            f"# HELP {prefix}_bytes_sent_total Bytes of signed groups submitted",
+            f"# TYPE {prefix}_bytes_sent_total counter",
+        ]
+        for method, size in sorted(self.bytes_sent.items()):
+            lines.append(f"{prefix}_bytes_sent_total{_labels(method=method)} {size}")
+        lines += [
+            f"# HELP {prefix}_errors_total Failed calls by assert message",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [
+            f"{prefix}_errors_total{_labels(method=method, message=message)} {count}"
+            for (method, message), count in sorted(self.errors.items())
+        ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,224 @@
+"""SmartContractStaking apps on an in-process ledger.
+
+`LocalStakingClient` mirrors the lifecycle methods of the generated client but
+runs the approval program with `staking.avm` on a `Ledger` in memory: no algod,
+no signing and no round trips, so a test or simulation can drive millions of
+calls and move time by setting `ledger.latest_timestamp`.
+
+Calls are built like the generated client builds them, ABI encoded arguments
+with the method selector first, the flat fee covering the inner transactions
+(see `staking.fees`) and `fill` preceded by its payment. A rejected call raises
+`LogicEvalError` with the assert message of the failing instruction and leaves
+the ledger unchanged.
+"""
+import functools
+import typing
+
+from algosdk import abi, encoding
+
+from artifacts.SmartContractStakingClient import APP_SPEC
+from staking.avm import (
+    DELETE_APPLICATION,
+    NO_OP,
+    Ledger,
+    Program,
+    Transaction,
+    TransactionResult,
+    address_bytes,
+    app_call,
+    application_address,
+    load_approval_program,
+    load_clear_program,
+    payment,
+)
+from staking.fees import INNER_TRANSACTIONS
+
+_AddressLike = bytes | str
+
+StatusResult = tuple[str, str, int, int, int, int, int, int]
+
+
+@functools.lru_cache(maxsize=16)
+def _programs(template_values: tuple[tuple[str, int], ...]) -> tuple[Program, Program]:
+    return load_approval_program(dict(template_values)), load_clear_program()
+
+
+@functools.lru_cache(maxsize=None)
+def _method(name: str) -> abi.Method:
+    return APP_SPEC.contract.get_method_by_name(name)
+
+
+def encode_call(method: str, *args: typing.Any) -> list[bytes]:
+    """Returns the app args of an ABI call, the selector followed by each encoded argument"""
+
+    abi_method = _method(method)
+    if len(args) != len(abi_method.args):
+        raise TypeError(f"{method} takes {len(abi_method.args)} arguments, got {len(args)}")
+    return [abi_method.get_selector()] + [
+        typing.cast(abi.ABIType, arg.type).encode(value) for arg, value in zip(abi_method.args, args)
+    ]
+
+
+def decode_return(method: str, result: TransactionResult) -> typing.Any:
+    """Returns the decoded ABI return value of `result`, None for void methods"""
+
+    abi_method = _method(method)
+    if abi_method.returns.type == abi.Returns.VOID:
+        return None
+    raw = result.return_value
+    if raw is None:
+        raise ValueError(f"{method} did not log a return value")
+    return typing.cast(abi.ABIType, abi_method.returns.type).decode(raw)
+
+
+def create_transaction(
+    creator: _AddressLike,
+    template_values: typing.Mapping[str, int],
+    *,
+    fee: int = 1000,
+) -> Transaction:
+    """Returns the bare create call of an app with the contract's programs and schema"""
+
+    approval, clear = _programs(tuple(sorted((key, int(value)) for key, value in template_values.items())))
+    schema = APP_SPEC.global_state_schema
+    return Transaction(
+        type="appl",
+        sender=address_bytes(creator),
+        fee=fee,
+        approval_program=approval,
+        clear_program=clear,
+        global_num_uint=schema.num_uints or 0,
+        global_num_byte_slice=schema.num_byte_slices or 0,
+    )
+
+
+def deploy(
+    ledger: Ledger,
+    creator: _AddressLike,
+    template_values: typing.Mapping[str, int],
+    *,
+    fee: int = 1000,
+) -> int:
+    """Creates an app on `ledger` with its bare create call, returning its app ID
+
+    :param Ledger ledger: Ledger to create the app on
+    :param bytes | str creator: Creator address, must be funded for the fee and the app's minimum balance
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+    :param int fee: Fee of the create call"""
+
+    (result,) = ledger.execute([create_transaction(creator, template_values, fee=fee)])
+    return typing.cast(int, result.app_id)
+
+
+class LocalStakingClient:
+    def __init__(self, ledger: Ledger, app_id: int, *, sender: _AddressLike | None = None) -> None:
+        """
+        :param Ledger ledger: Ledger the app lives on
+        :param int app_id: App to call, see `deploy`
+        :param bytes | str sender: (optional) Default sender of every call
+        """
+        self.ledger = ledger
+        self.app_id = app_id
+        self.sender = sender
+
+    @property
+    def app_address(self) -> str:
+        return typing.cast(str, encoding.encode_address(application_address(self.app_id)))
+
+    def _sender(self, sender: _AddressLike | None) -> bytes:
+        sender = sender if sender is not None else self.sender
+        if sender is None:
+            raise ValueError("no sender given and no default sender set")
+        return address_bytes(sender)
+
+    def call_transaction(
+        self,
+        method: str,
+        *args: typing.Any,
+        sender: _AddressLike | None = None,
+        accounts: typing.Sequence[_AddressLike] = (),
+        on_complete: int = NO_OP,
+    ) -> Transaction:
+        """Returns the app call of ABI method `method`, with the fee for its inner transactions"""
+
+        return app_call(
+            self._sender(sender),
+            self.app_id,
+            encode_call(method, *args),
+            fee=self.ledger.min_fee * (1 + INNER_TRANSACTIONS.get(method, 0)),
+            on_complete=on_complete,
+            accounts=accounts,
+        )
+
+    def call(
+        self,
+        method: str,
+        *args: typing.Any,
+        sender: _AddressLike | None = None,
+        accounts: typing.Sequence[_AddressLike] = (),
+        on_complete: int = NO_OP,
+    ) -> typing.Any:
+        """Executes ABI method `method` in a group of its own, readonly methods are simulated
+
+        :returns: The decoded return value
+        :raises LogicEvalError: If the call is rejected"""
+
+        txn = self.call_transaction(method, *args, sender=sender, accounts=accounts, on_complete=on_complete)
+        readonly = APP_SPEC.hints[_method(method).get_signature()].read_only
+        execute = self.ledger.simulate if readonly else self.ledger.execute
+        (result,) = execute([txn])
+        return decode_return(method, result)
+
+    def setup(self, owner: _AddressLike, *, sender: _AddressLike | None = None) -> None:
+        self.call("setup", _address(owner), sender=sender)
+
+    def configure(self, period: int, *, sender: _AddressLike | None = None) -> None:
+        self.call("configure", period, sender=sender)
+
+    def fill(self, total: int, funding: int, *, sender: _AddressLike | None = None) -> None:
+        """Pays `total` to the app and calls `fill` in one group"""
+
+        funder = self._sender(sender)
+        self.ledger.execute(
+            [
+                payment(funder, application_address(self.app_id), total, fee=self.ledger.min_fee),
+                self.call_transaction("fill", total, funding, sender=funder),
+            ]
+        )
+
+    def participate(
+        self,
+        vote_k: bytes,
+        sel_k: bytes,
+        vote_fst: int,
+        vote_lst: int,
+        vote_kd: int,
+        sp_key: bytes,
+        *,
+        sender: _AddressLike | None = None,
+    ) -> None:
+        self.call("participate", vote_k, sel_k, vote_fst, vote_lst, vote_kd, sp_key, sender=sender)
+
+    def withdraw(self, amount: int, *, sender: _AddressLike | None = None) -> int:
+        return typing.cast(int, self.call("withdraw", amount, sender=sender))
+
+    def withdraw_max(self, *, sender: _AddressLike | None = None) -> int:
+        return typing.cast(int, self.call("withdraw_max", sender=sender))
+
+    def transfer(self, owner: _AddressLike, *, sender: _AddressLike | None = None) -> None:
+        self.call("transfer", _address(owner), sender=sender)
+
+    def close(self, *, sender: _AddressLike | None = None) -> None:
+        """Calls `close` with DeleteApplication, passing the creator so it can be paid"""
+
+        creator = self.ledger.app(self.app_id).creator
+        self.call("close", sender=sender, accounts=[creator], on_complete=DELETE_APPLICATION)
+
+    def status(self, *, sender: _AddressLike | None = None) -> StatusResult:
+        """Returns (owner, funder, period, funding, total, mab, available, step), without changing the ledger"""
+
+        return typing.cast(StatusResult, tuple(self.call("status", sender=sender)))
+
+
+def _address(address: _AddressLike) -> str:
+    return address if isinstance(address, str) else typing.cast(str, encoding.encode_address(address))
@@ -0,0 +1,186 @@
+"""Off-chain minimum allowable balance (MAB).
+
+Mirrors `fill` and `calculate_mab` in contract.py, including where the AVM would
+fail the call: `+` and `*` overflowing uint64 reject the transaction, so the
+batched variants report those rows as not valid instead of wrapping silently.
+
+`fill` stores the vesting boundaries `lockup_end` and `vesting_end` once, the MAB
+is then a function of those boundaries, `total` and `now` only. Apps read from
+the chain already carry the boundaries in their global state, `vesting_boundaries`
+derives them from `funding` and `period` before an app is filled.
+
+Template values use the same keys as the client's `template_values`
+(`VESTING_DELAY`, `LOCKUP_DELAY`, `PERIOD_SECONDS`). `now` is what the contract
+sees as `Global.latest_timestamp`, i.e. the timestamp of the latest block.
+"""
+import typing
+
+import numpy as np
+
+UINT64_MAX = 2**64 - 1
+
+# values of the contract's `step` global, advanced by setup, configure and fill
+STEP_NON_EXISTENT = 0
+STEP_FRESH = 1
+STEP_READY = 2
+STEP_FULL = 3
+
+_U64_MAX = np.uint64(UINT64_MAX)
+
+
+def _template_values(template_values: typing.Mapping[str, int]) -> tuple[int, int, int]:
+    return (
+        int(template_values["VESTING_DELAY"]),
+        int(template_values["LOCKUP_DELAY"]),
+        int(template_values["PERIOD_SECONDS"]),
+    )
+
+
+def _checked(value: int) -> int:
+    if value > UINT64_MAX:
+        raise OverflowError("uint64 overflow")
+    return value
+
+
+def vesting_boundaries(funding: int, period: int, template_values: typing.Mapping[str, int]) -> tuple[int, int]:
+    """Returns the `lockup_end` and `vesting_end` `fill` stores, raising OverflowError where `fill` would fail
+
+    :param int funding: The `funding` argument of `fill`
+    :param int period: The `period` global state value
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix"""
+
+    y, lockup_delay, seconds_in_period = _template_values(template_values)
+    p = _checked(lockup_delay * period)
+    lockup_end = _checked(funding + _checked(p * seconds_in_period))
+    vesting_end = _checked(lockup_end + _checked(y * seconds_in_period))
+    return lockup_end, vesting_end
+
+
+def calculate_mab(
+    lockup_end: int,
+    vesting_end: int,
+    total: int,
+    now: int,
+    template_values: typing.Mapping[str, int],
+) -> int:
+    """Returns the MAB of a single app, raising OverflowError where the contract would fail
+
+    :param int lockup_end: The `lockup_end` global state value
+    :param int vesting_end: The `vesting_end` global state value
+    :param int total: The `total` global state value
+    :param int now: Latest block timestamp
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix"""
+
+    y, _, seconds_in_period = _template_values(template_values)
+    if now < lockup_end:
+        return total
+    if now >= vesting_end:
+        return 0
+    m = (now - lockup_end) // seconds_in_period
+    return _checked(total * (y - m)) // y
+
+
+def next_mab_change(
+    lockup_end: int,
+    vesting_end: int,
+    now: int,
+    template_values: typing.Mapping[str, int],
+) -> int | None:
+    """Returns the first timestamp after `now` at which the MAB may change, None once it is fixed at 0
+
+    The MAB is piecewise constant: `total` until one period past `lockup_end`, then one step down every
+    `PERIOD_SECONDS` until `vesting_end`.
+
+    :param int lockup_end: The `lockup_end` global state value
+    :param int vesting_end: The `vesting_end` global state value
+    :param int now: Latest block timestamp
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix"""
+
+    _, _, seconds_in_period = _template_values(template_values)
+    if now >= vesting_end:
+        return None
+    if lockup_end == vesting_end:
+        # no vesting periods, the MAB drops from total to 0 at once
+        return lockup_end
+    # the first vesting period still has y - 0 periods left, i.e. total
+    m = (now - lockup_end) // seconds_in_period if now >= lockup_end else 0
+    return min(lockup_end + (m + 1) * seconds_in_period, vesting_end)
+
+
+def _add(a: typing.Any, b: typing.Any) -> tuple[np.ndarray, np.ndarray]:
+    return a + b, a <= _U64_MAX - b
+
+
+def _mul(a: typing.Any, b: typing.Any) -> tuple[np.ndarray, np.ndarray]:
+    nonzero = a != 0
+    ok = ~nonzero | (b <= _U64_MAX // np.where(nonzero, a, np.uint64(1)))
+    return a * b, ok
+
+
+def vesting_boundaries_batch(
+    funding: typing.Any,
+    period: typing.Any,
+    template_values: typing.Mapping[str, int],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the `lockup_end` and `vesting_end` of many apps in one vectorized pass
+
+    :param ArrayLike funding: The `funding` arguments of `fill`
+    :param ArrayLike period: The `period` global state values
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+    :returns tuple[ndarray, ndarray, ndarray]: uint64 `lockup_end` and `vesting_end` per app, and a mask that is
+    False where `fill` would fail (both boundaries of those rows are 0)"""
+
+    y, lockup_delay, seconds_in_period = _template_values(template_values)
+    funding, period = np.broadcast_arrays(*(np.asarray(v, dtype=np.uint64) for v in (funding, period)))
+    s = np.uint64(seconds_in_period)
+
+    with np.errstate(over="ignore"):
+        p, ok_p = _mul(np.uint64(lockup_delay), period)
+        lockup_seconds, ok_lockup_seconds = _mul(p, s)
+        lockup_end, ok_lockup_end = _add(funding, lockup_seconds)
+        vest_seconds, ok_vest_seconds = _mul(np.uint64(y), s)
+        vesting_end, ok_vesting_end = _add(lockup_end, vest_seconds)
+        valid = ok_p & ok_lockup_seconds & ok_lockup_end & ok_vest_seconds & ok_vesting_end
+
+    zero = np.uint64(0)
+    return np.where(valid, lockup_end, zero), np.where(valid, vesting_end, zero), valid
+
+
+def calculate_mab_batch(
+    lockup_end: typing.Any,
+    vesting_end: typing.Any,
+    total: typing.Any,
+    now: typing.Any,
+    template_values: typing.Mapping[str, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Computes the MAB of many apps in one vectorized pass
+
+    Inputs are broadcast against each other, so `now` may be a scalar shared by the whole fleet.
+
+    :param ArrayLike lockup_end: The `lockup_end` global state values
+    :param ArrayLike vesting_end: The `vesting_end` global state values
+    :param ArrayLike total: The `total` global state values
+    :param ArrayLike now: Latest block timestamp(s)
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+    :returns tuple[ndarray, ndarray]: uint64 MAB per app, and a mask that is False where the contract would fail
+    (the MAB of those rows is 0)"""
+
+    y_int, _, seconds_in_period = _template_values(template_values)
+    lockup_end, vesting_end, total, now = np.broadcast_arrays(
+        *(np.asarray(v, dtype=np.uint64) for v in (lockup_end, vesting_end, total, now))
+    )
+    y = np.uint64(y_int)
+    s = np.uint64(seconds_in_period)
+
+    with np.errstate(over="ignore"):
+        locked_up = now < lockup_end
+        fully_vested = now >= vesting_end
+        vesting = ~locked_up & ~fully_vested
+        # m < y holds on every vesting row, rows outside it are masked out below
+        m = np.where(vesting, now - lockup_end, np.uint64(0)) // (s or np.uint64(1))
+        scaled, ok_scaled = _mul(total, np.where(vesting, y - m, np.uint64(0)))
+        valid = ~vesting | ok_scaled
+
+    mab = np.where(locked_up, total, np.where(fully_vested, np.uint64(0), scaled // (y or np.uint64(1))))
+    mab = np.where(valid, mab, np.uint64(0)).astype(np.uint64, copy=False)
+    return mab, valid
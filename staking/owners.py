@@ -0,0 +1,64 @@
+"""Owner -> apps reverse index.
+
+`OwnerIndex` answers "which staking apps does this account own" without reading
+any app. It subscribes to a `staking.sync.FleetIndex` and moves an app between
+owners as the index applies `setup` and `transfer`, dropping it on `close`, so
+it is as current as the blocks the fleet index followed. A lookup takes time
+proportional to the number of apps returned.
+
+    fleet = FleetIndex.load("fleet.json")
+    owners = OwnerIndex(fleet)
+    await fleet.sync(algod_client, stop=stop)   # owners follows along
+    owners.apps(address)
+"""
+from staking.sync import ZERO_ADDRESS, FleetIndex, StakingApp
+
+
+class OwnerIndex:
+    def __init__(self, fleet: FleetIndex) -> None:
+        """
+        :param FleetIndex fleet: Index to follow, the apps it holds already are indexed right away
+        """
+        self._apps: dict[str, set[int]] = {}
+        self._owners: dict[int, str] = {}
+        for app in fleet.apps.values():
+            self._update(app)
+        fleet.subscribe(self._on_call)
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def apps(self, owner: str) -> frozenset[int]:
+        """Returns the IDs of the apps `owner` owns"""
+
+        return frozenset(self._apps.get(owner, ()))
+
+    def owner(self, app_id: int) -> str | None:
+        return self._owners.get(app_id)
+
+    def count(self, owner: str) -> int:
+        return len(self._apps.get(owner, ()))
+
+    def _remove(self, app_id: int) -> None:
+        owner = self._owners.pop(app_id, None)
+        if owner is None:
+            return
+        apps = self._apps[owner]
+        apps.discard(app_id)
+        if not apps:
+            del self._apps[owner]
+
+    def _update(self, app: StakingApp) -> None:
+        if self._owners.get(app.app_id) == app.owner:
+            return
+        self._remove(app.app_id)
+        # created apps have no owner until setup
+        if app.owner != ZERO_ADDRESS:
+            self._owners[app.app_id] = app.owner
+            self._apps.setdefault(app.owner, set()).add(app.app_id)
+
+    def _on_call(self, method: str, app: StakingApp, round_num: int) -> None:
+        if method == "close":
+            self._remove(app.app_id)
+        else:
+            self._update(app)
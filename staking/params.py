@@ -0,0 +1,176 @@
+"""Suggested params shared by every client in the process.
+
+Each call without explicit `suggested_params` otherwise fetches
+`/transactions/params`, one round trip per transaction for values that only
+change from one round to the next. `SuggestedParamsCache` keeps the params of
+each node and fetches them again once they are `max_age` seconds old, about one
+round, or once the chain is known to have moved `max_rounds` rounds past the
+round they were fetched in. The round is reported by whatever follows blocks,
+e.g. `staking.confirmations.ConfirmationTracker` calls `observe_round`. Bulk
+operations then fetch params about once per block rather than once per
+transaction, concurrent callers missing the cache share one fetch.
+
+Params served from the cache may be used a few rounds after they were fetched,
+possibly on a node that is behind the one they came from. Their validity window
+therefore starts `lag_rounds` before the fetch round and spans `validity`
+rounds, 1000 being the longest allowed, instead of starting at the fetch round.
+
+`SHARED` is the cache every client uses unless given another one, the
+synchronous `SmartContractStakingClient` uses it through
+`CachedParamsAlgodClient.wrap(algod_client)`, whose requests go through a
+`staking.traffic.TrafficController` like the async ones.
+"""
+import asyncio
+import copy
+import dataclasses
+import threading
+import time
+import typing
+
+from algosdk import transaction
+from algosdk.v2client.algod import AlgodClient
+
+from staking.algod import AsyncAlgodClient, ControlledAlgodClient
+from staking.traffic import TrafficController
+
+
+class _Node(typing.Protocol):
+    @property
+    def algod_address(self) -> str: ...
+
+
+@dataclasses.dataclass(kw_only=True)
+class _Entry:
+    params: transaction.SuggestedParams | None = None
+    # round the params were fetched in, and latest round observed since
+    round: int = 0
+    latest_round: int = 0
+    fetched: float = 0.0
+
+
+class SuggestedParamsCache:
+    def __init__(
+        self, *, max_age: float = 3.0, max_rounds: int = 1, lag_rounds: int = 2, validity: int = 1000
+    ) -> None:
+        """
+        :param float max_age: Seconds params are served for
+        :param int max_rounds: Rounds past the fetch round params are served for, once a later round is observed
+        :param int lag_rounds: Rounds before the fetch round the validity window starts
+        :param int validity: Rounds from the first to the last valid round
+        """
+        self.max_age = max_age
+        self.max_rounds = max_rounds
+        self.lag_rounds = lag_rounds
+        self.validity = validity
+        self._entries: dict[str, _Entry] = {}
+        self._fetching: dict[str, asyncio.Future[transaction.SuggestedParams]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, algod_client: _Node) -> _Entry:
+        return self._entries.setdefault(algod_client.algod_address, _Entry())
+
+    def _fresh(self, entry: _Entry) -> bool:
+        return (
+            entry.params is not None
+            and time.monotonic() - entry.fetched < self.max_age
+            and entry.latest_round < entry.round + self.max_rounds
+        )
+
+    def _store(self, entry: _Entry, params: transaction.SuggestedParams) -> transaction.SuggestedParams:
+        # algod suggests the last round as the first valid round
+        entry.round = params.first
+        entry.latest_round = max(entry.latest_round, params.first)
+        entry.fetched = time.monotonic()
+        params.first = max(1, params.first - self.lag_rounds)
+        params.last = params.first + self.validity
+        entry.params = params
+        return params
+
+    def observe_round(self, algod_client: _Node, round_num: int) -> None:
+        """Reports that the node of `algod_client` reached `round_num`"""
+
+        entry = self._entry(algod_client)
+        entry.latest_round = max(entry.latest_round, round_num)
+
+    def expire(self) -> None:
+        self._entries.clear()
+
+    def get(self, algod_client: AlgodClient) -> transaction.SuggestedParams:
+        """Returns a copy of the params of the node of `algod_client`, fetched if stale"""
+
+        with self._lock:
+            entry = self._entry(algod_client)
+            if not self._fresh(entry):
+                # the base class method, `CachedParamsAlgodClient` overrides it with this one
+                self._store(entry, AlgodClient.suggested_params(algod_client))
+            params = entry.params
+        return copy.copy(typing.cast(transaction.SuggestedParams, params))
+
+    async def _fetch(self, entry: _Entry, algod_client: AsyncAlgodClient) -> transaction.SuggestedParams:
+        try:
+            return self._store(entry, await algod_client.suggested_params())
+        finally:
+            del self._fetching[algod_client.algod_address]
+
+    async def get_async(self, algod_client: AsyncAlgodClient) -> transaction.SuggestedParams:
+        """Asyncio variant of `get`"""
+
+        entry = self._entry(algod_client)
+        if self._fresh(entry):
+            params = typing.cast(transaction.SuggestedParams, entry.params)
+        else:
+            fetching = self._fetching.get(algod_client.algod_address)
+            if fetching is None:
+                fetching = asyncio.ensure_future(self._fetch(entry, algod_client))
+                self._fetching[algod_client.algod_address] = fetching
+            params = await asyncio.shield(fetching)
+        return copy.copy(params)
+
+
+SHARED = SuggestedParamsCache()
+
+
+class CachedParamsAlgodClient(ControlledAlgodClient):
+    """`AlgodClient` serving `suggested_params` from a `SuggestedParamsCache`"""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        cache: SuggestedParamsCache | None = None,
+        controller: TrafficController | None = None,
+    ) -> None:
+        super().__init__(algod_token, algod_address, headers, controller=controller)
+        self.cache = cache or SHARED
+
+    @classmethod
+    def wrap(
+        cls,
+        algod_client: AlgodClient,
+        cache: SuggestedParamsCache | None = None,
+        controller: TrafficController | None = None,
+    ) -> "CachedParamsAlgodClient":
+        """Returns a client for the same node as `algod_client` with cached params
+
+        :param AlgodClient algod_client: Client of the node
+        :param SuggestedParamsCache cache: (optional) Params cache, defaults to the one shared by the process
+        :param TrafficController controller: (optional) Limits and retries, defaults to the ones of `algod_client` if
+        it is a `ControlledAlgodClient`"""
+
+        if controller is None and isinstance(algod_client, ControlledAlgodClient):
+            controller = algod_client.controller
+        return cls(
+            algod_client.algod_token,
+            algod_client.algod_address,
+            algod_client.headers,
+            cache=cache,
+            controller=controller,
+        )
+
+    def suggested_params(self, **kwargs: typing.Any) -> transaction.SuggestedParams:
+        if kwargs:
+            # custom request options are not cached
+            return super().suggested_params(**kwargs)
+        return self.cache.get(self)
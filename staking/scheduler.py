@@ -0,0 +1,215 @@
+"""Withdrawals fired at vesting boundaries instead of by polling every app.
+
+`WithdrawScheduler` keeps a heap of apps keyed by the timestamp at which their
+MAB next drops (`staking.mab.next_mab_change`). Following the chain, it pops the
+apps whose boundary the latest block timestamp has reached, which is when the
+contract's `calculate_mab` returns the lower value, and submits one
+`withdraw_max` per app through a `BatchComposer` per owner, all confirmed by one
+`ConfirmationTracker`. Each popped app is
+pushed back at its following boundary, a fully vested app is dropped after its
+last withdrawal. Work is proportional to blocks followed and boundaries crossed,
+not to the number of apps.
+
+Only apps whose owner has a signer are scheduled, i.e. owners that opted in.
+"""
+import asyncio
+import dataclasses
+import heapq
+import typing
+
+import algokit_utils
+import numpy as np
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from staking.algod import AsyncAlgodClient
+from staking.batch import BatchComposer, BatchResult, Operation
+from staking.confirmations import ConfirmationTracker
+from staking.mab import STEP_FULL, next_mab_change
+from staking.snapshot import GlobalStateSnapshot
+
+
+@dataclasses.dataclass(kw_only=True)
+class _App:
+    owner: str
+    lockup_end: int
+    vesting_end: int
+    when: int
+
+
+class WithdrawScheduler:
+    def __init__(
+        self,
+        algod_client: AsyncAlgodClient,
+        template_values: typing.Mapping[str, int],
+        signers: typing.Mapping[str, TransactionSigner | algokit_utils.Account],
+        *,
+        max_group_fee: int | None = None,
+        concurrency: int = 8,
+        lookahead: int = 30,
+        max_sleep: float = 300.0,
+        confirmations: ConfirmationTracker | None = None,
+    ) -> None:
+        """
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+        :param Mapping[str, TransactionSigner | Account] signers: Signer of every opted in owner, by owner address
+        :param int max_group_fee: (optional) Maximum total fee of one group, see `BatchComposer`
+        :param int concurrency: Maximum number of groups in flight, see `BatchComposer`
+        :param int lookahead: Seconds before the next boundary from which `run` follows every block
+        :param float max_sleep: Longest `run` sleeps without checking the chain
+        :param ConfirmationTracker confirmations: (optional) Tracker confirming the groups of every owner, created for
+        the scheduler if not given
+        """
+        self.algod_client = algod_client
+        self.template_values = template_values
+        self.signers = signers
+        self.max_group_fee = max_group_fee
+        self.concurrency = concurrency
+        self.lookahead = lookahead
+        self.max_sleep = max_sleep
+        self.confirmations = confirmations or ConfirmationTracker(algod_client)
+        self._heap: list[tuple[int, int]] = []
+        self._apps: dict[int, _App] = {}
+        self._composers: dict[str, BatchComposer] = {}
+
+    def __len__(self) -> int:
+        return len(self._apps)
+
+    def __contains__(self, app_id: int) -> bool:
+        return app_id in self._apps
+
+    def schedule(self, app_id: int, *, owner: str, lockup_end: int, vesting_end: int, now: int) -> bool:
+        """Schedules `app_id` at its next MAB drop after `now`, replacing an earlier schedule
+
+        :param int app_id: Full app to schedule
+        :param str owner: The `owner` global state value
+        :param int lockup_end: The `lockup_end` global state value
+        :param int vesting_end: The `vesting_end` global state value
+        :param int now: Latest block timestamp
+        :returns bool: False if the app was not scheduled, its owner did not opt in or it is fully vested"""
+
+        self.remove(app_id)
+        if owner not in self.signers:
+            return False
+        when = next_mab_change(lockup_end, vesting_end, now, self.template_values)
+        if when is None:
+            return False
+        self._apps[app_id] = _App(owner=owner, lockup_end=lockup_end, vesting_end=vesting_end, when=when)
+        heapq.heappush(self._heap, (when, app_id))
+        return True
+
+    def schedule_snapshot(self, snapshot: GlobalStateSnapshot, now: int) -> int:
+        """Schedules every full app of `snapshot` owned by an opted in owner
+
+        :returns int: Number of apps scheduled"""
+
+        scheduled = 0
+        for index in np.flatnonzero(snapshot.exists & (snapshot.step == STEP_FULL)):
+            scheduled += self.schedule(
+                int(snapshot.app_id[index]),
+                owner=snapshot.owner_address(int(index)),
+                lockup_end=int(snapshot.lockup_end[index]),
+                vesting_end=int(snapshot.vesting_end[index]),
+                now=now,
+            )
+        return scheduled
+
+    def remove(self, app_id: int) -> None:
+        """Unschedules `app_id`, e.g. after it was transferred or closed"""
+
+        # the heap entry is skipped when popped
+        self._apps.pop(app_id, None)
+
+    def next_event(self) -> int | None:
+        """Returns the timestamp of the earliest scheduled boundary"""
+
+        while self._heap:
+            when, app_id = self._heap[0]
+            app = self._apps.get(app_id)
+            if app is not None and app.when == when:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    def pop_due(self, now: int) -> dict[str, list[int]]:
+        """Pops the apps whose boundary is at or before `now`, scheduling each at its following boundary
+
+        :param int now: Latest block timestamp
+        :returns dict[str, list[int]]: Due app IDs by owner"""
+
+        due: dict[str, list[int]] = {}
+        while (when := self.next_event()) is not None and when <= now:
+            _, app_id = heapq.heappop(self._heap)
+            app = self._apps[app_id]
+            due.setdefault(app.owner, []).append(app_id)
+            following = next_mab_change(app.lockup_end, app.vesting_end, now, self.template_values)
+            if following is None:
+                del self._apps[app_id]
+            else:
+                app.when = following
+                heapq.heappush(self._heap, (following, app_id))
+        return due
+
+    def _composer(self, owner: str) -> BatchComposer:
+        composer = self._composers.get(owner)
+        if composer is None:
+            composer = BatchComposer(
+                self.algod_client,
+                signer=self.signers[owner],
+                confirmations=self.confirmations,
+                sender=owner,
+                max_group_fee=self.max_group_fee,
+                concurrency=self.concurrency,
+            )
+            self._composers[owner] = composer
+        return composer
+
+    async def fire(self, now: int) -> list[BatchResult]:
+        """Submits `withdraw_max` for every app due at `now`
+
+        A failed withdrawal is not retried, the app is withdrawn from again at its next boundary.
+
+        :param int now: Latest block timestamp
+        :returns list[BatchResult]: Results of every group submitted"""
+
+        due = self.pop_due(now)
+        results = await asyncio.gather(
+            *(
+                self._composer(owner).execute(Operation(app_id=app_id, method="withdraw_max") for app_id in app_ids)
+                for owner, app_ids in due.items()
+            )
+        )
+        return [result for owner_results in results for result in owner_results]
+
+    async def run(
+        self,
+        *,
+        stop: asyncio.Event | None = None,
+        on_results: typing.Callable[[list[BatchResult]], None] | None = None,
+    ) -> None:
+        """Follows the chain, firing withdrawals as boundaries are reached, until `stop` is set
+
+        Blocks are followed one by one within `lookahead` seconds of the next boundary, farther away `run` sleeps.
+
+        :param asyncio.Event stop: (optional) Event ending the loop
+        :param Callable on_results: (optional) Called with the results of every `fire`"""
+
+        stop = stop or asyncio.Event()
+        last_round = typing.cast(int, (await self.algod_client.status())["last-round"])
+        while not stop.is_set():
+            block = await self.algod_client.block_info(last_round)
+            now = typing.cast(int, block["block"]["ts"])
+            if (when := self.next_event()) is not None and when <= now:
+                results = await self.fire(now)
+                if on_results:
+                    on_results(results)
+                when = self.next_event()
+            if when is None or when - now > self.lookahead:
+                delay = self.max_sleep if when is None else min(when - now - self.lookahead, self.max_sleep)
+                try:
+                    await asyncio.wait_for(stop.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                last_round = typing.cast(int, (await self.algod_client.status())["last-round"])
+            else:
+                last_round = typing.cast(int, (await self.algod_client.status_after_block(last_round))["last-round"])
@@ -0,0 +1,81 @@
+"""Signing transaction groups in worker processes.
+
+Signing a group is CPU bound and runs under the GIL: assigning the group ID and
+the transaction IDs msgpack encode and hash every transaction, then each one is
+encoded again and signed with ed25519. A thread executor therefore signs at the
+speed of one core, which caps a large batch long before the network does.
+
+`SigningPool` holds the private keys in its worker processes, loaded once when a
+worker starts, and takes unsigned groups as built by the generated `Composer`.
+A worker assigns the group ID, signs every transaction with the key of its
+sender and returns the transaction IDs with the signed group msgpack encoded,
+ready for `send_raw_transaction`, so the parent only pickles transactions out
+and bytes back. `sign` is awaitable, the event loop keeps submitting and
+confirming earlier groups meanwhile, and signing throughput scales with the
+number of processes.
+
+    with SigningPool([owner]) as pool:
+        tx_ids, blob = await pool.sign([txn.txn for txn in atc.txn_list])
+"""
+import asyncio
+import base64
+import concurrent.futures
+import typing
+
+import algokit_utils
+from algosdk import encoding, transaction
+
+# private key by address, in worker processes
+_keys: dict[str, str] = {}
+
+
+def _load_keys(keys: dict[str, str]) -> None:
+    _keys.update(keys)
+
+
+def _sign_group(txns: list[transaction.Transaction]) -> tuple[list[str], bytes]:
+    if len(txns) > 1:
+        group_id = transaction.calculate_group_id(txns)
+        for txn in txns:
+            txn.group = group_id
+    tx_ids = [txn.get_txid() for txn in txns]
+    blob = b"".join(base64.b64decode(encoding.msgpack_encode(txn.sign(_keys[txn.sender]))) for txn in txns)
+    return tx_ids, blob
+
+
+class SigningPool:
+    def __init__(self, accounts: typing.Iterable[algokit_utils.Account], *, processes: int | None = None) -> None:
+        """
+        :param Iterable[Account] accounts: Accounts signing for themselves, the sender of every transaction signed
+        :param int processes: (optional) Number of worker processes, defaults to the number of CPUs
+        """
+        self.keys = {account.address: account.private_key for account in accounts}
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            processes, initializer=_load_keys, initargs=(self.keys,)
+        )
+
+    def __enter__(self) -> "SigningPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+    async def sign(self, txns: typing.Sequence[transaction.Transaction]) -> tuple[list[str], bytes]:
+        """Returns the transaction IDs of `txns` as one group and the signed group, msgpack encoded
+
+        :param Sequence[Transaction] txns: Transactions of one group without a group ID, e.g. from `atc.txn_list`"""
+
+        for txn in txns:
+            if txn.sender not in self.keys:
+                raise KeyError(f"No key to sign for {txn.sender}")
+        return await asyncio.wrap_future(self.executor.submit(_sign_group, list(txns)))
+
+    async def sign_all(
+        self, groups: typing.Iterable[typing.Sequence[transaction.Transaction]]
+    ) -> list[tuple[list[str], bytes]]:
+        """`sign` for many groups at once, in order"""
+
+        return list(await asyncio.gather(*(self.sign(txns) for txns in groups)))
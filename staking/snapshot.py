@@ -0,0 +1,121 @@
+"""Columnar global state snapshots of many SmartContractStaking apps.
+
+`read_global_states` fetches app IDs with bounded concurrency over a shared
+`AsyncAlgodClient` and writes each decoded key straight into preallocated numpy
+columns, no per app Python objects are kept. Addresses are stored as rows of a
+(n, 32) uint8 matrix.
+"""
+import asyncio
+import base64
+import dataclasses
+import typing
+
+import numpy as np
+from algosdk import encoding, error
+
+from staking.algod import AsyncAlgodClient
+from staking.mab import calculate_mab_batch
+
+_UINT_KEYS = {
+    base64.b64encode(key).decode(): key.decode()
+    for key in (b"period", b"funding", b"total", b"step", b"lockup_end", b"vesting_end")
+}
+_ADDRESS_KEYS = {base64.b64encode(key).decode(): key.decode() for key in (b"funder", b"owner")}
+
+
+@dataclasses.dataclass(kw_only=True)
+class GlobalStateSnapshot:
+    app_id: np.ndarray
+    exists: np.ndarray
+    creator: np.ndarray
+    funder: np.ndarray
+    owner: np.ndarray
+    period: np.ndarray
+    funding: np.ndarray
+    total: np.ndarray
+    step: np.ndarray
+    lockup_end: np.ndarray
+    vesting_end: np.ndarray
+
+    @classmethod
+    def empty(cls, app_ids: np.ndarray) -> "GlobalStateSnapshot":
+        n = len(app_ids)
+        return cls(
+            app_id=app_ids,
+            exists=np.zeros(n, dtype=bool),
+            creator=np.zeros((n, 32), dtype=np.uint8),
+            funder=np.zeros((n, 32), dtype=np.uint8),
+            owner=np.zeros((n, 32), dtype=np.uint8),
+            period=np.zeros(n, dtype=np.uint64),
+            funding=np.zeros(n, dtype=np.uint64),
+            total=np.zeros(n, dtype=np.uint64),
+            step=np.zeros(n, dtype=np.uint64),
+            lockup_end=np.zeros(n, dtype=np.uint64),
+            vesting_end=np.zeros(n, dtype=np.uint64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.app_id)
+
+    def creator_address(self, index: int) -> str:
+        return typing.cast(str, encoding.encode_address(self.creator[index].tobytes()))
+
+    def funder_address(self, index: int) -> str:
+        return typing.cast(str, encoding.encode_address(self.funder[index].tobytes()))
+
+    def owner_address(self, index: int) -> str:
+        return typing.cast(str, encoding.encode_address(self.owner[index].tobytes()))
+
+    def mab(self, now: int, template_values: typing.Mapping[str, int]) -> tuple[np.ndarray, np.ndarray]:
+        """Minimum allowable balance of every app, see `staking.mab.calculate_mab_batch`
+
+        Apps that do not exist report a MAB of 0 and are not valid."""
+
+        mab, valid = calculate_mab_batch(self.lockup_end, self.vesting_end, self.total, now, template_values)
+        return np.where(self.exists, mab, np.uint64(0)), valid & self.exists
+
+    def decode(self, index: int, state: list[dict[str, typing.Any]], creator: str | None = None) -> None:
+        """Writes the `global-state` and `creator` of an algod application response into row `index`"""
+
+        if creator:
+            self.creator[index] = np.frombuffer(encoding.decode_address(creator), dtype=np.uint8)
+        for state_value in state:
+            key = state_value["key"]
+            value = state_value["value"]
+            if key in _UINT_KEYS:
+                getattr(self, _UINT_KEYS[key])[index] = value["uint"]
+            elif key in _ADDRESS_KEYS:
+                row = getattr(self, _ADDRESS_KEYS[key])[index]
+                row[:] = np.frombuffer(base64.b64decode(value["bytes"]), dtype=np.uint8)
+        self.exists[index] = True
+
+
+async def read_global_states(
+    algod_client: AsyncAlgodClient,
+    app_ids: typing.Iterable[int],
+    *,
+    concurrency: int = 64,
+) -> GlobalStateSnapshot:
+    """Fetches the global state of every app in `app_ids` into one columnar snapshot
+
+    :param AsyncAlgodClient algod_client: Shared asyncio algod client
+    :param Iterable[int] app_ids: Apps to read, row order of the snapshot follows it
+    :param int concurrency: Maximum number of requests in flight
+    :returns GlobalStateSnapshot: Snapshot, `exists` is False for apps algod does not know (e.g. deleted)"""
+
+    snapshot = GlobalStateSnapshot.empty(np.fromiter(app_ids, dtype=np.uint64))
+    indexes = iter(range(len(snapshot)))
+
+    async def worker() -> None:
+        for index in indexes:
+            try:
+                info = await algod_client.application_info(int(snapshot.app_id[index]))
+            except error.AlgodHTTPError as ex:
+                if ex.code == 404:
+                    continue
+                raise
+            params = info.get("params", {})
+            snapshot.decode(index, params.get("global-state", []), params.get("creator"))
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(snapshot))))))
+    return snapshot
@@ -0,0 +1,94 @@
+"""Closing fully vested apps in bulk.
+
+An app whose MAB reached 0 keeps its minimum balance locked until the owner
+calls `close` with DeleteApplication. `fully_vested` finds those apps in a
+`GlobalStateSnapshot` with the vectorized MAB, no app is simulated, and `sweep`
+closes them with batched `delete_close` calls, one `BatchComposer` per owner and
+one `ConfirmationTracker` for all of them.
+
+`close` pays the app's creator with the remainder going to the owner, so the
+creator is passed as a foreign account whenever it is not the owner.
+"""
+import asyncio
+import typing
+
+import algokit_utils
+import numpy as np
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from staking.algod import AsyncAlgodClient
+from staking.batch import BatchComposer, BatchResult, Operation
+from staking.confirmations import ConfirmationTracker
+from staking.mab import STEP_FULL
+from staking.snapshot import GlobalStateSnapshot
+
+
+def fully_vested(snapshot: GlobalStateSnapshot, now: int, template_values: typing.Mapping[str, int]) -> np.ndarray:
+    """Returns the row indexes of full apps whose MAB is 0 at `now`
+
+    :param GlobalStateSnapshot snapshot: Apps to check
+    :param int now: Latest block timestamp
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix"""
+
+    mab, valid = snapshot.mab(now, template_values)
+    return np.flatnonzero(valid & (snapshot.step == STEP_FULL) & (mab == 0))
+
+
+def close_operations(snapshot: GlobalStateSnapshot, indexes: typing.Iterable[int]) -> dict[str, list[Operation]]:
+    """Returns a `close` operation for every row in `indexes`, by owner"""
+
+    operations: dict[str, list[Operation]] = {}
+    for index in indexes:
+        owner = snapshot.owner_address(index)
+        creator = snapshot.creator_address(index)
+        operations.setdefault(owner, []).append(
+            Operation(
+                app_id=int(snapshot.app_id[index]),
+                method="close",
+                accounts=[creator] if creator != owner else [],
+            )
+        )
+    return operations
+
+
+async def sweep(
+    algod_client: AsyncAlgodClient,
+    snapshot: GlobalStateSnapshot,
+    now: int,
+    template_values: typing.Mapping[str, int],
+    signers: typing.Mapping[str, TransactionSigner | algokit_utils.Account],
+    *,
+    max_group_fee: int | None = None,
+    concurrency: int = 8,
+    confirmations: ConfirmationTracker | None = None,
+) -> list[BatchResult]:
+    """Closes every fully vested app of `snapshot` whose owner has a signer
+
+    :param AsyncAlgodClient algod_client: Shared asyncio algod client
+    :param GlobalStateSnapshot snapshot: Apps to sweep, see `staking.snapshot.read_global_states`
+    :param int now: Latest block timestamp
+    :param Mapping[str, int] template_values: Deploy-time template values, without the TMPL_ prefix
+    :param Mapping[str, TransactionSigner | Account] signers: Signer by owner address, other owners' apps are skipped
+    :param int max_group_fee: (optional) Maximum total fee of one group, see `BatchComposer`
+    :param int concurrency: Maximum number of groups in flight per owner, see `BatchComposer`
+    :param ConfirmationTracker confirmations: (optional) Tracker confirming the groups of every owner, created for the
+    sweep if not given
+    :returns list[BatchResult]: Results of every group submitted"""
+
+    operations = close_operations(snapshot, fully_vested(snapshot, now, template_values))
+    confirmations = confirmations or ConfirmationTracker(algod_client)
+    results = await asyncio.gather(
+        *(
+            BatchComposer(
+                algod_client,
+                signer=signers[owner],
+                confirmations=confirmations,
+                sender=owner,
+                max_group_fee=max_group_fee,
+                concurrency=concurrency,
+            ).execute(owner_operations)
+            for owner, owner_operations in operations.items()
+            if owner in signers
+        )
+    )
+    return [result for owner_results in results for result in owner_results]
@@ -0,0 +1,258 @@
+"""Local index of every SmartContractStaking app, kept current from new blocks.
+
+`FleetIndex` follows the chain (see `staking.blocks`) and replays the effects of
+each staking app call on an in-memory record per app, the way the contract
+applies them to its global state:
+
+- a bare create with the contract's global schema adds the app at step 0
+- `setup` sets the funder to the sender and the owner, step 1
+- `configure` sets the period, step 2
+- `fill` sets total and funding and derives `lockup_end` / `vesting_end`, step 3
+- `transfer` sets the owner
+- `withdraw` / `withdraw_max` add the amount paid out to `withdrawn`
+- `close` removes the app
+
+Blocks only contain transactions that were applied, so no call is re-checked.
+Calls are told apart by their method selector, apps created before the first
+round followed are only known once seeded from a `GlobalStateSnapshot`. Reads of
+owner, step or any other global state value are then dictionary lookups.
+
+`checkpoint` writes the records and the last round applied atomically to a JSON
+file, `load` resumes from it, so a restart applies only the blocks since.
+"""
+import asyncio
+import dataclasses
+import json
+import os
+import pathlib
+import tempfile
+import typing
+
+from algosdk import abi, encoding
+
+from artifacts.SmartContractStakingClient import APP_SPEC
+from staking.algod import AsyncAlgodClient
+from staking.blocks import app_args, follow_blocks, transactions
+from staking.mab import STEP_FRESH, STEP_FULL, STEP_NON_EXISTENT, STEP_READY, calculate_mab, vesting_boundaries
+from staking.snapshot import GlobalStateSnapshot
+
+ZERO_ADDRESS = encoding.encode_address(bytes(32))
+
+_METHODS = {method.get_selector(): method for method in APP_SPEC.contract.methods}
+
+
+@dataclasses.dataclass(kw_only=True)
+class StakingApp:
+    app_id: int
+    creator: str
+    owner: str = ZERO_ADDRESS
+    funder: str = ZERO_ADDRESS
+    period: int = 0
+    funding: int = 0
+    total: int = 0
+    step: int = STEP_NON_EXISTENT
+    lockup_end: int = 0
+    vesting_end: int = 0
+    withdrawn: int = 0
+    updated_round: int = 0
+
+
+# called with the method name, the app after the call and the round, `close` passes the removed app
+Listener = typing.Callable[[str, StakingApp, int], None]
+
+
+class FleetIndex:
+    def __init__(
+        self,
+        template_values: typing.Mapping[str, int],
+        *,
+        creators: typing.Collection[str] | None = None,
+    ) -> None:
+        """
+        :param Mapping[str, int] template_values: Deploy-time template values of the fleet, without the TMPL_ prefix
+        :param Collection[str] creators: (optional) Only index apps created by these accounts
+        """
+        self.template_values = template_values
+        self.creators = set(creators) if creators is not None else None
+        self.round: int | None = None
+        self.apps: dict[int, StakingApp] = {}
+        self._listeners: list[Listener] = []
+        schema = APP_SPEC.global_state_schema
+        self._schema = {"nui": schema.num_uints or 0, "nbs": schema.num_byte_slices or 0}
+
+    def __len__(self) -> int:
+        return len(self.apps)
+
+    def __contains__(self, app_id: int) -> bool:
+        return app_id in self.apps
+
+    def get(self, app_id: int) -> StakingApp | None:
+        return self.apps.get(app_id)
+
+    def mab(self, app_id: int, now: int) -> int:
+        """Returns the MAB of a full app at `now`, see `staking.mab.calculate_mab`"""
+
+        app = self.apps[app_id]
+        return calculate_mab(app.lockup_end, app.vesting_end, app.total, now, self.template_values)
+
+    def subscribe(self, listener: Listener) -> None:
+        """Calls `listener` after every call applied to an indexed app, and after a create with method `create`"""
+
+        self._listeners.append(listener)
+
+    def _notify(self, method: str, app: StakingApp, round_num: int) -> None:
+        for listener in self._listeners:
+            listener(method, app, round_num)
+
+    def seed(self, snapshot: GlobalStateSnapshot, round_num: int) -> None:
+        """Adds the existing apps of a snapshot read at `round_num`
+
+        Apps indexed already keep their record, blocks from the following round on are applied by `sync`."""
+
+        for index in range(len(snapshot)):
+            app_id = int(snapshot.app_id[index])
+            if not snapshot.exists[index] or app_id in self.apps:
+                continue
+            creator = snapshot.creator_address(index)
+            if self.creators is not None and creator not in self.creators:
+                continue
+            app = StakingApp(
+                app_id=app_id,
+                creator=creator,
+                owner=snapshot.owner_address(index),
+                funder=snapshot.funder_address(index),
+                period=int(snapshot.period[index]),
+                funding=int(snapshot.funding[index]),
+                total=int(snapshot.total[index]),
+                step=int(snapshot.step[index]),
+                lockup_end=int(snapshot.lockup_end[index]),
+                vesting_end=int(snapshot.vesting_end[index]),
+                updated_round=round_num,
+            )
+            self.apps[app_id] = app
+            self._notify("seed", app, round_num)
+        if self.round is None or round_num > self.round:
+            self.round = round_num
+
+    def _create(self, stxn: dict[str, typing.Any], round_num: int) -> None:
+        txn = stxn["txn"]
+        schema = txn.get("apgs", {})
+        if (
+            "apid" not in stxn
+            or txn.get("apaa")
+            or {"nui": schema.get("nui", 0), "nbs": schema.get("nbs", 0)} != self._schema
+            or (self.creators is not None and txn["snd"] not in self.creators)
+        ):
+            return
+        app = StakingApp(app_id=stxn["apid"], creator=txn["snd"], updated_round=round_num)
+        self.apps[app.app_id] = app
+        self._notify("create", app, round_num)
+
+    def _call(self, stxn: dict[str, typing.Any], app: StakingApp, round_num: int) -> None:
+        txn = stxn["txn"]
+        args = app_args(txn)
+        method = _METHODS.get(args[0]) if args else None
+        if method is None:
+            return
+        values = [typing.cast(abi.ABIType, arg.type).decode(value) for arg, value in zip(method.args, args[1:])]
+        match method.name:
+            case "setup":
+                app.funder = txn["snd"]
+                app.owner = values[0]
+                app.step = STEP_FRESH
+            case "configure":
+                app.period = values[0]
+                app.step = STEP_READY
+            case "fill":
+                app.total, app.funding = values
+                app.lockup_end, app.vesting_end = vesting_boundaries(app.funding, app.period, self.template_values)
+                app.step = STEP_FULL
+            case "transfer":
+                app.owner = values[0]
+            case "withdraw" | "withdraw_max":
+                app.withdrawn += sum(inner["txn"].get("amt", 0) for inner in stxn.get("dt", {}).get("itx", []))
+            case "close":
+                del self.apps[app.app_id]
+            case _:
+                return
+        app.updated_round = round_num
+        self._notify(method.name, app, round_num)
+
+    def apply_block(self, round_num: int, block: dict[str, typing.Any]) -> None:
+        """Applies the staking app calls of `block`, ignoring rounds already applied
+
+        :param int round_num: Round of `block`
+        :param dict block: Block in algod's JSON encoding, see `staking.blocks`"""
+
+        if self.round is not None and round_num <= self.round:
+            return
+        for stxn in transactions(block):
+            txn = stxn["txn"]
+            if txn.get("type") != "appl":
+                continue
+            app_id = txn.get("apid")
+            if app_id is None:
+                self._create(stxn, round_num)
+            elif (app := self.apps.get(app_id)) is not None:
+                self._call(stxn, app, round_num)
+        self.round = round_num
+
+    async def sync(
+        self,
+        algod_client: AsyncAlgodClient,
+        *,
+        start_round: int | None = None,
+        until: int | None = None,
+        stop: asyncio.Event | None = None,
+        checkpoint: str | pathlib.Path | None = None,
+        checkpoint_interval: int = 1000,
+    ) -> None:
+        """Applies blocks from the round after the last one applied on
+
+        :param AsyncAlgodClient algod_client: Shared asyncio algod client
+        :param int start_round: (optional) First round when nothing was applied yet, defaults to the latest round
+        :param int until: (optional) Last round to apply, otherwise new blocks are followed until `stop` is set
+        :param asyncio.Event stop: (optional) Event ending the sync
+        :param str | Path checkpoint: (optional) File the index is checkpointed to, also when the sync ends
+        :param int checkpoint_interval: Rounds between checkpoints"""
+
+        if self.round is not None:
+            start_round = self.round + 1
+        elif start_round is None:
+            start_round = typing.cast(int, (await algod_client.status())["last-round"])
+        try:
+            async for round_num, block in follow_blocks(algod_client, start_round, until=until, stop=stop):
+                self.apply_block(round_num, block)
+                if checkpoint is not None and round_num % checkpoint_interval == 0:
+                    self.checkpoint(checkpoint)
+        finally:
+            if checkpoint is not None and self.round is not None:
+                self.checkpoint(checkpoint)
+
+    def checkpoint(self, path: str | pathlib.Path) -> None:
+        """Writes the index to `path` atomically"""
+
+        path = pathlib.Path(path)
+        data = {
+            "round": self.round,
+            "template_values": dict(self.template_values),
+            "apps": [dataclasses.asdict(app) for app in self.apps.values()],
+        }
+        fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(data, file)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path: str | pathlib.Path, *, creators: typing.Collection[str] | None = None) -> "FleetIndex":
+        """Returns the index checkpointed to `path`"""
+
+        data = json.loads(pathlib.Path(path).read_text())
+        index = cls(data["template_values"], creators=creators)
+        index.round = data["round"]
+        index.apps = {app["app_id"]: StakingApp(**app) for app in data["apps"]}
+        return index
@@ -0,0 +1,320 @@
+"""Adaptive concurrency and retries for algod traffic.
+
+Fleet tooling fans out thousands of requests, a fixed concurrency either leaves
+the node idle or pushes it into 429 and 5xx storms. `TrafficController` limits
+requests in flight per endpoint (status, params, applications, simulate, submit,
+...) and adjusts each limit with AIMD:
+
+- a successful response within the endpoint's `latency_target` raises the
+  limit by one over a window of `limit` responses
+- a 429 / 502 / 503 / 504, a timeout, a dropped connection or a response slower
+  than `latency_target` multiplies the limit by `decrease`, at most once per
+  round trip (the moving average of the latency) so the requests in flight when
+  it was cut, which see the same congestion, do not cut it again
+- other failures, e.g. a 404 for a deleted app, leave the limit as is
+
+Each budget also sets the timeout of one request. algod holds
+`/status/wait-for-block-after` open for about a minute when no block comes, so
+the `wait` budget times out well after that and does not count its timeouts as
+congestion, a quiet chain says nothing about load.
+
+Requests over the limit wait for a free slot in order. Failures the endpoint's
+`Budget` retries are retried after a delay drawn uniformly between 0 and
+`base_delay * 2 ** attempt`, capped at `max_delay` (full jitter), so retries of
+requests that failed together spread out. Submits are only retried when the
+node refused them outright, resending after a timeout could submit twice.
+
+Every `AsyncAlgodClient` sends through a controller, one per client unless
+given, so all tooling sharing a client shares its limits. The synchronous
+`staking.algod.ControlledAlgodClient` sends through `call_sync`, whose limits are
+kept apart from the asyncio ones as a thread cannot wait on the event loop.
+"""
+import asyncio
+import collections
+import dataclasses
+import itertools
+import random
+import threading
+import time
+import typing
+import urllib.error
+
+import aiohttp
+from algosdk import error
+
+T = typing.TypeVar("T")
+
+CONGESTION_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Budget:
+    initial: int = 16
+    minimum: int = 1
+    maximum: int = 256
+    # seconds, None for long polls whose latency says nothing about load
+    latency_target: float | None = 1.0
+    decrease: float = 0.5
+    retries: int = 3
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    retry_connection_errors: bool = True
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    # seconds for one request, None for the client's timeout
+    timeout: float | None = None
+    timeouts_congest: bool = True
+
+
+DEFAULT_BUDGETS: dict[str, Budget] = {
+    "default": Budget(),
+    "status": Budget(initial=4, maximum=32),
+    # algod answers a long poll after about 60 seconds without a new block
+    "wait": Budget(initial=16, maximum=64, latency_target=None, timeout=90.0, timeouts_congest=False),
+    "blocks": Budget(initial=8, maximum=64, latency_target=2.0),
+    "params": Budget(initial=4, maximum=32),
+    "applications": Budget(initial=32, maximum=512),
+    "accounts": Budget(initial=32, maximum=512),
+    "pending": Budget(initial=16, maximum=256),
+    "simulate": Budget(initial=16, maximum=128, latency_target=2.0),
+    "submit": Budget(initial=16, maximum=128, retry_statuses=frozenset({429, 503}), retry_connection_errors=False),
+    "compile": Budget(initial=4, maximum=16, latency_target=5.0),
+}
+
+
+def endpoint(path: str) -> str:
+    """Returns the budget name of an algod request path, e.g. `/applications/1234` -> `applications`"""
+
+    match path.strip("/").split("/"):
+        case ["status", "wait-for-block-after", *_]:
+            return "wait"
+        case ["transactions", "params"]:
+            return "params"
+        case ["transactions", "pending", *_]:
+            return "pending"
+        case ["transactions", "simulate"]:
+            return "simulate"
+        case ["transactions"]:
+            return "submit"
+        case ["teal", "compile"]:
+            return "compile"
+        case [name, *_] if name:
+            return name
+    return "default"
+
+
+_TIMEOUTS = (asyncio.TimeoutError, TimeoutError)
+# urllib raises URLError for refused and reset connections of the synchronous client
+_CONNECTION_ERRORS = (aiohttp.ClientConnectionError, ConnectionError, urllib.error.URLError)
+
+
+def _timed_out(ex: BaseException) -> bool:
+    return isinstance(ex, _TIMEOUTS) or (isinstance(ex, urllib.error.URLError) and isinstance(ex.reason, _TIMEOUTS))
+
+
+def _congested(ex: BaseException, budget: Budget) -> bool:
+    if isinstance(ex, error.AlgodHTTPError):
+        return ex.code in CONGESTION_STATUSES
+    if _timed_out(ex):
+        return budget.timeouts_congest
+    return isinstance(ex, _CONNECTION_ERRORS)
+
+
+def _retryable(ex: BaseException, budget: Budget) -> bool:
+    if isinstance(ex, error.AlgodHTTPError):
+        return ex.code in budget.retry_statuses
+    return budget.retry_connection_errors and isinstance(ex, _TIMEOUTS + _CONNECTION_ERRORS)
+
+
+def _backoff(budget: Budget, attempt: int) -> float:
+    return random.uniform(0, min(budget.max_delay, budget.base_delay * 2**attempt))
+
+
+class _AIMD:
+    def __init__(self, budget: Budget) -> None:
+        self.budget = budget
+        self.limit = float(budget.initial)
+        self.in_flight = 0
+        # moving average of the latency of successful requests
+        self.latency: float | None = None
+        self._decreased = 0.0
+
+    def _adjust(self, latency: float | None, congested: bool) -> None:
+        self.in_flight -= 1
+        target = self.budget.latency_target
+        if congested or (latency is not None and target is not None and latency > target):
+            now = time.monotonic()
+            if now - self._decreased >= (self.latency or target or 1.0):
+                self.limit = max(float(self.budget.minimum), self.limit * self.budget.decrease)
+                self._decreased = now
+        elif latency is not None:
+            self.latency = latency if self.latency is None else 0.9 * self.latency + 0.1 * latency
+            self.limit = min(float(self.budget.maximum), self.limit + 1 / self.limit)
+
+
+class AIMDLimiter(_AIMD):
+    def __init__(self, budget: Budget) -> None:
+        super().__init__(budget)
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Waits for a slot, in order"""
+
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # granted a slot, but cancelled before getting to use it
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: float | None, congested: bool) -> None:
+        """Frees a slot and adjusts the limit
+
+        :param float latency: Seconds the request took, None if it failed
+        :param bool congested: If the failure signals an overloaded node, other failures leave the limit as is"""
+
+        self._adjust(latency, congested)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class ThreadLimiter(_AIMD):
+    """`AIMDLimiter` for threads, slots are granted in order"""
+
+    def __init__(self, budget: Budget) -> None:
+        super().__init__(budget)
+        self._condition = threading.Condition()
+        self._waiters: collections.deque[object] = collections.deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def acquire(self) -> None:
+        """Blocks until a slot is free, in order"""
+
+        waiter = object()
+        with self._condition:
+            self._waiters.append(waiter)
+            try:
+                self._condition.wait_for(lambda: self._waiters[0] is waiter and self.in_flight < int(self.limit))
+            finally:
+                self._waiters.remove(waiter)
+                self._condition.notify_all()
+            self.in_flight += 1
+
+    def release(self, latency: float | None, congested: bool) -> None:
+        with self._condition:
+            self._adjust(latency, congested)
+            self._condition.notify_all()
+
+
+class TrafficController:
+    def __init__(self, budgets: typing.Mapping[str, Budget] | None = None) -> None:
+        """
+        :param Mapping[str, Budget] budgets: (optional) Budgets replacing the `DEFAULT_BUDGETS` of the same endpoints,
+        endpoints without one use the `default` budget
+        """
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self._limiters: dict[str, AIMDLimiter] = {}
+        self._thread_limiters: dict[str, ThreadLimiter] = {}
+        self._lock = threading.Lock()
+
+    def budget(self, name: str) -> Budget:
+        return self.budgets.get(name, self.budgets["default"])
+
+    def limiter(self, name: str) -> AIMDLimiter:
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            limiter = self._limiters[name] = AIMDLimiter(self.budget(name))
+        return limiter
+
+    def thread_limiter(self, name: str) -> ThreadLimiter:
+        with self._lock:
+            limiter = self._thread_limiters.get(name)
+            if limiter is None:
+                limiter = self._thread_limiters[name] = ThreadLimiter(self.budget(name))
+        return limiter
+
+    def limits(self) -> dict[str, dict[str, float]]:
+        """Returns the current limit, requests in flight and requests waiting per endpoint used so far"""
+
+        limiters: dict[str, AIMDLimiter | ThreadLimiter] = {
+            **self._limiters,
+            **{f"{name} (sync)": limiter for name, limiter in self._thread_limiters.items()},
+        }
+        return {
+            name: {"limit": limiter.limit, "in_flight": limiter.in_flight, "waiting": limiter.waiting}
+            for name, limiter in limiters.items()
+        }
+
+    async def call(self, name: str, send: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """Awaits `send()` within the limit of endpoint `name`, retrying failures its budget allows
+
+        :param str name: Endpoint, see `endpoint`
+        :param Callable send: Sends the request, called again for each retry"""
+
+        limiter = self.limiter(name)
+        budget = limiter.budget
+        for attempt in itertools.count():
+            await limiter.acquire()
+            start = time.monotonic()
+            try:
+                result = await send()
+            except Exception as ex:
+                # only congestion moves the limit, a 404 of a deleted app says nothing about load
+                limiter.release(None, _congested(ex, budget))
+                if attempt >= budget.retries or not _retryable(ex, budget):
+                    raise
+                await asyncio.sleep(_backoff(budget, attempt))
+                continue
+            except BaseException:
+                limiter.release(None, False)
+                raise
+            limiter.release(time.monotonic() - start, False)
+            return result
+        raise AssertionError("unreachable")
+
+    def call_sync(self, name: str, send: typing.Callable[[], T]) -> T:
+        """Blocking variant of `call` for threads
+
+        :param str name: Endpoint, see `endpoint`
+        :param Callable send: Sends the request, called again for each retry"""
+
+        limiter = self.thread_limiter(name)
+        budget = limiter.budget
+        for attempt in itertools.count():
+            limiter.acquire()
+            start = time.monotonic()
+            try:
+                result = send()
+            except Exception as ex:
+                limiter.release(None, _congested(ex, budget))
+                if attempt >= budget.retries or not _retryable(ex, budget):
+                    raise
+                time.sleep(_backoff(budget, attempt))
+                continue
+            except BaseException:
+                limiter.release(None, False)
+                raise
+            limiter.release(time.monotonic() - start, False)
+            return result
+        raise AssertionError("unreachable")
@@ -0,0 +1,47 @@
+import base64
+import itertools
+import typing
+
+import pytest
+from algosdk import account
+
+from artifacts.SmartContractStakingClient import APP_SPEC
+from staking.local import encode_call
+
+TEMPLATE_VALUES = {"PERIOD_SECONDS": 60, "LOCKUP_DELAY": 12, "VESTING_DELAY": 12}
+
+
+class Blocks:
+    """Builds staking app transactions in algod's JSON block encoding"""
+
+    def __init__(self) -> None:
+        self._app_ids = itertools.count(1001)
+
+    def create(self, creator: str) -> tuple[int, dict[str, typing.Any]]:
+        schema = APP_SPEC.global_state_schema
+        app_id = next(self._app_ids)
+        txn = {"type": "appl", "snd": creator, "apgs": {"nui": schema.num_uints, "nbs": schema.num_byte_slices}}
+        return app_id, {"txn": txn, "apid": app_id}
+
+    def call(
+        self, sender: str, app_id: int, method: str, *args: typing.Any, paid: int | None = None
+    ) -> dict[str, typing.Any]:
+        app_args = [base64.b64encode(arg).decode() for arg in encode_call(method, *args)]
+        stxn: dict[str, typing.Any] = {"txn": {"type": "appl", "snd": sender, "apid": app_id, "apaa": app_args}}
+        if paid is not None:
+            stxn["dt"] = {"itx": [{"txn": {"type": "pay", "amt": paid, "rcv": sender}}]}
+        return stxn
+
+    @staticmethod
+    def block(*stxns: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        return {"txns": list(stxns)}
+
+
+@pytest.fixture
+def blocks() -> Blocks:
+    return Blocks()
+
+
+@pytest.fixture
+def addresses() -> list[str]:
+    return [account.generate_account()[1] for _ in range(4)]
@@ -0,0 +1,108 @@
+import asyncio
+import base64
+import typing
+
+from algosdk import account
+
+from staking.avm import Ledger
+from staking.cache import MabCache
+from staking.local import LocalStakingClient, deploy
+
+TEMPLATE_VALUES = {"PERIOD_SECONDS": 60, "LOCKUP_DELAY": 12, "VESTING_DELAY": 12}
+FUNDING = 1_000
+TOTAL = 1_200_000
+
+
+class LedgerAlgod:
+    """Answers `application_info` from a `Ledger` in the shape algod does, counting reads"""
+
+    def __init__(self, ledger: Ledger) -> None:
+        self.ledger = ledger
+        self.reads = 0
+
+    async def application_info(self, app_id: int) -> dict[str, typing.Any]:
+        self.reads += 1
+        state = []
+        for key, value in self.ledger.app(app_id).global_state.items():
+            encoded = (
+                {"type": 2, "uint": value}
+                if isinstance(value, int)
+                else {"type": 1, "bytes": base64.b64encode(value).decode()}
+            )
+            state.append({"key": base64.b64encode(key).decode(), "value": encoded})
+        return {"id": app_id, "params": {"global-state": state}}
+
+
+def filled_app() -> tuple[LocalStakingClient, str]:
+    ledger = Ledger(latest_timestamp=FUNDING)
+    _, creator = account.generate_account()
+    _, owner = account.generate_account()
+    ledger.fund(creator, 10 * TOTAL)
+    ledger.fund(owner, 10**7)
+    client = LocalStakingClient(ledger, deploy(ledger, creator, TEMPLATE_VALUES), sender=creator)
+    ledger.fund(client.app_address, 10**6)
+    client.setup(owner)
+    client.configure(1, sender=owner)
+    client.fill(TOTAL, FUNDING)
+    return client, owner
+
+
+def test_invalidated_by_withdraw_max_and_transfer() -> None:
+    client, owner = filled_app()
+    _, new_owner = account.generate_account()
+    client.ledger.fund(new_owner, 10**7)
+    algod = LedgerAlgod(client.ledger)
+    cache = MabCache(typing.cast(typing.Any, algod), TEMPLATE_VALUES)
+
+    async def mab() -> int:
+        now = client.ledger.latest_timestamp
+        value = await cache.mab(client.app_id, now)
+        assert value == client.status()[5]
+        return value
+
+    async def run() -> None:
+        assert await mab() == TOTAL
+        assert await mab() == TOTAL
+        assert algod.reads == 1
+
+        # crossing a vesting boundary is answered from the kept values
+        state = client.ledger.app(client.app_id).global_state
+        client.ledger.latest_timestamp = typing.cast(int, state[b"lockup_end"]) + 60
+        assert await mab() == TOTAL * 11 // 12
+        assert algod.reads == 1
+
+        # calls that leave the app as is keep it cached
+        cache.observe(client.app_id, "status")
+        assert client.app_id in cache
+
+        client.withdraw_max(sender=owner)
+        cache.observe(client.app_id, "withdraw_max")
+        assert client.app_id not in cache
+        await mab()
+        assert algod.reads == 2
+
+        client.transfer(new_owner, sender=owner)
+        cache.observe(client.app_id, "transfer")
+        assert client.app_id not in cache
+        await mab()
+        assert algod.reads == 3
+        assert await mab() == client.status()[5]
+        assert algod.reads == 3
+
+    asyncio.run(run())
+
+
+def test_invalidated_during_read() -> None:
+    client, _ = filled_app()
+    algod = LedgerAlgod(client.ledger)
+    cache = MabCache(typing.cast(typing.Any, algod), TEMPLATE_VALUES)
+
+    async def run() -> None:
+        loading = asyncio.ensure_future(cache.mab(client.app_id, FUNDING))
+        await asyncio.sleep(0)
+        # the read may have started before the withdrawal, its result must not be kept
+        cache.observe(client.app_id, "withdraw_max")
+        assert await loading == TOTAL
+        assert client.app_id not in cache
+
+    asyncio.run(run())
@@ -0,0 +1,85 @@
+import copy
+
+import pytest
+from algosdk import account, encoding
+
+from staking.avm import Ledger, LogicEvalError
+from staking.local import LocalStakingClient, deploy
+from staking.mab import STEP_FRESH, STEP_FULL, STEP_READY
+
+TEMPLATE_VALUES = {"PERIOD_SECONDS": 60, "LOCKUP_DELAY": 12, "VESTING_DELAY": 12}
+FUNDING = 1_000
+TOTAL = 1_200_000
+
+
+@pytest.fixture
+def ledger() -> Ledger:
+    return Ledger(latest_timestamp=FUNDING)
+
+
+@pytest.fixture
+def accounts(ledger: Ledger) -> tuple[str, str]:
+    _, creator = account.generate_account()
+    _, owner = account.generate_account()
+    ledger.fund(creator, 10 * TOTAL)
+    ledger.fund(owner, 10**7)
+    return creator, owner
+
+
+def test_lifecycle(ledger: Ledger, accounts: tuple[str, str]) -> None:
+    creator, owner = accounts
+    client = LocalStakingClient(ledger, deploy(ledger, creator, TEMPLATE_VALUES), sender=creator)
+    ledger.fund(client.app_address, 10**6)
+    available = ledger.balance(client.app_address) - ledger.min_balance(client.app_address)
+
+    with pytest.raises(LogicEvalError, match="must be creator"):
+        client.setup(owner, sender=owner)
+    client.setup(owner)
+    assert client.status()[7] == STEP_FRESH
+    with pytest.raises(LogicEvalError, match="must be owner"):
+        client.configure(1)
+    client.configure(1, sender=owner)
+    assert client.status()[7] == STEP_READY
+    client.fill(TOTAL, FUNDING)
+    assert client.status() == (owner, creator, 1, FUNDING, TOTAL, TOTAL, available + TOTAL, STEP_FULL)
+
+    # locked up: nothing above the MAB but the initial funding, the owner pays both fees
+    owner_balance = ledger.balance(owner)
+    assert client.withdraw_max(sender=owner) == available
+    assert ledger.balance(owner) == owner_balance + available - 2 * ledger.min_fee
+
+    state = ledger.app(client.app_id).global_state
+    ledger.latest_timestamp = state[b"lockup_end"] + 60
+    assert client.status()[5] == TOTAL * 11 // 12
+    assert client.withdraw(TOTAL // 12, sender=owner) == TOTAL * 11 // 12
+
+    ledger.latest_timestamp = state[b"vesting_end"]
+    owner_balance = ledger.balance(owner)
+    app_balance = ledger.balance(client.app_address)
+    client.close(sender=owner)
+    assert client.app_id not in ledger.apps
+    assert ledger.balance(client.app_address) == 0
+    assert ledger.balance(owner) == owner_balance + app_balance - 2 * ledger.min_fee
+
+
+def test_rejected_call_leaves_ledger_unchanged(ledger: Ledger, accounts: tuple[str, str]) -> None:
+    creator, owner = accounts
+    client = LocalStakingClient(ledger, deploy(ledger, creator, TEMPLATE_VALUES), sender=creator)
+    ledger.fund(client.app_address, 10**6)
+    client.setup(owner)
+    client.configure(1, sender=owner)
+    client.fill(TOTAL, FUNDING)
+    balances = dict(ledger.balances)
+    state = copy.deepcopy(ledger.app(client.app_id).global_state)
+
+    with pytest.raises(LogicEvalError, match="mab available"):
+        client.withdraw(TOTAL, sender=owner)
+    with pytest.raises(LogicEvalError, match="mab is zero"):
+        client.close(sender=owner)
+    with pytest.raises(LogicEvalError, match="new owner must not be owner"):
+        client.transfer(owner, sender=owner)
+    with pytest.raises(LogicEvalError, match="step must be ready"):
+        client.fill(TOTAL, FUNDING)
+    assert ledger.balances == balances
+    assert ledger.app(client.app_id).global_state == state
+    assert encoding.encode_address(state[b"owner"]) == owner
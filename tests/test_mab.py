@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from algosdk import account
+
+from staking.avm import Ledger, LogicEvalError
+from staking.local import LocalStakingClient, deploy
+from staking.mab import UINT64_MAX, calculate_mab, calculate_mab_batch, vesting_boundaries, vesting_boundaries_batch
+
+TEMPLATE_VALUES = {"PERIOD_SECONDS": 60, "LOCKUP_DELAY": 12, "VESTING_DELAY": 12}
+FUNDING = 1_000
+
+
+def filled_app(total: int, period: int = 1) -> tuple[Ledger, LocalStakingClient]:
+    ledger = Ledger(latest_timestamp=FUNDING)
+    _, creator = account.generate_account()
+    _, owner = account.generate_account()
+    ledger.fund(creator, total + 10**9)
+    ledger.fund(owner, 10**7)
+    client = LocalStakingClient(ledger, deploy(ledger, creator, TEMPLATE_VALUES), sender=creator)
+    ledger.fund(client.app_address, 10**6)
+    client.setup(owner)
+    client.configure(period, sender=owner)
+    client.fill(total, FUNDING)
+    return ledger, client
+
+
+def boundary_timestamps(lockup_end: int, vesting_end: int) -> list[int]:
+    period = TEMPLATE_VALUES["PERIOD_SECONDS"]
+    return sorted(
+        {
+            FUNDING,
+            lockup_end - 1,
+            lockup_end,
+            lockup_end + 1,
+            lockup_end + period - 1,
+            lockup_end + period,
+            (lockup_end + vesting_end) // 2,
+            vesting_end - 1,
+            vesting_end,
+            vesting_end + 1,
+        }
+    )
+
+
+@pytest.mark.parametrize("period", [1, 5])
+@pytest.mark.parametrize("total", [1, 7, 1_000_000, UINT64_MAX // 12])
+def test_batch_matches_scalar_and_contract(total: int, period: int) -> None:
+    ledger, client = filled_app(total, period)
+    state = ledger.app(client.app_id).global_state
+    lockup_end, vesting_end = int(state[b"lockup_end"]), int(state[b"vesting_end"])
+    assert (lockup_end, vesting_end) == vesting_boundaries(FUNDING, period, TEMPLATE_VALUES)
+
+    timestamps = boundary_timestamps(lockup_end, vesting_end)
+    mab, valid = calculate_mab_batch(lockup_end, vesting_end, total, timestamps, TEMPLATE_VALUES)
+    assert valid.all()
+    for now, batch_mab in zip(timestamps, mab.tolist()):
+        ledger.latest_timestamp = now
+        scalar_mab = calculate_mab(lockup_end, vesting_end, total, now, TEMPLATE_VALUES)
+        assert batch_mab == scalar_mab == client.status()[5], now
+
+
+def test_overflow_rejected_everywhere() -> None:
+    total = 2**63
+    ledger, client = filled_app(total)
+    state = ledger.app(client.app_id).global_state
+    lockup_end, vesting_end = int(state[b"lockup_end"]), int(state[b"vesting_end"])
+
+    timestamps = [lockup_end - 1, lockup_end, vesting_end - 1, vesting_end]
+    mab, valid = calculate_mab_batch(lockup_end, vesting_end, total, timestamps, TEMPLATE_VALUES)
+    # total * (y - m) overflows until the last vesting period, where y - m is 1
+    assert valid.tolist() == [True, False, True, True]
+    assert mab.tolist() == [total, 0, total // 12, 0]
+    for now, ok in zip(timestamps, valid.tolist()):
+        ledger.latest_timestamp = now
+        if ok:
+            assert calculate_mab(lockup_end, vesting_end, total, now, TEMPLATE_VALUES) == client.status()[5]
+            continue
+        with pytest.raises(OverflowError):
+            calculate_mab(lockup_end, vesting_end, total, now, TEMPLATE_VALUES)
+        with pytest.raises(LogicEvalError, match="overflow"):
+            client.status()
+
+
+def test_vesting_boundaries_overflow() -> None:
+    funding = np.array([FUNDING, UINT64_MAX - 100, UINT64_MAX], dtype=np.uint64)
+    lockup_end, vesting_end, valid = vesting_boundaries_batch(funding, 1, TEMPLATE_VALUES)
+    assert valid.tolist() == [True, False, False]
+    assert (int(lockup_end[0]), int(vesting_end[0])) == vesting_boundaries(FUNDING, 1, TEMPLATE_VALUES)
+    assert lockup_end[1:].tolist() == vesting_end[1:].tolist() == [0, 0]
+    with pytest.raises(OverflowError):
+        vesting_boundaries(UINT64_MAX - 100, 1, TEMPLATE_VALUES)
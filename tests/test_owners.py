@@ -0,0 +1,63 @@
+from staking.owners import OwnerIndex
+from staking.sync import FleetIndex
+
+from conftest import TEMPLATE_VALUES, Blocks
+
+
+def test_setup_transfer_close(blocks: Blocks, addresses: list[str]) -> None:
+    creator, alice, bob, _ = addresses
+    fleet = FleetIndex(TEMPLATE_VALUES)
+    owners = OwnerIndex(fleet)
+
+    first, create_first = blocks.create(creator)
+    second, create_second = blocks.create(creator)
+    fleet.apply_block(1, blocks.block(create_first, create_second))
+    # no owner until setup
+    assert len(owners) == 0
+
+    fleet.apply_block(
+        2,
+        blocks.block(
+            blocks.call(creator, first, "setup", alice),
+            blocks.call(creator, second, "setup", alice),
+        ),
+    )
+    assert owners.apps(alice) == {first, second}
+    assert owners.owner(first) == alice
+
+    fleet.apply_block(
+        3,
+        blocks.block(
+            blocks.call(alice, first, "configure", 1),
+            blocks.call(creator, first, "fill", 1_000, 1_000),
+            blocks.call(alice, first, "transfer", bob),
+        ),
+    )
+    assert owners.apps(alice) == {second}
+    assert owners.apps(bob) == {first}
+    assert (owners.count(alice), owners.count(bob)) == (1, 1)
+
+    fleet.apply_block(4, blocks.block(blocks.call(bob, first, "close")))
+    assert owners.apps(bob) == frozenset()
+    assert owners.owner(first) is None
+    assert len(owners) == 1
+
+
+def test_indexes_existing_apps(blocks: Blocks, addresses: list[str]) -> None:
+    creator, alice, bob, _ = addresses
+    fleet = FleetIndex(TEMPLATE_VALUES)
+    app_id, create = blocks.create(creator)
+    fleet.apply_block(1, blocks.block(create, blocks.call(creator, app_id, "setup", alice)))
+
+    owners = OwnerIndex(fleet)
+    assert owners.apps(alice) == {app_id}
+    fleet.apply_block(
+        2,
+        blocks.block(
+            blocks.call(alice, app_id, "configure", 1),
+            blocks.call(creator, app_id, "fill", 1_000, 1_000),
+            blocks.call(alice, app_id, "transfer", bob),
+        ),
+    )
+    assert owners.apps(alice) == frozenset()
+    assert owners.apps(bob) == {app_id}
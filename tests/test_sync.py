@@ -0,0 +1,117 @@
+import pathlib
+
+from algosdk import encoding
+
+from staking.avm import Ledger
+from staking.local import LocalStakingClient, deploy
+from staking.mab import STEP_FRESH, STEP_FULL, STEP_NON_EXISTENT, STEP_READY
+from staking.sync import ZERO_ADDRESS, FleetIndex
+
+from conftest import TEMPLATE_VALUES, Blocks
+
+FUNDING = 1_000
+TOTAL = 1_200_000
+
+
+def test_apply_block_follows_lifecycle(blocks: Blocks, addresses: list[str]) -> None:
+    creator, owner, new_owner, _ = addresses
+    fleet = FleetIndex(TEMPLATE_VALUES)
+    calls: list[tuple[str, int, int]] = []
+    fleet.subscribe(lambda method, app, round_num: calls.append((method, app.app_id, round_num)))
+
+    app_id, create = blocks.create(creator)
+    fleet.apply_block(10, blocks.block(create))
+    app = fleet.apps[app_id]
+    assert (app.creator, app.owner, app.step) == (creator, ZERO_ADDRESS, STEP_NON_EXISTENT)
+
+    fleet.apply_block(
+        11,
+        blocks.block(
+            blocks.call(creator, app_id, "setup", owner),
+            blocks.call(owner, app_id, "configure", 2),
+            blocks.call(creator, app_id, "fill", TOTAL, FUNDING),
+        ),
+    )
+    assert (app.funder, app.owner, app.period, app.total, app.funding) == (creator, owner, 2, TOTAL, FUNDING)
+    assert app.step == STEP_FULL
+    assert app.lockup_end == FUNDING + 12 * 2 * 60
+    assert app.vesting_end == app.lockup_end + 12 * 60
+
+    fleet.apply_block(12, blocks.block(blocks.call(owner, app_id, "withdraw_max", paid=500)))
+    # a round applied already is skipped
+    fleet.apply_block(12, blocks.block(blocks.call(owner, app_id, "withdraw_max", paid=500)))
+    fleet.apply_block(13, blocks.block(blocks.call(new_owner, 9999, "transfer", owner)))
+    assert (app.withdrawn, app.updated_round, fleet.round) == (500, 12, 13)
+
+    fleet.apply_block(14, blocks.block(blocks.call(owner, app_id, "transfer", new_owner)))
+    assert app.owner == new_owner
+    fleet.apply_block(15, blocks.block(blocks.call(new_owner, app_id, "close")))
+    assert app_id not in fleet
+    assert calls == [
+        ("create", app_id, 10),
+        ("setup", app_id, 11),
+        ("configure", app_id, 11),
+        ("fill", app_id, 11),
+        ("withdraw_max", app_id, 12),
+        ("transfer", app_id, 14),
+        ("close", app_id, 15),
+    ]
+
+
+def test_matches_contract_state(blocks: Blocks, addresses: list[str]) -> None:
+    creator, owner, new_owner, _ = addresses
+    ledger = Ledger(latest_timestamp=FUNDING)
+    ledger.fund(creator, 10 * TOTAL)
+    ledger.fund(owner, 10**7)
+    client = LocalStakingClient(ledger, deploy(ledger, creator, TEMPLATE_VALUES), sender=creator)
+    client.setup(owner)
+    client.configure(3, sender=owner)
+    client.fill(TOTAL, FUNDING)
+    client.transfer(new_owner, sender=owner)
+
+    fleet = FleetIndex(TEMPLATE_VALUES)
+    app_id, create = blocks.create(creator)
+    assert app_id == client.app_id
+    fleet.apply_block(
+        1,
+        blocks.block(
+            create,
+            blocks.call(creator, app_id, "setup", owner),
+            blocks.call(owner, app_id, "configure", 3),
+            blocks.call(creator, app_id, "fill", TOTAL, FUNDING),
+            blocks.call(owner, app_id, "transfer", new_owner),
+        ),
+    )
+    app = fleet.apps[app_id]
+    state = ledger.app(app_id).global_state
+    for key in ("period", "funding", "total", "step", "lockup_end", "vesting_end"):
+        assert getattr(app, key) == state[key.encode()], key
+    assert app.owner == encoding.encode_address(state[b"owner"])
+    assert app.funder == encoding.encode_address(state[b"funder"])
+    assert fleet.mab(app_id, FUNDING) == client.status()[5]
+
+
+def test_creators_and_checkpoint(blocks: Blocks, addresses: list[str], tmp_path: pathlib.Path) -> None:
+    creator, owner, stranger, _ = addresses
+    fleet = FleetIndex(TEMPLATE_VALUES, creators=[creator])
+    app_id, create = blocks.create(creator)
+    other_id, other = blocks.create(stranger)
+    fleet.apply_block(
+        5,
+        blocks.block(
+            create,
+            other,
+            blocks.call(creator, app_id, "setup", owner),
+            blocks.call(stranger, other_id, "setup", owner),
+        ),
+    )
+    assert app_id in fleet and other_id not in fleet
+    assert fleet.apps[app_id].step == STEP_FRESH
+
+    path = tmp_path / "fleet.json"
+    fleet.checkpoint(path)
+    resumed = FleetIndex.load(path, creators=[creator])
+    assert resumed.round == 5 and resumed.apps == fleet.apps
+    resumed.apply_block(6, blocks.block(blocks.call(owner, app_id, "configure", 1)))
+    assert resumed.apps[app_id].step == STEP_READY
+    assert fleet.apps[app_id].step == STEP_FRESH